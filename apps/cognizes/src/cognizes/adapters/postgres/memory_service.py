@@ -8,8 +8,10 @@ PostgresMemoryService: ADK MemoryService 的 PostgreSQL 实现
 
 from __future__ import annotations
 
-import json
+import asyncio
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 
 from google.adk.memory.base_memory_service import (
     BaseMemoryService,
@@ -20,7 +22,96 @@ from google.adk.memory.base_memory_service import (
 # ADK 官方类型
 from google.adk.sessions import Session
 
-from cognizes.core.database import DatabaseManager
+from cognizes.core.database import DatabaseManager, load_jsonb
+from cognizes.engine.perception.rrf_fusion import SearchResult, rrf_fusion
+
+# 混合检索融合参数: 语义 / BM25 加权 RRF
+RRF_K = 60
+RRF_VECTOR_WEIGHT = 0.70
+RRF_FULLTEXT_WEIGHT = 0.30
+SEARCH_TOP_K = 10
+
+# 向量化请求合并参数: 窗口期内的并发请求合并为一次 provider 调用
+EMBEDDING_BATCH_WINDOW_SECONDS = 0.02
+EMBEDDING_BATCH_MAX_SIZE = 2048  # OpenAI embeddings 单次请求输入上限
+
+EmbeddingFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+class EmbeddingBatcher:
+    """
+    向量化请求合并器
+
+    将窗口期内并发到达的单条文本向量化请求合并为一次批量调用，
+    批量达到上限时立即刷新，以减少 provider 的网络往返次数。
+    同一时刻至多一个刷新任务在执行，批量调用天然串行。
+    """
+
+    def __init__(
+        self,
+        embedding_fn: EmbeddingFn,
+        *,
+        window_seconds: float = EMBEDDING_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+    ):
+        self._embedding_fn = embedding_fn
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: deque[tuple[str, asyncio.Future]] = deque()
+        self._inflight: list[tuple[str, asyncio.Future]] = []
+        self._batch_full = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+
+    async def embed(self, text: str) -> list[float]:
+        """提交单条文本，等待所在批次完成后返回其向量"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._batch_full.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+            self._flush_task.add_done_callback(self._on_flush_done)
+        return await future
+
+    async def _flush(self) -> None:
+        try:
+            await asyncio.wait_for(self._batch_full.wait(), timeout=self._window_seconds)
+        except TimeoutError:
+            pass
+        self._batch_full.clear()
+
+        # 刷新期间新到达的请求直接并入后续批次
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(len(self._pending), self._max_batch_size))]
+            self._inflight = batch
+            try:
+                embeddings = await self._embedding_fn([text for text, _ in batch])
+                if len(embeddings) != len(batch):
+                    raise ValueError(f"embedding_fn returned {len(embeddings)} vectors for {len(batch)} texts")
+            except Exception as e:
+                self._inflight = []
+                _fail_futures(batch, e)
+                continue
+            self._inflight = []
+            for (_, future), embedding in zip(batch, embeddings, strict=True):
+                if not future.done():
+                    future.set_result(embedding)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        # 刷新任务被取消 (含尚未开始执行即被取消): 在途批次与剩余请求一并失败，避免等待方永久挂起
+        if not task.cancelled():
+            return
+        error = RuntimeError("embedding batch flush cancelled")
+        _fail_futures(self._inflight, error)
+        _fail_futures(self._pending, error)
+        self._inflight = []
+        self._pending.clear()
+
+
+def _fail_futures(items: Iterable[tuple[str, asyncio.Future]], error: BaseException) -> None:
+    for _, future in items:
+        if not future.done():
+            future.set_exception(error)
 
 
 class PostgresMemoryService(BaseMemoryService):
@@ -34,10 +125,24 @@ class PostgresMemoryService(BaseMemoryService):
     2. 基于语义相似度检索相关记忆 (复用 Phase 3 hybrid_search)
     """
 
-    def __init__(self, db: DatabaseManager, embedding_fn: callable | None = None, consolidation_worker=None):  # type: ignore[valid-type]
+    def __init__(
+        self,
+        db: DatabaseManager,
+        embedding_fn: EmbeddingFn | None = None,
+        consolidation_worker=None,
+        *,
+        ef_search: int | None = None,
+        embedding_provider: str = "custom",
+        embedding_model: str = "default",
+    ):
         self.db = db
-        self._embedding_fn = embedding_fn  # 向量化函数
+        self._embedding_fn = embedding_fn  # 批量向量化函数: list[str] -> list[list[float]]
+        self._embedding_batcher = EmbeddingBatcher(embedding_fn) if embedding_fn else None
         self._consolidation_worker = consolidation_worker  # Phase 2 Worker
+        self._ef_search = ef_search  # HNSW 查询参数，None 时按表行数自适应
+        # 向量缓存命名空间: 不同 provider/model 的向量互不复用
+        self._embedding_provider = embedding_provider
+        self._embedding_model = embedding_model
 
     async def add_session_to_memory(
         self,
@@ -76,8 +181,8 @@ class PostgresMemoryService(BaseMemoryService):
 
         # 生成向量 (如果有 embedding 函数)
         embedding = None
-        if self._embedding_fn:
-            embedding = await self._embedding_fn(combined_content)  # type: ignore[misc]
+        if self._embedding_batcher:
+            embedding = await self._embed_with_cache(combined_content)
 
         await self.db.memories.insert(
             thread_id=uuid.UUID(session.id) if session.id else None,
@@ -89,6 +194,15 @@ class PostgresMemoryService(BaseMemoryService):
             metadata={"source": "session", "event_count": len(session.events)},
         )
 
+    async def _embed_with_cache(self, content: str) -> list[float]:
+        """优先复用 embedding_cache 中原文或归一化内容相同的向量，未命中再调用模型并回写"""
+        cache = self.db.embedding_cache
+        embedding = await cache.lookup(self._embedding_provider, self._embedding_model, content)
+        if embedding is None:
+            embedding = await self._embedding_batcher.embed(content)  # type: ignore[union-attr]
+            await cache.store(self._embedding_provider, self._embedding_model, content, embedding)
+        return embedding
+
     async def search_memory(
         self,
         *,
@@ -96,35 +210,33 @@ class PostgresMemoryService(BaseMemoryService):
         user_id: str,
         query: str,
     ) -> SearchMemoryResponse:
-        """基于 Query 检索相关记忆"""
+        """
+        基于 Query 检索相关记忆
+
+        有查询向量时并发执行向量检索与 BM25 全文检索，并以加权 RRF 融合；
+        否则仅使用全文检索。
+        """
         # 生成查询向量
         query_embedding = None
-        if self._embedding_fn:
-            query_embedding = await self._embedding_fn(query)  # type: ignore[misc]
+        if self._embedding_batcher:
+            query_embedding = await self._embedding_batcher.embed(query)
 
         if query_embedding:
-            rows = await self.db.memories.search_vector(user_id, app_name, query_embedding)
+            vector_rows, fulltext_rows = await asyncio.gather(
+                self.db.memories.search_vector(
+                    user_id, app_name, query_embedding, limit=SEARCH_TOP_K, ef_search=self._ef_search
+                ),
+                self.db.memories.search_fulltext(user_id, app_name, query, limit=SEARCH_TOP_K),
+            )
+            scored_rows = self._fuse_rows(vector_rows, fulltext_rows)
         else:
             rows = await self.db.memories.search_fulltext(user_id, app_name, query)
+            scored_rows = [(row, row.get("relevance_score", row.get("retention_score"))) for row in rows]
 
         memories = []
-        for row in rows:
+        for row, relevance_score in scored_rows:
             try:
-                # 构造符合 MemoryEntry要求的 content 字典
-                content_val = row["content"]
-                if isinstance(content_val, str):
-                    content_val = {"parts": [{"text": content_val}]}
-
-                memories.append(
-                    MemoryEntry(  # type: ignore[call-arg]
-                        id=str(row["id"]),
-                        content=content_val,
-                        author="system",
-                        timestamp=row["created_at"].isoformat(),
-                        relevance_score=row.get("relevance_score", row.get("retention_score")),
-                        custom_metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                    )
-                )
+                memories.append(self._row_to_memory_entry(row, relevance_score))
             except Exception as e:
                 print(f"MemoryEntry Validation Error: {e}")
                 if hasattr(e, "errors"):
@@ -133,25 +245,54 @@ class PostgresMemoryService(BaseMemoryService):
 
         return SearchMemoryResponse(memories=memories)
 
-    async def list_memories(self, *, app_name: str, user_id: str, limit: int = 100) -> list[MemoryEntry]:
-        """列出用户所有记忆 (扩展方法，非 ADK 基类要求)"""
-        rows = await self.db.memories.list_recent(user_id, app_name, limit)
+    @staticmethod
+    def _fuse_rows(vector_rows: list, fulltext_rows: list) -> list[tuple]:
+        """加权 RRF 融合两路检索结果，返回按融合分数降序的 (row, score) 列表"""
+        rows_by_id = {}
+        result_lists: list[list[SearchResult]] = []
+        for rows in (vector_rows, fulltext_rows):
+            results = []
+            for row in rows:
+                memory_id = str(row["id"])
+                rows_by_id.setdefault(memory_id, row)
+                results.append(SearchResult(id=memory_id, content=row["content"], score=row["relevance_score"]))
+            result_lists.append(results)
 
-        # 复用相同的转换逻辑
-        memories = []
-        for row in rows:
-            content_val = row["content"]
-            if isinstance(content_val, str):
-                content_val = {"parts": [{"text": content_val}]}
-
-            memories.append(
-                MemoryEntry(  # type: ignore[call-arg]
-                    id=str(row["id"]),
-                    content=content_val,
-                    author="system",
-                    timestamp=row["created_at"].isoformat(),
-                    relevance_score=row["retention_score"],
-                    custom_metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                )
-            )
-        return memories
+        fused = rrf_fusion(
+            result_lists,
+            k=RRF_K,
+            limit=SEARCH_TOP_K,
+            weights=[RRF_VECTOR_WEIGHT, RRF_FULLTEXT_WEIGHT],
+        )
+        return [(rows_by_id[result.id], result.score) for result in fused]
+
+    @staticmethod
+    def _row_to_memory_entry(row, relevance_score: float | None) -> MemoryEntry:
+        """将 memories 行转换为 ADK MemoryEntry"""
+        # 构造符合 MemoryEntry 要求的 content 字典
+        content_val = row["content"]
+        if isinstance(content_val, str):
+            content_val = {"parts": [{"text": content_val}]}
+
+        return MemoryEntry(  # type: ignore[call-arg]
+            id=str(row["id"]),
+            content=content_val,
+            author="system",
+            timestamp=row["created_at"].isoformat(),
+            relevance_score=relevance_score,
+            custom_metadata=load_jsonb(row["metadata"]) or {},
+        )
+
+    async def list_memories(self, *, app_name: str, user_id: str, limit: int = 100) -> AsyncIterator[MemoryEntry]:
+        """
+        流式列出用户记忆 (扩展方法，非 ADK 基类要求)
+
+        通过服务端游标逐批拉取，每构造一条 MemoryEntry 即 yield，调用方只消费前几条时无需加载全部行。
+        """
+        async for row in self.db.memories.iter_recent(user_id, app_name, limit):
+            # 复用相同的转换逻辑
+            yield self._row_to_memory_entry(row, row["retention_score"])
+
+    async def list_memories_all(self, *, app_name: str, user_id: str, limit: int = 100) -> list[MemoryEntry]:
+        """列出用户所有记忆并物化为列表"""
+        return [memory async for memory in self.list_memories(app_name=app_name, user_id=user_id, limit=limit)]
@@ -3,10 +3,25 @@ SandboxRunner 抽象基类
 支持多种沙箱后端的统一接口
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
+# execute_safe 预检查拦截的危险代码模式
+DANGER_PATTERNS = (
+    "os.system",
+    "subprocess",
+    "__import__",
+    "eval(",
+    "exec(",
+    "open(",
+    "import socket",
+    "import requests",
+)
+# 所有模式编译为单个交替正则，一次扫描即可定位最早出现的危险模式
+_DANGER_PATTERN_RE = re.compile("|".join(re.escape(pattern) for pattern in DANGER_PATTERNS))
+
 
 class SandboxBackend(Enum):
     """沙箱后端类型"""
@@ -83,25 +98,15 @@ class BaseSandboxRunner(ABC):
 
         在执行前进行静态分析，拦截危险代码模式
         """
-        danger_patterns = [
-            "os.system",
-            "subprocess",
-            "__import__",
-            "eval(",
-            "exec(",
-            "open(",
-            "import socket",
-            "import requests",
-        ]
-        for pattern in danger_patterns:
-            if pattern in code:
-                return SandboxResult(
-                    success=False,
-                    stdout="",
-                    stderr=f"Security violation: '{pattern}' is not allowed",
-                    exit_code=-2,
-                    execution_time_ms=0,
-                )
+        match = _DANGER_PATTERN_RE.search(code)
+        if match:
+            return SandboxResult(
+                success=False,
+                stdout="",
+                stderr=f"Security violation: '{match.group()}' is not allowed",
+                exit_code=-2,
+                execution_time_ms=0,
+            )
         return await self.execute(code)
 
     async def health_check(self) -> bool:
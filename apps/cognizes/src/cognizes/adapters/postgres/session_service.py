@@ -9,12 +9,16 @@ PostgresSessionService: ADK SessionService 的 PostgreSQL 实现
 
 from __future__ import annotations
 
-import json
+import base64
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import asyncpg
+import orjson
 from google.adk.events import Event
 
 # ADK 官方类型
@@ -24,6 +28,198 @@ from google.adk.sessions.base_session_service import (
     GetSessionConfig,
     ListSessionsResponse,
 )
+from google.genai import types
+
+from cognizes.core.database import load_jsonb
+
+# SQL 语句保持为模块级常量：语句文本稳定才能持续命中 asyncpg 的连接级 prepared statement 缓存，
+# 热路径 (append_event) 上无需每次重新 Parse/Plan
+_INSERT_THREAD_SQL = """
+    INSERT INTO threads (id, app_name, user_id, state)
+    VALUES ($1, $2, $3, $4)
+"""
+
+# Thread 与其 Events 一次往返取回：事件在子查询中按 sequence_num 聚合为 JSONB 数组。
+# $4 为最近事件数 (GetSessionConfig.num_recent_events)，NULL 时 LIMIT 不生效即取全部
+_SELECT_THREAD_WITH_EVENTS_SQL = """
+    SELECT t.id, t.app_name, t.user_id, t.state, t.updated_at,
+           COALESCE((
+               SELECT jsonb_agg(e ORDER BY e.sequence_num)
+               FROM (
+                   SELECT id, author, content, actions, sequence_num,
+                          EXTRACT(EPOCH FROM created_at)::float8 AS timestamp
+                   FROM events
+                   WHERE thread_id = t.id
+                   ORDER BY sequence_num DESC
+                   LIMIT $4
+               ) e
+           ), '[]'::jsonb) AS events
+    FROM threads t
+    WHERE t.id = $1 AND t.app_name = $2 AND t.user_id = $3
+"""
+
+_LIST_USER_THREADS_SQL = """
+    SELECT id, app_name, user_id, state, updated_at
+    FROM threads
+    WHERE app_name = $1 AND user_id = $2
+    ORDER BY updated_at DESC
+"""
+
+_LIST_APP_THREADS_SQL = """
+    SELECT id, app_name, user_id, state, updated_at
+    FROM threads
+    WHERE app_name = $1
+    ORDER BY updated_at DESC
+"""
+
+_DELETE_THREAD_SQL = """
+    DELETE FROM threads
+    WHERE id = $1 AND app_name = $2 AND user_id = $3
+"""
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO events
+    (id, thread_id, invocation_id, author, event_type, content, actions)
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+"""
+
+_UPDATE_THREAD_STATE_SQL = """
+    UPDATE threads
+    SET state = state || $1::jsonb, updated_at = NOW()
+    WHERE id = $2
+"""
+
+_UPSERT_USER_STATE_SQL = """
+    INSERT INTO user_states (user_id, app_name, state)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (user_id, app_name)
+    DO UPDATE SET state = user_states.state || $3::jsonb,
+                  updated_at = NOW()
+"""
+
+_UPSERT_APP_STATE_SQL = """
+    INSERT INTO app_states (app_name, state)
+    VALUES ($1, $2)
+    ON CONFLICT (app_name)
+    DO UPDATE SET state = app_states.state || $2::jsonb,
+                  updated_at = NOW()
+"""
+
+# 批量追加：一条语句写入多条 Event 并合并应用三类 state_delta (数据修改 CTE)。
+# 无对应更新时传 NULL，相应 CTE 不产生写入
+_APPEND_EVENTS_SQL = """
+    WITH ev AS (
+        INSERT INTO events (id, thread_id, invocation_id, author, event_type, content, actions)
+        SELECT e.id, $1, e.invocation_id, e.author, 'message', e.content, e.actions
+        FROM unnest($2::uuid[], $3::uuid[], $4::text[], $5::jsonb[], $6::jsonb[])
+            WITH ORDINALITY AS e(id, invocation_id, author, content, actions, ord)
+        ORDER BY e.ord
+    ),
+    ss AS (
+        UPDATE threads
+        SET state = state || $7::jsonb, updated_at = NOW()
+        WHERE id = $1 AND $7::jsonb IS NOT NULL
+    ),
+    us AS (
+        INSERT INTO user_states (user_id, app_name, state)
+        SELECT $8, $9, $10::jsonb
+        WHERE $10::jsonb IS NOT NULL
+        ON CONFLICT (user_id, app_name)
+        DO UPDATE SET state = user_states.state || EXCLUDED.state,
+                      updated_at = NOW()
+    ),
+    aps AS (
+        INSERT INTO app_states (app_name, state)
+        SELECT $9, $11::jsonb
+        WHERE $11::jsonb IS NOT NULL
+        ON CONFLICT (app_name)
+        DO UPDATE SET state = app_states.state || EXCLUDED.state,
+                      updated_at = NOW()
+    )
+    SELECT 1
+"""
+
+# uuid.UUID 接受的字符串长度: 32 位 hex / 标准 36 位 / {} 包裹 38 位 / urn:uuid: 前缀 45 位
+_UUID_STR_LENGTHS = frozenset({32, 36, 38, 45})
+
+
+@lru_cache(maxsize=4096)
+def _session_uuid(session_id: str) -> uuid.UUID:
+    """解析 Session ID 并缓存结果，同一会话的高频事件追加无需重复解析"""
+    return uuid.UUID(session_id)
+
+
+# Content.model_dump() 的输出模板，导入时由 schema 生成一次
+_CONTENT_DUMP_TEMPLATE = types.Content().model_dump()
+_PART_DUMP_TEMPLATE = types.Part().model_dump()
+_TEXT_ONLY_FIELDS = frozenset({"text"})
+
+
+def _dump_content(content: types.Content) -> dict:
+    """
+    Content.model_dump() 的特化版本
+
+    绝大多数事件只包含纯文本 Part，此时直接基于模板拼装字典，跳过逐字段的通用序列化；
+    含其他字段 (function_call、inline_data 等) 时回退到 model_dump()。输出与 model_dump() 一致。
+    """
+    parts = content.parts
+    if parts is None or not all(part.model_fields_set <= _TEXT_ONLY_FIELDS for part in parts):
+        return content.model_dump()
+    return {
+        **_CONTENT_DUMP_TEMPLATE,
+        "parts": [{**_PART_DUMP_TEMPLATE, "text": part.text} for part in parts],
+        "role": content.role,
+    }
+
+
+class _StateSnapshots:
+    """
+    已写入的 user:/app: 状态快照 (有界 LRU)，用于跳过值未变化的 UPSERT
+
+    值以排序键的 orjson bytes 保存，调用方事后原地修改传入的对象不会污染快照。
+    快照只记录经本服务实例的写入：任何绕过本服务写 user_states/app_states 的路径
+    (如 StateManager.set_state → StateRepository，或其他进程/实例) 都不会使快照
+    失效，之后写回快照中的旧值会被误跳过。因此仅在本服务是这两张表唯一写入方时
+    才可启用 (max_entries > 0)。
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, dict[str, bytes]] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def matches(self, key: Hashable, updates: dict[str, Any]) -> bool:
+        """updates 中的每个键值是否都已存在于快照中"""
+        snapshot = self._entries.get(key)
+        if snapshot is None:
+            return False
+        self._entries.move_to_end(key)
+        return all(snapshot.get(k) == _snapshot_value(v) for k, v in updates.items())
+
+    def update(self, key: Hashable, updates: dict[str, Any]) -> None:
+        if self._max_entries <= 0:
+            return
+        snapshot = self._entries.setdefault(key, {})
+        self._entries.move_to_end(key)
+        snapshot.update((k, _snapshot_value(v)) for k, v in updates.items())
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+
+def _snapshot_value(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+def _json_default(obj: Any) -> str:
+    """orjson 无法原生序列化的对象: bytes 转 base64 字符串，其余转为字符串"""
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("utf-8")
+    return str(obj)
 
 
 class PostgresSessionService(BaseSessionService):
@@ -36,11 +232,19 @@ class PostgresSessionService(BaseSessionService):
     1. Session 生命周期管理 (CRUD)
     2. Event 追加与 State 更新
     3. State 前缀路由 (无前缀/user:/app:/temp:)
+
+    连接池要求：
+        每次调用独占一个连接，连接池大小应不小于并发 Agent 调用数；
+        建议通过 DatabaseManager 以 min_pool_size == max_pool_size、max_inactive_connection_lifetime=0
+        创建连接池 (预建连接、空闲连接不回收)，避免冷连接与 prepared statement 被逐出。
     """
 
-    def __init__(self, pool: asyncpg.Pool):
+    def __init__(self, pool: asyncpg.Pool, *, state_snapshot_max_entries: int = 0):
         self._pool = pool
         self._temp_state: dict[str, dict] = {}  # temp: 前缀的内存缓存
+        # 已写入的 user:/app: 状态快照，默认关闭；仅当本服务是唯一写入方时按需开启 (见 _StateSnapshots)
+        self._user_state_cache = _StateSnapshots(state_snapshot_max_entries)
+        self._app_state_cache = _StateSnapshots(state_snapshot_max_entries)
 
     async def create_session(
         self,
@@ -56,14 +260,11 @@ class PostgresSessionService(BaseSessionService):
 
         async with self._pool.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO threads (id, app_name, user_id, state)
-                VALUES ($1, $2, $3, $4)
-                """,
-                uuid.UUID(sid),
+                _INSERT_THREAD_SQL,
+                _session_uuid(sid),
                 app_name,
                 user_id,
-                json.dumps(initial_state),
+                orjson.dumps(initial_state).decode(),
             )
 
         return Session(
@@ -85,104 +286,78 @@ class PostgresSessionService(BaseSessionService):
     ) -> Session | None:
         """获取会话"""
         try:
-            sid = uuid.UUID(session_id)
+            sid = _session_uuid(session_id)
         except ValueError:
             return None
 
+        num_recent_events = config.num_recent_events if config and config.num_recent_events else None
+
         async with self._pool.acquire() as conn:
-            # 获取 Thread
-            row = await conn.fetchrow(
-                """
-                SELECT id, app_name, user_id, state, updated_at
-                FROM threads
-                WHERE id = $1 AND app_name = $2 AND user_id = $3
-                """,
-                sid,
-                app_name,
-                user_id,
-            )
-            if not row:
-                return None
-
-            # 获取 Events
-            events_query = """
-                SELECT id, author, event_type, content, actions, created_at
-                FROM events
-                WHERE thread_id = $1
-                ORDER BY sequence_num ASC
-            """
-
-            # 支持 GetSessionConfig 的过滤
-            if config and config.num_recent_events:
-                events_query = f"""
-                    SELECT * FROM (
-                        SELECT id, author, event_type, content, actions, created_at
-                        FROM events
-                        WHERE thread_id = $1
-                        ORDER BY sequence_num DESC
-                        LIMIT {config.num_recent_events}
-                    ) sub ORDER BY created_at ASC
-                """
-
-            events = await conn.fetch(events_query, uuid.UUID(session_id))
-
-            return Session(
-                id=str(row["id"]),
-                app_name=row["app_name"],
-                user_id=row["user_id"],
-                state=json.loads(row["state"]) if row["state"] else {},
-                events=[self._row_to_event(e) for e in events],
-                last_update_time=row["updated_at"].timestamp(),
-            )
+            row = await conn.fetchrow(_SELECT_THREAD_WITH_EVENTS_SQL, sid, app_name, user_id, num_recent_events)
+        if not row:
+            return None
+
+        return Session(
+            id=str(row["id"]),
+            app_name=row["app_name"],
+            user_id=row["user_id"],
+            state=load_jsonb(row["state"]) or {},
+            events=[self._row_to_event(e) for e in load_jsonb(row["events"])],
+            last_update_time=row["updated_at"].timestamp(),
+        )
 
     async def list_sessions(self, *, app_name: str, user_id: str | None = None) -> ListSessionsResponse:
         """列出所有会话"""
         async with self._pool.acquire() as conn:
             if user_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT id, app_name, user_id, state, updated_at
-                    FROM threads
-                    WHERE app_name = $1 AND user_id = $2
-                    ORDER BY updated_at DESC
-                    """,
+                    _LIST_USER_THREADS_SQL,
                     app_name,
                     user_id,
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT id, app_name, user_id, state, updated_at
-                    FROM threads
-                    WHERE app_name = $1
-                    ORDER BY updated_at DESC
-                    """,
+                    _LIST_APP_THREADS_SQL,
                     app_name,
                 )
 
-        sessions = [
-            Session(
-                id=str(row["id"]),
-                app_name=row["app_name"],
-                user_id=row["user_id"],
-                state=json.loads(row["state"]) if row["state"] else {},
-                events=[],  # 列表不加载 events
-                last_update_time=row["updated_at"].timestamp(),
-            )
-            for row in rows
-        ]
+        return ListSessionsResponse(sessions=[self._row_to_session(row) for row in rows])
 
-        return ListSessionsResponse(sessions=sessions)
+    async def iter_sessions(
+        self, *, app_name: str, user_id: str | None = None, prefetch: int = 100
+    ) -> AsyncIterator[Session]:
+        """
+        流式列出会话 (扩展方法，非 ADK 基类要求)
+
+        通过服务端游标每次拉取 prefetch 行，逐条 yield Session，避免一次性缓冲全部会话。
+        """
+        if user_id:
+            query, args = _LIST_USER_THREADS_SQL, (app_name, user_id)
+        else:
+            query, args = _LIST_APP_THREADS_SQL, (app_name,)
+
+        async with self._pool.acquire() as conn, conn.transaction():
+            async for row in conn.cursor(query, *args, prefetch=prefetch):
+                yield self._row_to_session(row)
+
+    @staticmethod
+    def _row_to_session(row) -> Session:
+        """将 threads 行转换为不含 events 的 Session"""
+        return Session(
+            id=str(row["id"]),
+            app_name=row["app_name"],
+            user_id=row["user_id"],
+            state=load_jsonb(row["state"]) or {},
+            events=[],  # 列表不加载 events
+            last_update_time=row["updated_at"].timestamp(),
+        )
 
     async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
         """删除会话"""
         async with self._pool.acquire() as conn:
             await conn.execute(
-                """
-                DELETE FROM threads
-                WHERE id = $1 AND app_name = $2 AND user_id = $3
-                """,
-                uuid.UUID(session_id),
+                _DELETE_THREAD_SQL,
+                _session_uuid(session_id),
                 app_name,
                 user_id,
             )
@@ -200,35 +375,125 @@ class PostgresSessionService(BaseSessionService):
         event_id = self._ensure_uuid(event.id)
         invocation_id = self._ensure_uuid(event.invocation_id)
 
-        async with self._pool.acquire() as conn:
-            async with conn.transaction():
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
                 # 1. 插入 Event
                 await conn.execute(
-                    """
-                    INSERT INTO events
-                    (id, thread_id, invocation_id, author, event_type, content, actions)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    """,
+                    _INSERT_EVENT_SQL,
                     event_id,
-                    uuid.UUID(session.id),
+                    _session_uuid(session.id),
                     invocation_id,
                     event.author,
                     "message",
-                    json.dumps(self._serialize_content(event.content)),
-                    json.dumps(event.actions.model_dump() if event.actions else {}),
+                    self._serialize_content(event.content),
+                    orjson.dumps(event.actions.model_dump() if event.actions else {}).decode(),
                 )
 
                 # 2. 应用 state_delta 到数据库
                 if event.actions and event.actions.state_delta:
                     await self._apply_state_delta_to_db(conn, session, event.actions.state_delta)
+        except Exception:
+            # 事务回滚后快照可能领先于数据库，丢弃以免误跳过后续写入
+            self._user_state_cache.discard((session.user_id, session.app_name))
+            self._app_state_cache.discard(session.app_name)
+            raise
 
         event.id = event_id  # type: ignore[assignment]
         return event
 
+    async def append_events(self, session: Session, events: list[Event]) -> list[Event]:
+        """
+        批量追加事件并应用 state_delta (扩展方法，非 ADK 基类要求)
+
+        所有 Event 与合并后的 state_delta 通过一条语句在一次往返内写入，
+        适用于一次调用产生多条事件 (tool call -> tool response -> model reply) 的场景。
+        """
+        if not events:
+            return []
+
+        appended = [await super(PostgresSessionService, self).append_event(session, event) for event in events]
+
+        # 按事件顺序合并 state_delta，后写覆盖先写
+        merged_delta: dict[str, Any] = {}
+        for event in appended:
+            if event.actions and event.actions.state_delta:
+                merged_delta.update(event.actions.state_delta)
+        session_updates, user_updates, app_updates = self._split_state_delta(merged_delta)
+
+        user_key = (session.user_id, session.app_name)
+        if self._user_state_cache.matches(user_key, user_updates):
+            user_updates = {}
+        if self._app_state_cache.matches(session.app_name, app_updates):
+            app_updates = {}
+
+        event_ids = [self._ensure_uuid(event.id) for event in appended]
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    _APPEND_EVENTS_SQL,
+                    _session_uuid(session.id),
+                    event_ids,
+                    [self._ensure_uuid(event.invocation_id) for event in appended],
+                    [event.author for event in appended],
+                    [self._serialize_content(event.content) for event in appended],
+                    [orjson.dumps(event.actions.model_dump() if event.actions else {}).decode() for event in appended],
+                    orjson.dumps(session_updates).decode() if session_updates else None,
+                    session.user_id,
+                    session.app_name,
+                    orjson.dumps(user_updates).decode() if user_updates else None,
+                    orjson.dumps(app_updates).decode() if app_updates else None,
+                )
+        except Exception:
+            self._user_state_cache.discard(user_key)
+            self._app_state_cache.discard(session.app_name)
+            raise
+
+        if user_updates:
+            self._user_state_cache.update(user_key, user_updates)
+        if app_updates:
+            self._app_state_cache.update(session.app_name, app_updates)
+
+        for event, event_id in zip(appended, event_ids, strict=True):
+            event.id = event_id  # type: ignore[assignment]
+        return appended
+
     async def _apply_state_delta_to_db(
         self, conn: asyncpg.Connection, session: Session, state_delta: dict[str, Any]
     ) -> None:
         """应用 state_delta，根据前缀路由到不同存储"""
+        session_updates, user_updates, app_updates = self._split_state_delta(state_delta)
+
+        # 更新 Session State
+        if session_updates:
+            await conn.execute(
+                _UPDATE_THREAD_STATE_SQL,
+                orjson.dumps(session_updates).decode(),
+                _session_uuid(session.id),
+            )
+
+        # 更新 User State (与快照一致时跳过，避免无效写入与 WAL)
+        user_key = (session.user_id, session.app_name)
+        if user_updates and not self._user_state_cache.matches(user_key, user_updates):
+            await conn.execute(
+                _UPSERT_USER_STATE_SQL,
+                session.user_id,
+                session.app_name,
+                orjson.dumps(user_updates).decode(),
+            )
+            self._user_state_cache.update(user_key, user_updates)
+
+        # 更新 App State
+        if app_updates and not self._app_state_cache.matches(session.app_name, app_updates):
+            await conn.execute(
+                _UPSERT_APP_STATE_SQL,
+                session.app_name,
+                orjson.dumps(app_updates).decode(),
+            )
+            self._app_state_cache.update(session.app_name, app_updates)
+
+    @staticmethod
+    def _split_state_delta(state_delta: dict[str, Any]) -> tuple[dict, dict, dict]:
+        """按前缀拆分 state_delta 为 (session, user, app) 三类更新"""
         session_updates = {}
         user_updates = {}
         app_updates = {}
@@ -249,65 +514,25 @@ class PostgresSessionService(BaseSessionService):
                 # 无前缀 -> threads.state
                 session_updates[key] = value
 
-        # 更新 Session State
-        if session_updates:
-            await conn.execute(
-                """
-                UPDATE threads
-                SET state = state || $1::jsonb, updated_at = NOW()
-                WHERE id = $2
-                """,
-                json.dumps(session_updates),
-                uuid.UUID(session.id),
-            )
-
-        # 更新 User State
-        if user_updates:
-            await conn.execute(
-                """
-                INSERT INTO user_states (user_id, app_name, state)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (user_id, app_name)
-                DO UPDATE SET state = user_states.state || $3::jsonb,
-                              updated_at = NOW()
-                """,
-                session.user_id,
-                session.app_name,
-                json.dumps(user_updates),
-            )
-
-        # 更新 App State
-        if app_updates:
-            await conn.execute(
-                """
-                INSERT INTO app_states (app_name, state)
-                VALUES ($1, $2)
-                ON CONFLICT (app_name)
-                DO UPDATE SET state = app_states.state || $2::jsonb,
-                              updated_at = NOW()
-                """,
-                session.app_name,
-                json.dumps(app_updates),
-            )
+        return session_updates, user_updates, app_updates
 
-    def _row_to_event(self, row) -> Event:
-        """将数据库行转换为 ADK Event 对象"""
-        from google.genai import types
-
-        content_dict = json.loads(row["content"]) if row["content"] else {}
-        json.loads(row["actions"]) if row["actions"] else {}
+    def _row_to_event(self, row: dict) -> Event:
+        """将 get_session 聚合出的事件 JSON 对象转换为 ADK Event 对象"""
+        content_dict = row["content"] or {}
 
         # 从存储的字典重建 Content 对象
+        # 数据由 append_event 序列化写入、结构已知合法，使用 model_construct 跳过 Pydantic 校验
         content = None
         if content_dict:
-            parts = []
-            for part_data in content_dict.get("parts", []):
-                if isinstance(part_data, dict) and "text" in part_data:
-                    parts.append(types.Part(text=part_data["text"]))
+            parts = [
+                types.Part.model_construct(text=part_data["text"])
+                for part_data in content_dict.get("parts") or []
+                if isinstance(part_data, dict) and "text" in part_data
+            ]
             if parts:
-                content = types.Content(role=content_dict.get("role", "user"), parts=parts)
+                content = types.Content.model_construct(role=content_dict.get("role", "user"), parts=parts)
 
-        return Event(id=str(row["id"]), author=row["author"], content=content, timestamp=row["created_at"].timestamp())
+        return Event(id=str(row["id"]), author=row["author"], content=content, timestamp=row["timestamp"])
 
     def _ensure_uuid(self, value: Any) -> uuid.UUID:
         """确保值是有效的 UUID 对象"""
@@ -315,6 +540,9 @@ class PostgresSessionService(BaseSessionService):
             return uuid.uuid4()
         if isinstance(value, uuid.UUID):
             return value
+        if isinstance(value, str) and len(value) not in _UUID_STR_LENGTHS:
+            # 长度不符时必然解析失败，跳过 uuid.UUID 的解析与异常开销
+            return uuid.uuid4()
         try:
             # 尝试作为标准 UUID 字符串解析
             return uuid.UUID(str(value))
@@ -322,33 +550,18 @@ class PostgresSessionService(BaseSessionService):
             # 如果解析失败，生成新的 UUID
             return uuid.uuid4()
 
-    def _serialize_content(self, content: Any) -> dict:
-        """安全序列化 Event.content"""
+    def _serialize_content(self, content: Any) -> str:
+        """将 Event.content 序列化为 JSON 字符串 (bytes 转 base64，其余不可序列化对象转字符串)"""
         if content is None:
-            return {}
-        if hasattr(content, "model_dump"):
+            data: Any = {}
+        elif type(content) is types.Content:
+            data = _dump_content(content)
+        elif hasattr(content, "model_dump"):
             data = content.model_dump()
-            return self._clean_for_json(data)
-        if isinstance(content, dict):
-            return self._clean_for_json(content)
-        if isinstance(content, list):
-            return {"parts": self._clean_for_json(content)}
-        return {"text": str(content)}
-
-    def _clean_for_json(self, obj: Any) -> Any:
-        """递归清理对象使其可 JSON 序列化"""
-        import base64
-
-        if obj is None:
-            return None
-        if isinstance(obj, bytes):
-            # bytes 转换为 base64 字符串
-            return base64.b64encode(obj).decode("utf-8")
-        if isinstance(obj, dict):
-            return {k: self._clean_for_json(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [self._clean_for_json(item) for item in obj]
-        if isinstance(obj, (str, int, float, bool)):
-            return obj
-        # 其他类型转换为字符串
-        return str(obj)
+        elif isinstance(content, dict):
+            data = content
+        elif isinstance(content, list):
+            data = {"parts": content}
+        else:
+            data = {"text": str(content)}
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
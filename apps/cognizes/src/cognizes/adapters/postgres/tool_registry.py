@@ -4,13 +4,55 @@ ToolRegistry: 数据库驱动的动态工具注册表
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
+import time
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 import asyncpg
+import orjson
+
+from cognizes.core.database import load_jsonb
+
+# SQL 语句保持为模块级常量，以稳定命中 asyncpg 的连接级 prepared statement 缓存
+_UPSERT_TOOL_SQL = """
+    INSERT INTO tools (id, app_name, name, display_name, openapi_schema, permissions)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (app_name, name) DO UPDATE SET
+        display_name = $4, openapi_schema = $5, permissions = $6
+"""
+
+_SELECT_ACTIVE_TOOLS_SQL = "SELECT * FROM tools WHERE app_name = $1 AND is_active = true"
+
+# 批量合并统计增量：一条语句更新所有有调用的工具
+_UPDATE_TOOL_STATS_SQL = """
+    UPDATE tools AS t
+    SET call_count = t.call_count + u.calls,
+        avg_latency_ms = (t.avg_latency_ms * t.call_count + u.total_latency_ms) / (t.call_count + u.calls)
+    FROM unnest($2::text[], $3::int[], $4::float8[]) AS u(name, calls, total_latency_ms)
+    WHERE t.app_name = $1 AND t.name = u.name
+"""
+
+# 调用统计在内存中累加，累计调用数达到阈值时随调用落库；以 async with 管理时另按时间间隔落库
+STATS_FLUSH_INTERVAL_SECONDS = 1.0
+STATS_FLUSH_THRESHOLD = 100
+
+# 工具定义按人工节奏变更，可用工具列表在进程内短时缓存
+TOOLS_CACHE_TTL_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_FRONTEND_TOOL_SQL = """
+    INSERT INTO tools (app_name, name, description, openapi_schema, permissions)
+    VALUES ($1, $2, $3, $4, $5)
+    ON CONFLICT (app_name, name) DO UPDATE
+    SET description = EXCLUDED.description,
+        openapi_schema = EXCLUDED.openapi_schema,
+        updated_at = NOW()
+"""
 
 
 @dataclass
@@ -38,11 +80,29 @@ class FrontendTool:
 
 
 class ToolRegistry:
+    """
+    数据库驱动的动态工具注册表
+
+    生命周期：
+        invoke_tool 的调用统计先在内存中累加，累计 STATS_FLUSH_THRESHOLD 次调用时
+        随该次调用写入 tools 表，不足阈值的尾部增量只在 flush_stats()/close() 时落库。
+        以 ``async with ToolRegistry(...)`` 管理时，进入时另启动按
+        STATS_FLUSH_INTERVAL_SECONDS 落库的后台任务，退出时停止任务并写入剩余统计；
+        不使用 async with 的持有方须在关闭时调用 close()，否则尾部统计会丢失。
+    """
+
     def __init__(self, pool: asyncpg.Pool, app_name: str | None = None):
         self._pool = pool
         self._app_name = app_name or "default_app"
         self._function_registry: dict[str, Callable] = {}
         self._frontend_tools: dict[str, FrontendTool] = {}
+        # 待落库的调用统计: name -> [调用次数, 累计耗时 ms]
+        self._pending_stats: dict[str, list[float]] = {}
+        self._pending_calls = 0
+        self._stats_flush_task: asyncio.Task | None = None
+        # 可用工具列表缓存: (写入时刻 monotonic, 工具列表)
+        self._tools_cache: tuple[float, list[ToolDefinition]] | None = None
+        self._tools_ttl_s = TOOLS_CACHE_TTL_SECONDS
 
     async def register_tool(
         self,
@@ -57,19 +117,15 @@ class ToolRegistry:
         tool_id = str(uuid.uuid4())
         async with self._pool.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO tools (id, app_name, name, display_name, openapi_schema, permissions)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (app_name, name) DO UPDATE SET
-                    display_name = $4, openapi_schema = $5, permissions = $6
-                """,
+                _UPSERT_TOOL_SQL,
                 uuid.UUID(tool_id),
                 self._app_name,
                 name,
                 display_name or name,
-                json.dumps(openapi_schema or {}),
-                json.dumps(permissions or {"allowed_users": ["*"]}),
+                orjson.dumps(openapi_schema or {}).decode(),
+                orjson.dumps(permissions or {"allowed_users": ["*"]}).decode(),
             )
+        self._tools_cache = None
         self._function_registry[name] = func
         return ToolDefinition(
             id=tool_id,
@@ -84,67 +140,117 @@ class ToolRegistry:
         )
 
     async def get_available_tools(self, user_id: str | None = None) -> list[ToolDefinition]:
-        """获取可用工具列表"""
+        """获取可用工具列表 (TTL 内直接返回缓存副本)"""
+        if self._tools_cache is not None:
+            cached_at, tools = self._tools_cache
+            if time.monotonic() - cached_at < self._tools_ttl_s:
+                return list(tools)
+
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch("SELECT * FROM tools WHERE app_name = $1 AND is_active = true", self._app_name)
-        return [
+            rows = await conn.fetch(_SELECT_ACTIVE_TOOLS_SQL, self._app_name)
+        tools = [
             ToolDefinition(
                 id=str(r["id"]),
                 name=r["name"],
                 display_name=r["display_name"],
                 description=r["description"] or "",
-                openapi_schema=json.loads(r["openapi_schema"]),
-                permissions=json.loads(r["permissions"]),
+                openapi_schema=load_jsonb(r["openapi_schema"]),
+                permissions=load_jsonb(r["permissions"]),
                 is_active=r["is_active"],
                 call_count=r["call_count"],
                 avg_latency_ms=r["avg_latency_ms"],
             )
             for r in rows
         ]
+        self._tools_cache = (time.monotonic(), tools)
+        return list(tools)
 
     async def invoke_tool(self, name: str, params: dict, *, run_id: str | None = None) -> Any:
-        """调用工具并记录统计"""
-        import asyncio
-        import time
-
+        """调用工具并记录统计 (统计批量落库，见类文档「生命周期」)"""
         func = self._function_registry.get(name)
         if not func:
             raise ValueError(f"Tool '{name}' not found")
-        start = time.time()
+        start = time.perf_counter()
         result = await func(**params) if asyncio.iscoroutinefunction(func) else func(**params)
-        latency = (time.time() - start) * 1000
-        # 更新统计
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                "UPDATE tools SET call_count = call_count + 1, "
-                "avg_latency_ms = (avg_latency_ms * call_count + $1) / (call_count + 1) "
-                "WHERE app_name = $2 AND name = $3",
-                latency,
-                self._app_name,
-                name,
-            )
+        latency = (time.perf_counter() - start) * 1000
+        self._record_stats(name, 1, latency)
+        if self._pending_calls >= STATS_FLUSH_THRESHOLD:
+            await self._flush_stats_safely()
         return result
 
+    def _record_stats(self, name: str, calls: int, total_latency_ms: float) -> None:
+        stats = self._pending_stats.setdefault(name, [0, 0.0])
+        stats[0] += calls
+        stats[1] += total_latency_ms
+        self._pending_calls += calls
+
+    async def _flush_stats_safely(self) -> None:
+        # 统计落库失败不影响工具调用结果，增量已由 flush_stats 归还
+        try:
+            await self.flush_stats()
+        except Exception as e:
+            logger.warning(f"Failed to flush tool stats: {e}")
+
+    async def _stats_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(STATS_FLUSH_INTERVAL_SECONDS)
+            await self._flush_stats_safely()
+
+    async def flush_stats(self) -> None:
+        """将累积的调用统计一次性写入 tools 表"""
+        if not self._pending_stats:
+            return
+        pending, self._pending_stats = self._pending_stats, {}
+        self._pending_calls = 0
+        names = list(pending)
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    _UPDATE_TOOL_STATS_SQL,
+                    self._app_name,
+                    names,
+                    [int(pending[n][0]) for n in names],
+                    [pending[n][1] for n in names],
+                )
+        except BaseException:
+            # 写入失败或被取消时归还增量，留待下次落库 (close() 会做最后一次写入)
+            for n in names:
+                self._record_stats(n, int(pending[n][0]), pending[n][1])
+            raise
+
+    async def __aenter__(self) -> ToolRegistry:
+        if self._stats_flush_task is None:
+            self._stats_flush_task = asyncio.create_task(self._stats_flush_loop())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """停止定时落库任务 (如有) 并写入剩余统计"""
+        if self._stats_flush_task is not None:
+            self._stats_flush_task.cancel()
+            try:
+                await self._stats_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._stats_flush_task = None
+        await self.flush_stats()
+
     async def register_frontend_tool(self, app_name: str, tool: FrontendTool) -> None:
         """注册前端定义工具"""
         self._frontend_tools[f"{app_name}:{tool.name}"] = tool
 
-        # 同时持久化到数据库
+        # 同时持久化到数据库；写入完成后再失效缓存，避免并发读取在写入前重新填充旧列表
         await self._pool.execute(
-            """
-            INSERT INTO tools (app_name, name, description, openapi_schema, permissions)
-            VALUES ($1, $2, $3, $4, $5)
-            ON CONFLICT (app_name, name) DO UPDATE
-            SET description = EXCLUDED.description,
-                openapi_schema = EXCLUDED.openapi_schema,
-                updated_at = NOW()
-        """,
+            _UPSERT_FRONTEND_TOOL_SQL,
             app_name,
             tool.name,
             tool.description,
-            json.dumps(tool.parameters),
-            json.dumps({"requires_confirmation": tool.requires_confirmation}),
+            orjson.dumps(tool.parameters).decode(),
+            orjson.dumps({"requires_confirmation": tool.requires_confirmation}).decode(),
         )
+        self._tools_cache = None
 
     def get_frontend_tools(self, app_name: str) -> list[FrontendTool]:
         """获取应用的前端工具列表"""
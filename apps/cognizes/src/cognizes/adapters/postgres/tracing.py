@@ -15,12 +15,15 @@ OpenTelemetry 双路导出集成
     └─────────────┘  └─────────────┘  └─────────────┘
 """
 
-import json
-from datetime import datetime
+from __future__ import annotations
 
-import asyncpg
+import asyncio
+import logging
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import orjson
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
@@ -29,53 +32,324 @@ from opentelemetry.sdk.trace.export import (
     SpanExportResult,
 )
 
+if TYPE_CHECKING:
+    import asyncpg
+
+_TRACE_COLUMNS = (
+    "trace_id",
+    "span_id",
+    "parent_span_id",
+    "operation_name",
+    "span_kind",
+    "attributes",
+    "start_time",
+    "end_time",
+    "duration_ns",
+    "status_code",
+    "status_message",
+)
+
+# INSERT 语句保持为模块级常量：executemany 按语句文本命中 asyncpg 的连接级 prepared statement 缓存，
+# 每个连接只在首次写入时 Parse 一次，之后的批次仅发送 Bind/Execute。
+# 不使用 conn.prepare()：它默认绕过该缓存，每次调用都会新建服务端 prepared statement。
+_INSERT_TRACE_SQL = """
+    INSERT INTO traces
+    (trace_id, span_id, parent_span_id, operation_name, span_kind,
+     attributes, start_time, end_time, duration_ns,
+     status_code, status_message)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+
+# Span 事件拆分到 traces_events 子表，以 COPY 批量写入，traces 主表行不再携带事件数组
+_EVENT_COLUMNS = ("trace_id", "span_id", "idx", "name", "ts", "attributes")
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """当前线程正在运行的事件循环，没有时返回 None"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """当前线程是否正在运行该事件循环"""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+# Span 时间戳为 Unix 纳秒，基于 UTC 纪元换算为 timestamptz
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _attributes_json(attributes) -> str:
+    """
+    序列化 Span / 事件属性
+
+    空属性直接返回常量；OTel 以 mappingproxy / BoundedAttributes 暴露属性，
+    由 orjson 的 default 钩子按需转换，调用方不再预先构造 dict 副本。
+    """
+    if not attributes:
+        return "{}"
+    return orjson.dumps(attributes, default=dict).decode()
+
+
+_ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit = off"
+
+# traces 按天范围分区且不设 DEFAULT 分区: 每天首次写入前预建分区 (函数定义见 mind_schema.sql)
+_CREATE_PARTITIONS_SQL = "SELECT create_traces_partitions()"
+
+# 超过该 Span 数的批次改用 COPY 写入，否则使用 executemany (单次往返)
+COPY_THRESHOLD = 100
+
+
+# flush / shutdown 等待队列排空的上限
+EXPORT_TIMEOUT_SECONDS = 10.0
+
+# export() 与落库之间的有界队列: 队列元素为一个 BatchSpanProcessor 批次，
+# 写库协程每次最多合并 DRAIN_MAX_BATCHES 个批次为一次往返
+EXPORT_QUEUE_MAX_BATCHES = 64
+DRAIN_MAX_BATCHES = 8
+
+logger = logging.getLogger(__name__)
+
 
 class PostgresSpanExporter(SpanExporter):
-    """将 Span 持久化到 PostgreSQL traces 表"""
+    """
+    将 Span 持久化到 PostgreSQL traces 表
 
-    def __init__(self, pool: asyncpg.Pool):
+    export() 由 BatchSpanProcessor 的后台线程调用：在该线程内完成行构造后，把行批次投递到
+    连接池所在事件循环上的有界队列并立即返回，由写库协程合并多个批次后一次性落库，
+    数据库延迟不会反压 BatchSpanProcessor。队列满时丢弃该批次并计入 dropped_spans。
+    asyncpg 连接池绑定在创建它的事件循环上，因此写库协程运行在该循环，而非每批次新建事件循环。
+
+    事件循环取自构造参数 loop，否则取构造时正在运行的循环；在循环外构造时延迟到首次异步调用
+    (如 await flush()) 时捕获，此前后台线程投递的批次返回 FAILURE。
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+        export_timeout: float = EXPORT_TIMEOUT_SECONDS,
+        max_queue_batches: int = EXPORT_QUEUE_MAX_BATCHES,
+    ):
         self._pool = pool
+        # 默认取构造时正在运行的事件循环 (即创建连接池的应用循环)，不在循环内构造时延迟捕获
+        self._loop = loop or _running_loop()
+        self._export_timeout = export_timeout
+        self._max_queue_batches = max_queue_batches
+        # 队列与写库任务只在事件循环线程内创建和访问；队列元素为 (Span 行, 事件行)
+        self._queue: asyncio.Queue[tuple[list[tuple], list[tuple]]] | None = None
+        self._drain_task: asyncio.Task | None = None
+        self._partitions_ready_on: date | None = None
+        self.dropped_spans = 0
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop | None:
+        if self._loop is None:
+            self._loop = _running_loop()
+        return self._loop
 
     def export(self, spans: list[ReadableSpan]) -> SpanExportResult:  # type: ignore[override]
-        """同步导出 (内部异步)"""
-        import asyncio
+        """构造行并投递到写库队列，不等待落库"""
+        loop = self._bind_loop()
+        if loop is None:
+            logger.warning("PostgresSpanExporter has no event loop yet, dropping spans")
+            return SpanExportResult.FAILURE
+        if loop.is_closed():
+            return SpanExportResult.FAILURE
 
-        try:
-            asyncio.get_event_loop().run_until_complete(self._async_export(spans))
+        batch = self._span_rows(spans)
+        if not batch[0]:
             return SpanExportResult.SUCCESS
-        except Exception:
-            return SpanExportResult.FAILURE
+
+        if _on_loop_thread(loop):
+            self._enqueue(batch)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, batch)
+        return SpanExportResult.SUCCESS
+
+    def _enqueue(self, batch: tuple[list[tuple], list[tuple]]) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_batches)
+        try:
+            self._queue.put_nowait(batch)
+        except asyncio.QueueFull:
+            self.dropped_spans += len(batch[0])
+            logger.warning(f"Span export queue full, dropped {len(batch[0])} spans")
+            return
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_loop())
+
+    async def _drain_loop(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            batches = [await queue.get()]
+            while len(batches) < DRAIN_MAX_BATCHES and not queue.empty():
+                batches.append(queue.get_nowait())
+            rows = [row for span_rows, _ in batches for row in span_rows]
+            event_rows = [row for _, batch_events in batches for row in batch_events]
+            try:
+                await self._write_rows(rows, event_rows)
+            except Exception as e:
+                self.dropped_spans += len(rows)
+                logger.warning(f"Failed to export {len(rows)} spans: {e}")
+            finally:
+                for _ in batches:
+                    queue.task_done()
 
     async def _async_export(self, spans: list[ReadableSpan]) -> None:
+        """直接写入一批 Span (不经队列)"""
+        self._bind_loop()
+        await self._write_rows(*self._span_rows(spans))
+
+    async def _write_rows(self, rows: list[tuple], event_rows: list[tuple]) -> None:
+        if not rows:
+            return
+
         async with self._pool.acquire() as conn:
-            for span in spans:
-                await conn.execute(
-                    """
-                    INSERT INTO traces
-                    (trace_id, span_id, parent_span_id, operation_name, span_kind,
-                     attributes, events, start_time, end_time, duration_ns,
-                     status_code, status_message)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                    """,
-                    format(span.context.trace_id, "032x"),
-                    format(span.context.span_id, "016x"),
-                    format(span.parent.span_id, "016x") if span.parent else None,
+            await self._ensure_partitions(conn)
+            async with conn.transaction():
+                # traces 为仅追加的审计数据，崩溃时丢失最近少量 Span 可接受：
+                # 仅对本事务关闭同步提交，不等待 WAL fsync，连接归还后其他业务事务保持完整持久性
+                await conn.execute(_ASYNC_COMMIT_SQL)
+                if len(rows) > COPY_THRESHOLD:
+                    # 大批量走 COPY 协议，绕过逐行语句解析
+                    await conn.copy_records_to_table("traces", records=rows, columns=_TRACE_COLUMNS)
+                else:
+                    await conn.executemany(_INSERT_TRACE_SQL, rows)
+                if event_rows:
+                    # 事件与所属 Span 同一事务提交
+                    await conn.copy_records_to_table("traces_events", records=event_rows, columns=_EVENT_COLUMNS)
+
+    async def _ensure_partitions(self, conn: asyncpg.Connection) -> None:
+        """每天首次写入前预建 traces 日分区；失败仅告警，缺分区的写入随后报错并计入丢弃"""
+        today = datetime.now(UTC).date()
+        if self._partitions_ready_on == today:
+            return
+        try:
+            await conn.execute(_CREATE_PARTITIONS_SQL)
+        except Exception as e:
+            logger.warning(f"Failed to create traces partitions: {e}")
+            return
+        self._partitions_ready_on = today
+
+    def _span_rows(self, spans: list[ReadableSpan]) -> tuple[list[tuple], list[tuple]]:
+        """构造 traces 行与 traces_events 行"""
+        rows: list[tuple] = []
+        event_rows: list[tuple] = []
+        append = rows.append
+        append_event = event_rows.append
+        for span in spans:
+            ctx = span.context
+            parent = span.parent
+            kind = span.kind
+            status = span.status
+            start_ns = span.start_time
+            end_ns = span.end_time
+            trace_id = f"{ctx.trace_id:032x}"
+            span_id = f"{ctx.span_id:016x}"
+            for idx, event in enumerate(span.events or ()):
+                append_event(
+                    (
+                        trace_id,
+                        span_id,
+                        idx,
+                        event.name,
+                        _EPOCH + timedelta(microseconds=event.timestamp // 1000),
+                        _attributes_json(event.attributes),
+                    )
+                )
+            append(
+                (
+                    trace_id,
+                    span_id,
+                    f"{parent.span_id:016x}" if parent else None,
                     span.name,
-                    span.kind.name if span.kind else "INTERNAL",
-                    json.dumps(dict(span.attributes or {})),
-                    json.dumps([self._event_to_dict(e) for e in (span.events or [])]),
-                    datetime.fromtimestamp(span.start_time / 1e9),  # type: ignore[operator]
-                    datetime.fromtimestamp(span.end_time / 1e9) if span.end_time else None,
-                    (span.end_time - span.start_time) if span.end_time else None,  # type: ignore[operator]
-                    span.status.status_code.name if span.status else "UNSET",
-                    span.status.description if span.status else None,
+                    kind.name if kind else "INTERNAL",
+                    _attributes_json(span.attributes),
+                    _EPOCH + timedelta(microseconds=start_ns // 1000),  # type: ignore[operator]
+                    _EPOCH + timedelta(microseconds=end_ns // 1000) if end_ns else None,
+                    (end_ns - start_ns) if end_ns else None,  # type: ignore[operator]
+                    status.status_code.name if status else "UNSET",
+                    status.description if status else None,
                 )
+            )
+        return rows, event_rows
+
+    async def flush(self) -> None:
+        """等待队列中已投递的 Span 全部落库"""
+        self._bind_loop()
+        if self._queue is not None:
+            await self._queue.join()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        loop = self._loop
+        if loop is None or loop.is_closed() or _on_loop_thread(loop):
+            # 尚未绑定循环时无待写数据；事件循环线程内无法阻塞等待自身排空
+            return self._queue is None or self._queue.empty()
+        timeout = min(timeout_millis / 1000, self._export_timeout)
+        future = asyncio.run_coroutine_threadsafe(self.flush(), loop)
+        try:
+            future.result(timeout=timeout)
+            return True
+        except Exception:
+            future.cancel()
+            return False
+
+    def shutdown(self) -> None:
+        self.force_flush()
+        if self._drain_task is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._drain_task.cancel)
+
+
+class _DropCountingExporter(SpanExporter):
+    """包装 Exporter，统计导出失败而被丢弃的 Span 数"""
+
+    def __init__(self, exporter: SpanExporter):
+        self._exporter = exporter
+        self._failed_spans = 0
+
+    @property
+    def dropped_spans(self) -> int:
+        # 含 Exporter 内部异步写入阶段丢弃的 Span (如 PostgresSpanExporter 队列满或落库失败)
+        return self._failed_spans + getattr(self._exporter, "dropped_spans", 0)
 
-    def _event_to_dict(self, event) -> dict:
-        return {"name": event.name, "timestamp": event.timestamp, "attributes": dict(event.attributes or {})}
+    def export(self, spans) -> SpanExportResult:  # type: ignore[override]
+        result = self._exporter.export(spans)
+        if result is not SpanExportResult.SUCCESS:
+            self._failed_spans += len(spans)
+        return result
 
     def shutdown(self) -> None:
-        pass
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
+
+# BatchSpanProcessor 参数: 较 SDK 默认值 (2048/512/5000ms/30000ms) 更大的队列、更短的调度间隔，
+# 突发 tool call 时减少丢弃并降低可视化延迟
+BATCH_MAX_QUEUE_SIZE = 4096
+BATCH_MAX_EXPORT_BATCH_SIZE = 256
+BATCH_SCHEDULE_DELAY_MILLIS = 1000
+BATCH_EXPORT_TIMEOUT_MILLIS = 10000
+
+# OTLP gRPC 通道保活: 仅在有进行中的调用时发送 ping (不开启 permit_without_calls)，
+# 默认间隔不低于 gRPC 服务端默认的最小 ping 间隔 (5 分钟)，否则服务端以 GOAWAY too_many_pings 断开连接
+OTLP_KEEPALIVE_TIME_MS = 300_000
+OTLP_KEEPALIVE_TIMEOUT_MS = 20_000
+
+
+def _otlp_channel_options(keepalive_time_ms: int) -> tuple[tuple[str, int], ...]:
+    return (
+        ("grpc.keepalive_time_ms", keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", OTLP_KEEPALIVE_TIMEOUT_MS),
+    )
 
 
 class TracingManager:
@@ -97,33 +371,77 @@ class TracingManager:
         otlp_endpoint: str | None = None,
         console_export: bool = False,
         otlp_exporter: SpanExporter | None = None,  # For testing
+        loop: asyncio.AbstractEventLoop | None = None,
+        *,
+        max_queue_size: int = BATCH_MAX_QUEUE_SIZE,
+        max_export_batch_size: int = BATCH_MAX_EXPORT_BATCH_SIZE,
+        schedule_delay_millis: float = BATCH_SCHEDULE_DELAY_MILLIS,
+        export_timeout_millis: float = BATCH_EXPORT_TIMEOUT_MILLIS,
+        otlp_keepalive_time_ms: int = OTLP_KEEPALIVE_TIME_MS,
     ):
         provider = TracerProvider()
+        self._exporters: list[_DropCountingExporter] = []
+
+        def add_exporter(exporter: SpanExporter) -> None:
+            counting = _DropCountingExporter(exporter)
+            self._exporters.append(counting)
+            provider.add_span_processor(
+                BatchSpanProcessor(
+                    counting,
+                    max_queue_size=max_queue_size,
+                    schedule_delay_millis=schedule_delay_millis,
+                    max_export_batch_size=max_export_batch_size,
+                    export_timeout_millis=export_timeout_millis,
+                )
+            )
 
         # 双路导出配置
         if pg_pool:
-            # PostgreSQL: 持久化审计
-            provider.add_span_processor(BatchSpanProcessor(PostgresSpanExporter(pg_pool)))
+            # PostgreSQL: 持久化审计 (loop 为 pg_pool 所在事件循环，默认取当前运行中的循环，否则延迟捕获)
+            # 批大小 > COPY_THRESHOLD 时，一次调度即一次 COPY 往返
+            add_exporter(PostgresSpanExporter(pg_pool, loop=loop))
 
         # OTLP: 实时可视化 (Langfuse)
         if otlp_exporter:
             # 优先使用注入的 Exporter (测试用)
-            provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+            add_exporter(otlp_exporter)
         elif otlp_endpoint:
-            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)))
+            # gRPC Exporter 依赖 grpc/protobuf，导入开销大，仅在配置 OTLP 时加载
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+            # 缩短 otlp_keepalive_time_ms 前需确认 Collector 放宽了 keepalive enforcement 的最小间隔
+            add_exporter(
+                OTLPSpanExporter(
+                    endpoint=otlp_endpoint,
+                    insecure=True,
+                    channel_options=_otlp_channel_options(otlp_keepalive_time_ms),
+                )
+            )
 
         if console_export:
-            provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+            add_exporter(ConsoleSpanExporter())
 
         trace.set_tracer_provider(provider)
         self.tracer = trace.get_tracer(service_name)
 
+    @property
+    def dropped_spans(self) -> int:
+        """各 Exporter 因导出失败而丢弃的 Span 总数"""
+        return sum(exporter.dropped_spans for exporter in self._exporters)
+
     def trace_tool_call(self, tool_name: str):
+        # Span 名称、属性与 tracer 在装饰时确定，调用路径上不再重复构造
+        span_name = f"tool:{tool_name}"
+        attributes = {"tool.name": tool_name}
+        tracer = self.tracer
+
         def decorator(func):
+            if isinstance(tracer, trace.NoOpTracer):
+                return func
+
             async def wrapper(*args, **kwargs):
-                with self.tracer.start_as_current_span(f"tool:{tool_name}") as span:
-                    span.set_attribute("tool.name", tool_name)
-                    # Note: Arguments might be PII, be careful logging
+                # Note: Arguments might be PII, be careful logging
+                with tracer.start_as_current_span(span_name, attributes=attributes):
                     return await func(*args, **kwargs)
 
             return wrapper
@@ -19,9 +19,11 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 import asyncpg
+import orjson
 
 if TYPE_CHECKING:
     from cognizes.core.repositories import (
+        EmbeddingCacheRepository,
         EventRepository,
         FactsRepository,
         InstructionsRepository,
@@ -32,6 +34,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# jsonb 二进制格式版本号前缀
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """jsonb 二进制编码: str 视为已序列化的 JSON 文本 (兼容既有写入方)，其余对象由 orjson 序列化"""
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode()
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """jsonb 二进制解码: 跳过版本号前缀后由 orjson 解析"""
+    return orjson.loads(data[1:])
+
+
+def load_jsonb(value: Any) -> Any:
+    """
+    读取 jsonb 列值
+
+    DatabaseManager 创建的连接已在取行时解码为 Python 对象，直接返回；
+    未注册 codec 的连接返回 JSON 文本，在此解析。
+    """
+    if isinstance(value, (str, bytes)):
+        return orjson.loads(value)
+    return value
+
 
 class DatabaseManager:
     """
@@ -69,20 +98,30 @@ class DatabaseManager:
         min_pool_size: int = 2,
         max_pool_size: int = 10,
         enable_pgvector: bool = True,
+        statement_cache_size: int = 1024,
+        max_inactive_connection_lifetime: float = 3600.0,
+        command_timeout: float | None = None,
     ):
         """
         初始化数据库管理器
 
         Args:
             dsn: 数据库连接字符串，默认从 DATABASE_URL 环境变量读取
-            min_pool_size: 连接池最小连接数
+            min_pool_size: 连接池最小连接数 (创建连接池时即预建立；热路径服务可设为与最大连接数一致，避免冷连接抖动)
             max_pool_size: 连接池最大连接数
             enable_pgvector: 是否启用 pgvector 扩展初始化
+            statement_cache_size: 每个连接缓存的 prepared statement 数量
+            max_inactive_connection_lifetime: 空闲连接回收时间 (秒)，0 表示不回收，连接及其 prepared statement 缓存常驻
+            command_timeout: 单条语句默认超时时间 (秒)，None 表示不限制；
+                Schema 初始化、索引预热等长耗时任务应使用不设超时的连接池
         """
         self._dsn = dsn or os.getenv("DATABASE_URL", "postgresql://aigc:@localhost:5432/cognizes-engine")
         self._min_pool_size = min_pool_size
         self._max_pool_size = max_pool_size
         self._enable_pgvector = enable_pgvector
+        self._statement_cache_size = statement_cache_size
+        self._max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self._command_timeout = command_timeout
 
         # 连接池和对应的事件循环
         self._pool: asyncpg.Pool | None = None
@@ -92,12 +131,13 @@ class DatabaseManager:
         self._repos: dict[str, Any] = {}
 
     @classmethod
-    def get_instance(cls, dsn: str | None = None) -> DatabaseManager:
+    def get_instance(cls, dsn: str | None = None, **pool_options: Any) -> DatabaseManager:
         """
         获取单例实例
 
         Args:
             dsn: 数据库连接字符串 (仅在首次调用时生效)
+            **pool_options: 透传给构造函数的连接池参数 (仅在创建实例时生效)
 
         Returns:
             DatabaseManager 单例实例
@@ -105,7 +145,7 @@ class DatabaseManager:
         effective_dsn = dsn or os.getenv("DATABASE_URL")
 
         if cls._instance is None or (effective_dsn and cls._instance_dsn != effective_dsn):
-            cls._instance = cls(dsn=dsn)
+            cls._instance = cls(dsn=dsn, **pool_options)
             cls._instance_dsn = effective_dsn
 
         return cls._instance
@@ -140,24 +180,32 @@ class DatabaseManager:
                 except Exception:
                     pass  # 忽略关闭错误，旧事件循环可能已关闭
 
-            # pgvector 初始化回调
-            init_callback = None
+            # 连接初始化回调: jsonb 二进制 codec + pgvector 类型注册
+            register_vector = None
             if self._enable_pgvector:
                 try:
                     import pgvector.asyncpg
 
-                    async def init_connection(conn: asyncpg.Connection) -> None:
-                        await pgvector.asyncpg.register_vector(conn)
-
-                    init_callback = init_connection
+                    register_vector = pgvector.asyncpg.register_vector
                 except ImportError:
                     logger.warning("pgvector not installed, skipping vector type registration")
 
+            async def init_connection(conn: asyncpg.Connection) -> None:
+                # jsonb 在取行时一次性解码为 Python 对象，调用方无需逐行 json.loads
+                await conn.set_type_codec(
+                    "jsonb", encoder=_encode_jsonb, decoder=_decode_jsonb, schema="pg_catalog", format="binary"
+                )
+                if register_vector is not None:
+                    await register_vector(conn)
+
             self._pool = await asyncpg.create_pool(
                 self._dsn,
                 min_size=self._min_pool_size,
                 max_size=self._max_pool_size,
-                init=init_callback,
+                init=init_connection,
+                statement_cache_size=self._statement_cache_size,
+                max_inactive_connection_lifetime=self._max_inactive_connection_lifetime,
+                command_timeout=self._command_timeout,
             )
             self._pool_loop = current_loop
             logger.info(f"Created database pool: min={self._min_pool_size}, max={self._max_pool_size}")
@@ -330,12 +378,14 @@ class DatabaseManager:
 
             where_clause = " AND ".join(where_parts) if where_parts else "1=1"
 
+            # LIMIT 作为参数绑定，不同 limit 复用同一条语句文本 (prepared statement 缓存)
+            params.append(limit)
             query = f"""
                 SELECT {columns}
                 FROM {table}
                 WHERE {where_clause}
                 ORDER BY embedding <=> $1
-                LIMIT {limit}
+                LIMIT ${len(params)}
             """
 
             return await conn.fetch(query, *params)
@@ -555,6 +605,14 @@ class DatabaseManager:
             self._repos["instructions"] = InstructionsRepository(self)
         return self._repos["instructions"]
 
+    @property
+    def embedding_cache(self) -> EmbeddingCacheRepository:
+        if "embedding_cache" not in self._repos:
+            from cognizes.core.repositories import EmbeddingCacheRepository
+
+            self._repos["embedding_cache"] = EmbeddingCacheRepository(self)
+        return self._repos["embedding_cache"]
+
 
 async def get_db() -> DatabaseManager:
     """
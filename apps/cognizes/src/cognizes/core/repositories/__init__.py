@@ -5,6 +5,7 @@ This package contains data access layer (Repository) classes for different entit
 """
 
 from cognizes.core.repositories.base import BaseRepository
+from cognizes.core.repositories.embedding_cache import EmbeddingCacheRepository
 from cognizes.core.repositories.event import EventRepository
 from cognizes.core.repositories.facts import FactsRepository
 from cognizes.core.repositories.instructions import InstructionsRepository
@@ -20,4 +21,5 @@ __all__ = [
     "MemoryRepository",
     "FactsRepository",
     "InstructionsRepository",
+    "EmbeddingCacheRepository",
 ]
@@ -0,0 +1,58 @@
+"""
+EmbeddingCacheRepository: Embedding Cache Data Access Layer
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+from cognizes.core.repositories.base import BaseRepository
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def content_hash(text: str) -> bytes:
+    """SHA-256 digest of the exact content."""
+    return hashlib.sha256(text.encode()).digest()
+
+
+def normalized_content_hash(text: str) -> bytes:
+    """SHA-256 digest of the content lowercased, stripped of punctuation and with whitespace collapsed."""
+    normalized = " ".join(_PUNCTUATION_RE.sub("", text.lower()).split())
+    return hashlib.sha256(normalized.encode()).digest()
+
+
+class EmbeddingCacheRepository(BaseRepository):
+    """Embedding Cache Data Access Layer"""
+
+    async def lookup(self, provider: str, model: str, text: str) -> list[float] | None:
+        """
+        Look up a cached embedding for the text.
+        An exact content match is preferred; otherwise falls back to a normalized content match.
+        """
+        query = """
+            SELECT embedding
+            FROM embedding_cache
+            WHERE provider = $1 AND model = $2
+              AND (content_hash = $3 OR normalized_hash = $4)
+            ORDER BY content_hash = $3 DESC
+            LIMIT 1
+        """
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            embedding = await conn.fetchval(query, provider, model, content_hash(text), normalized_content_hash(text))
+        if embedding is None:
+            return None
+        return embedding.to_list() if hasattr(embedding, "to_list") else list(embedding)
+
+    async def store(self, provider: str, model: str, text: str, embedding: list[float]) -> None:
+        """Store an embedding; existing entries for the same content are kept."""
+        query = """
+            INSERT INTO embedding_cache (provider, model, content_hash, normalized_hash, embedding)
+            VALUES ($1, $2, $3, $4, $5::halfvec)
+            ON CONFLICT DO NOTHING
+        """
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(query, provider, model, content_hash(text), normalized_content_hash(text), embedding)
@@ -53,25 +53,28 @@ class EventRepository(BaseRepository):
         self,
         session_id: uuid.UUID,
         current_version: int,
-        new_state: dict | None,
+        state_delta: dict | None,
         event_data: dict,
     ) -> dict:
         """
-        Atomically append event and update state (if needed).
+        Atomically append event and merge state_delta into state (if needed).
+
+        The delta is merged server-side with jsonb ``||``; the version check
+        guarantees it applies on top of the state the caller last read.
         """
         pool = await self.get_pool()
         async with pool.acquire() as conn:
             async with conn.transaction():
                 new_version = current_version
                 # 1. Update State (if needed)
-                if new_state is not None:
+                if state_delta:
                     query = """
                         UPDATE threads
-                        SET state = $1, version = version + 1, updated_at = NOW()
+                        SET state = state || $1::jsonb, version = version + 1, updated_at = NOW()
                         WHERE id = $2 AND version = $3
                         RETURNING version
                     """
-                    new_version = await conn.fetchval(query, json.dumps(new_state), session_id, current_version)
+                    new_version = await conn.fetchval(query, json.dumps(state_delta), session_id, current_version)
 
                     if new_version is None:
                         # Conflict detected
@@ -4,17 +4,40 @@ MemoryRepository: Memory Data Access Layer
 
 from __future__ import annotations
 
-import json
+import time
 import uuid
+from collections.abc import AsyncIterator
 
 import asyncpg
+import orjson
 
 from cognizes.core.repositories.base import BaseRepository
 
+# HNSW ef_search auto-configuration keyed off the memories row count: (upper bound, ef_search)
+EF_SEARCH_BY_ROW_COUNT: tuple[tuple[float, int], ...] = (
+    (10_000, 40),
+    (100_000, 64),
+    (1_000_000, 100),
+)
+EF_SEARCH_MAX = 200
+# pg_class.reltuples only changes on VACUUM/ANALYZE, so the estimate is refreshed lazily
+_ROW_COUNT_TTL_SECONDS = 300.0
+
+
+def resolve_ef_search(row_count: float) -> int:
+    """Pick hnsw.ef_search for the given (estimated) row count."""
+    for upper_bound, ef_search in EF_SEARCH_BY_ROW_COUNT:
+        if row_count < upper_bound:
+            return ef_search
+    return EF_SEARCH_MAX
+
 
 class MemoryRepository(BaseRepository):
     """Memory Data Access Layer"""
 
+    _auto_ef_search: int | None = None
+    _auto_ef_search_at: float = 0.0
+
     async def insert(
         self,
         thread_id: uuid.UUID | None,
@@ -30,7 +53,7 @@ class MemoryRepository(BaseRepository):
         query = """
             INSERT INTO memories
             (thread_id, user_id, app_name, memory_type, content, embedding, metadata, retention_score)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            VALUES ($1, $2, $3, $4, $5, $6::halfvec, $7, $8)
         """
         pool = await self.get_pool()
         async with pool.acquire() as conn:
@@ -42,25 +65,50 @@ class MemoryRepository(BaseRepository):
                 memory_type,
                 content,
                 embedding,
-                json.dumps(metadata),
+                orjson.dumps(metadata).decode(),
                 retention_score,
             )
 
     async def search_vector(
-        self, user_id: str, app_name: str, embedding: list[float], limit: int = 10
+        self,
+        user_id: str,
+        app_name: str,
+        embedding: list[float],
+        limit: int = 10,
+        ef_search: int | None = None,
     ) -> list[asyncpg.Record]:
-        """Search memory using vector similarity."""
+        """
+        Search memory using vector similarity.
+
+        hnsw.ef_search is scoped to the surrounding transaction (SET LOCAL semantics);
+        when ``ef_search`` is None it is derived from the table's estimated row count.
+        """
         query = """
             SELECT id, content, metadata, created_at,
-                   1 - (embedding <=> $1) AS relevance_score
+                   1 - (embedding <=> $1::halfvec) AS relevance_score
             FROM memories
             WHERE user_id = $2 AND app_name = $3
-            ORDER BY embedding <=> $1
+            ORDER BY embedding <=> $1::halfvec
             LIMIT $4
         """
         pool = await self.get_pool()
         async with pool.acquire() as conn:
-            return await conn.fetch(query, embedding, user_id, app_name, limit)
+            async with conn.transaction():
+                if ef_search is None:
+                    ef_search = await self._resolve_auto_ef_search(conn)
+                # SET LOCAL does not accept bind parameters; set_config(..., is_local => true) is equivalent
+                await conn.execute("SELECT set_config('hnsw.ef_search', $1, true)", str(ef_search))
+                return await conn.fetch(query, embedding, user_id, app_name, limit)
+
+    async def _resolve_auto_ef_search(self, conn: asyncpg.Connection) -> int:
+        """Resolve ef_search from pg_class.reltuples, cached for a short TTL."""
+        now = time.monotonic()
+        if self._auto_ef_search is None or now - self._auto_ef_search_at > _ROW_COUNT_TTL_SECONDS:
+            row_count = await conn.fetchval("SELECT reltuples FROM pg_class WHERE oid = 'memories'::regclass")
+            # reltuples is -1 for tables that were never vacuumed/analyzed
+            self._auto_ef_search = resolve_ef_search(max(row_count or 0, 0))
+            self._auto_ef_search_at = now
+        return self._auto_ef_search
 
     async def search_fulltext(
         self, user_id: str, app_name: str, query_text: str, limit: int = 10
@@ -92,6 +140,22 @@ class MemoryRepository(BaseRepository):
         async with pool.acquire() as conn:
             return await conn.fetch(query, user_id, app_name, limit)
 
+    async def iter_recent(
+        self, user_id: str, app_name: str, limit: int = 100, *, prefetch: int = 100
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Stream recent memories through a server-side cursor, fetching `prefetch` rows per round trip."""
+        query = """
+            SELECT id, content, memory_type, metadata, retention_score, created_at
+            FROM memories
+            WHERE user_id = $1 AND app_name = $2
+            ORDER BY created_at DESC
+            LIMIT $3
+        """
+        pool = await self.get_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            async for row in conn.cursor(query, user_id, app_name, limit, prefetch=prefetch):
+                yield row
+
     async def get_context_window(
         self,
         user_id: str,
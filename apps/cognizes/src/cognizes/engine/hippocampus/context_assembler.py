@@ -146,7 +146,7 @@ class ContextAssembler:
         query = """
             SELECT
                 id, content, retention_score,
-                1 - (embedding <=> $3::vector) AS similarity
+                1 - (embedding <=> $3::halfvec) AS similarity
             FROM memories
             WHERE user_id = $1
               AND app_name = $2
@@ -157,10 +157,10 @@ class OpenMemoryService:
         sql = f"""
             SELECT
                 id, content, memory_type, metadata, retention_score,
-                1 - (embedding <=> ${param_idx}::vector) AS relevance
+                1 - (embedding <=> ${param_idx}::halfvec) AS relevance
             FROM memories
             WHERE {where_clause}
-              AND (1 - (embedding <=> ${param_idx}::vector)) >= ${param_idx + 1}
+              AND (1 - (embedding <=> ${param_idx}::halfvec)) >= ${param_idx + 1}
             ORDER BY relevance * retention_score DESC
             LIMIT ${param_idx + 2}
         """
@@ -378,16 +378,26 @@ class SemanticChunker(ChunkingStrategy):
                 ) from None
         return self._model
 
-    def _compute_similarity(self, text1: str, text2: str) -> float:
-        """Compute cosine similarity between two texts."""
+    def _compute_boundary_similarities(self, sentences: list[str]) -> list[float]:
+        """
+        Compute cosine similarity across every candidate boundary in one pass.
+
+        For boundary i the window before (sentences[i-2:i]) is compared with the window
+        after (sentences[i:i+2]). All windows are encoded in a single batch, L2-normalized
+        as a float32 matrix, and scored with one row-wise dot product.
+        """
         import numpy as np
 
+        prev_texts = [" ".join(sentences[max(0, i - 2) : i]) for i in range(1, len(sentences))]
+        next_texts = [" ".join(sentences[i : min(len(sentences), i + 2)]) for i in range(1, len(sentences))]
+
         model = self._get_embedding_model()
-        embeddings = model.encode([text1, text2])
-        similarity = np.dot(embeddings[0], embeddings[1]) / (
-            np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-        )
-        return float(similarity)
+        embeddings = np.asarray(model.encode(prev_texts + next_texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings /= np.maximum(norms, np.finfo(np.float32).tiny)
+
+        prev_matrix, next_matrix = embeddings[: len(prev_texts)], embeddings[len(prev_texts) :]
+        return np.einsum("ij,ij->i", prev_matrix, next_matrix).tolist()
 
     def split(self, text: str, source_uri: str = "", **kwargs) -> list[Chunk]:
         # First, split into sentences
@@ -405,11 +415,8 @@ class SemanticChunker(ChunkingStrategy):
 
         # Find semantic boundaries
         boundaries = [0]
-        for i in range(1, len(sentences)):
-            prev_text = " ".join(sentences[max(0, i - 2) : i])
-            next_text = " ".join(sentences[i : min(len(sentences), i + 2)])
-
-            similarity = self._compute_similarity(prev_text, next_text)
+        similarities = self._compute_boundary_similarities(sentences)
+        for i, similarity in enumerate(similarities, start=1):
             if similarity < self.similarity_threshold:
                 boundaries.append(i)
         boundaries.append(len(sentences))
@@ -21,20 +21,31 @@ class SearchResult:
     rank: int = 0
 
 
-def rrf_fusion(result_lists: list[list[SearchResult]], k: int = 60, limit: int = 50) -> list[SearchResult]:
+def rrf_fusion(
+    result_lists: list[list[SearchResult]],
+    k: int = 60,
+    limit: int = 50,
+    weights: list[float] | None = None,
+) -> list[SearchResult]:
     """
     Reciprocal Rank Fusion 算法
 
-    公式: RRF(d) = Σ (1 / (k + rank(d)))
+    公式: RRF(d) = Σ w_i / (k + rank_i(d))
 
     Args:
         result_lists: 多个检索器的结果列表
         k: 平滑常数 (标准值 60)
         limit: 返回结果数量
+        weights: 各检索器权重，与 result_lists 一一对应 (默认均为 1.0)
 
     Returns:
         融合后的排序结果
     """
+    if weights is None:
+        weights = [1.0] * len(result_lists)
+    elif len(weights) != len(result_lists):
+        raise ValueError("weights must have the same length as result_lists")
+
     # 1. 为每个列表分配排名
     for results in result_lists:
         for rank, result in enumerate(results, start=1):
@@ -43,14 +54,14 @@ def rrf_fusion(result_lists: list[list[SearchResult]], k: int = 60, limit: int =
     # 2. 按 ID 聚合计算 RRF 分数
     rrf_scores: dict[str, tuple[float, SearchResult]] = {}
 
-    for results in result_lists:
+    for weight, results in zip(weights, result_lists, strict=True):
         for result in results:
             if result.id not in rrf_scores:
                 rrf_scores[result.id] = (0.0, result)
 
             current_score, current_result = rrf_scores[result.id]
-            # RRF 公式: 1 / (k + rank)
-            new_score = current_score + 1.0 / (k + result.rank)
+            # RRF 公式: w / (k + rank)
+            new_score = current_score + weight / (k + result.rank)
             rrf_scores[result.id] = (new_score, current_result)
 
     # 3. 按 RRF 分数排序
@@ -1,9 +1,10 @@
 """状态调试面板数据接口"""
 
-import json
 from dataclasses import dataclass
 from typing import Any
 
+from cognizes.core.database import load_jsonb
+
 
 @dataclass
 class StateDebugInfo:
@@ -42,7 +43,7 @@ class StateDebugService:
                 thread_id,
             )
 
-            current_state = json.loads(thread["state"]) if thread else {}
+            current_state = (load_jsonb(thread["state"]) or {}) if thread else {}
 
             # 按前缀分组
             prefix_breakdown: dict[str, dict[str, Any]] = {"session": {}, "user": {}, "app": {}, "temp": {}}
@@ -60,6 +61,6 @@ class StateDebugService:
             return StateDebugInfo(
                 thread_id=thread_id,
                 current_state=current_state,
-                state_history=[{"time": str(h["created_at"]), "delta": json.loads(h["delta"])} for h in history],
+                state_history=[{"time": str(h["created_at"]), "delta": load_jsonb(h["delta"])} for h in history],
                 prefix_breakdown=prefix_breakdown,
             )
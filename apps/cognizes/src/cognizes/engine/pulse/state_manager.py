@@ -104,10 +104,6 @@ class StateManager:
         追加事件并原子性地应用 state_delta
         """
         state_delta = event.actions.get("state_delta", {})
-        new_state = None
-
-        if state_delta:
-            new_state = {**session.state, **state_delta}
 
         event_data = {
             "id": uuid.uuid4(),
@@ -118,7 +114,8 @@ class StateManager:
             "actions": event.actions,
         }
 
-        result = await self.db.events.atomic_append(uuid.UUID(session.id), session.version, new_state, event_data)
+        # 仅下发增量，由数据库在版本校验通过后合并，避免每次写入序列化整份 state
+        result = await self.db.events.atomic_append(uuid.UUID(session.id), session.version, state_delta, event_data)
 
         if result["status"] == "conflict":
             raise ConcurrencyConflictError(
@@ -132,8 +129,8 @@ class StateManager:
 
         if result["version"] is not None:
             session.version = result["version"]
-            if new_state:
-                session.state = new_state
+            if state_delta:
+                session.state = {**session.state, **state_delta}
 
         return event
 
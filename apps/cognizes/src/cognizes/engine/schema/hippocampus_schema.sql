@@ -17,8 +17,8 @@ CREATE TABLE IF NOT EXISTS memories (
     memory_type         VARCHAR(50) NOT NULL DEFAULT 'episodic',    -- CHECK (memory_type IN ('episodic', 'semantic', 'summary'))
     -- 记忆内容
     content             TEXT NOT NULL,
-    -- 向量嵌入 (用于语义检索)
-    embedding           vector(1536),
+    -- 向量嵌入 (用于语义检索; halfvec 半精度存储，内存与索引体积减半，召回损失可忽略)
+    embedding           halfvec(1536),
     -- 元数据 (时间切片、来源事件等)
     metadata            JSONB DEFAULT '{}',
     -- 记忆保持机制 (艾宾浩斯衰减)
@@ -32,10 +32,27 @@ CREATE INDEX IF NOT EXISTS idx_memories_user_app ON memories(user_id, app_name);
 CREATE INDEX IF NOT EXISTS idx_memories_thread ON memories(thread_id);
 CREATE INDEX IF NOT EXISTS idx_memories_retention ON memories(retention_score DESC);
 CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at DESC);
+-- 已部署实例迁移: embedding vector(1536) -> halfvec(1536)
+-- 旧 HNSW 索引的 vector_cosine_ops 不适用于 halfvec，需先删除再由下方语句重建
+DO $$
+BEGIN
+    IF (SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+        WHERE attrelid = 'memories'::regclass AND attname = 'embedding') = 'vector(1536)' THEN
+        DROP INDEX IF EXISTS idx_memories_embedding;
+        ALTER TABLE memories ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+    END IF;
+END $$;
 -- HNSW 向量索引 (用于语义检索)
+-- 面向 100K+ 规模的 Agent 记忆：m=24 / ef_construction=128 较默认值 (16/64) 召回更高，
+-- 查询侧 hnsw.ef_search 由 MemoryRepository.search_vector 按行数自适应设置
+-- 已部署实例的旧索引不会被 IF NOT EXISTS 改写，需执行 migrations/001_rebuild_memories_hnsw.sql
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 7;
 CREATE INDEX IF NOT EXISTS idx_memories_embedding
-    ON memories USING hnsw (embedding vector_cosine_ops)
-    WITH (m = 16, ef_construction = 64);
+    ON memories USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = 24, ef_construction = 128);
+RESET maintenance_work_mem;
+RESET max_parallel_maintenance_workers;
 -- 复合索引 (情景分块检索)
 CREATE INDEX IF NOT EXISTS idx_memories_time_bucket
     ON memories(user_id, app_name, created_at DESC);
@@ -114,6 +131,24 @@ CREATE TABLE IF NOT EXISTS instructions (
 CREATE INDEX IF NOT EXISTS idx_instructions_app ON instructions(app_name);
 CREATE INDEX IF NOT EXISTS idx_instructions_key ON instructions(instruction_key);
 
+-- ============================================
+-- 4.1 embedding_cache 表 (向量化结果缓存)
+-- ============================================
+-- content_hash: 原文 SHA-256；normalized_hash: 小写化、去标点、折叠空白后的 SHA-256，
+-- 使仅有大小写/标点差异的内容复用已有向量，避免重复调用 Embedding 模型
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    provider            VARCHAR(100) NOT NULL,
+    model               VARCHAR(255) NOT NULL,
+    content_hash        BYTEA NOT NULL,
+    normalized_hash     BYTEA NOT NULL,
+    embedding           halfvec(1536) NOT NULL,
+    created_at          TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (provider, model, content_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_normalized
+    ON embedding_cache(provider, model, normalized_hash);
+
 -- ============================================
 -- 5. SQL 函数: 艾宾浩斯衰减计算 (Ebbinghaus Decay)
 -- ============================================
@@ -200,7 +235,7 @@ BEGIN
     SELECT
         'memory'::VARCHAR(50) AS context_type,
         m.content,
-        (1 - (m.embedding <=> p_query_embedding)) * m.retention_score AS relevance_score,
+        (1 - (m.embedding <=> p_query_embedding::halfvec(1536))) * m.retention_score AS relevance_score,
         (LENGTH(m.content) / 4)::INTEGER AS token_estimate  -- 粗略估算
     FROM memories m
     WHERE m.user_id = p_user_id
@@ -0,0 +1,38 @@
+-- 迁移 001: 以 m=24 / ef_construction=128 重建 memories HNSW 索引
+--
+-- hippocampus_schema.sql 中的 CREATE INDEX IF NOT EXISTS 对已部署实例是 no-op，
+-- 旧索引 (默认 m=16 / ef_construction=64) 会一直保留。本迁移仅在参数不符时重建：
+-- 先以临时名 CONCURRENTLY 构建新索引 (不阻塞写入)，再在短事务内替换旧索引。
+--
+-- CREATE/DROP INDEX CONCURRENTLY 不能在事务块内执行，须以 psql 自动提交模式运行 (勿加 -1)：
+--   psql -d 'cognizes-engine' -f src/cognizes/engine/schema/migrations/001_rebuild_memories_hnsw.sql
+-- 可重复执行：参数已符合时跳过。
+
+\set ON_ERROR_STOP on
+
+SELECT NOT EXISTS (
+    SELECT 1 FROM pg_class
+    WHERE relname = 'idx_memories_embedding'
+      AND relkind = 'i'
+      AND reloptions @> ARRAY['m=24', 'ef_construction=128']
+) AS needs_rebuild \gset
+
+\if :needs_rebuild
+    -- 清理上次中断遗留的 INVALID 临时索引
+    DROP INDEX CONCURRENTLY IF EXISTS idx_memories_embedding_rebuild;
+
+    SET maintenance_work_mem = '2GB';
+    SET max_parallel_maintenance_workers = 7;
+    CREATE INDEX CONCURRENTLY idx_memories_embedding_rebuild
+        ON memories USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128);
+    RESET maintenance_work_mem;
+    RESET max_parallel_maintenance_workers;
+
+    BEGIN;
+    DROP INDEX IF EXISTS idx_memories_embedding;
+    ALTER INDEX idx_memories_embedding_rebuild RENAME TO idx_memories_embedding;
+    COMMIT;
+\else
+    \echo 'idx_memories_embedding already uses m=24 / ef_construction=128, skipping'
+\endif
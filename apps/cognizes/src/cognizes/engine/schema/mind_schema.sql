@@ -46,9 +46,67 @@ CREATE TABLE IF NOT EXISTS tool_executions (
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- traces_events: Span 事件，按 (trace_id, span_id) 关联 traces，idx 为事件在 Span 内的顺序
+CREATE TABLE IF NOT EXISTS traces_events (
+    trace_id            VARCHAR(32) NOT NULL,
+    span_id             VARCHAR(16) NOT NULL,
+    idx                 INTEGER NOT NULL,
+    name                VARCHAR(255) NOT NULL,
+    ts                  TIMESTAMP WITH TIME ZONE NOT NULL,
+    attributes          JSONB DEFAULT '{}',
+    PRIMARY KEY (trace_id, span_id, idx)
+);
+
+-- 已部署实例迁移: traces.events (JSONB 数组) -> traces_events 子表
+-- 旧列中的事件回填到 traces_events 后删除该列，事件时间戳为 Unix 纳秒
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = current_schema() AND table_name = 'traces' AND column_name = 'events') THEN
+        INSERT INTO traces_events (trace_id, span_id, idx, name, ts, attributes)
+        SELECT t.trace_id, t.span_id, (e.ord - 1)::int, e.value->>'name',
+               to_timestamp((e.value->>'timestamp')::numeric / 1e9),
+               COALESCE(e.value->'attributes', '{}'::jsonb)
+        FROM traces t
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(t.events) = 'array' THEN t.events ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS e(value, ord)
+        ON CONFLICT DO NOTHING;
+        ALTER TABLE traces DROP COLUMN IF EXISTS events;
+    END IF;
+END $$;
+
+-- 已部署实例迁移 (1/2): 非分区 traces 表 / 旧 DEFAULT 分区 -> traces_legacy
+-- CREATE TABLE IF NOT EXISTS 不会改写已存在的普通表；先将其改名并释放主键与索引名，
+-- 由下方建好分区表、预建覆盖旧数据的日分区后回填 (迁移 2/2)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE oid = to_regclass('traces') AND relkind = 'r') THEN
+        ALTER TABLE traces RENAME TO traces_legacy;
+        ALTER TABLE traces_legacy RENAME CONSTRAINT traces_pkey TO traces_legacy_pkey;
+        DROP INDEX IF EXISTS idx_traces_run_id, idx_traces_trace_id, idx_traces_start_time;
+    ELSIF to_regclass('traces_default') IS NOT NULL THEN
+        -- 兜底分区会吸收超出预建范围的行，导致之后覆盖该范围的分区无法创建，已弃用
+        ALTER TABLE traces DETACH PARTITION traces_default;
+        IF to_regclass('traces_legacy') IS NULL THEN
+            ALTER TABLE traces_default RENAME TO traces_legacy;
+        ELSE
+            INSERT INTO traces_legacy (id, run_id, trace_id, span_id, parent_span_id, operation_name, span_kind,
+                                       attributes, start_time, end_time, duration_ns, status_code, status_message,
+                                       created_at)
+            SELECT id, run_id, trace_id, span_id, parent_span_id, operation_name, span_kind,
+                   attributes, start_time, end_time, duration_ns, status_code, status_message, created_at
+            FROM traces_default;
+            DROP TABLE traces_default;
+        END IF;
+    END IF;
+END $$;
+
 -- traces: OpenTelemetry Trace 结构化存储
+-- 仅追加写入且按 start_time 近似单调递增：按天范围分区，写入只落在当天的热分区，
+-- 过期数据以 DROP 分区整体清理；分区表主键须包含分区键
 CREATE TABLE IF NOT EXISTS traces (
-    id                  UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id                  UUID NOT NULL DEFAULT gen_random_uuid(),
     run_id              UUID, -- REFERENCES runs(id) ON DELETE CASCADE,
 
     -- OpenTelemetry 标识
@@ -61,9 +119,8 @@ CREATE TABLE IF NOT EXISTS traces (
     span_kind           VARCHAR(20) NOT NULL DEFAULT 'INTERNAL',
     -- CHECK (span_kind IN ('INTERNAL', 'SERVER', 'CLIENT', 'PRODUCER', 'CONSUMER'))
 
-    -- 属性与事件
+    -- 属性 (事件见 traces_events)
     attributes          JSONB DEFAULT '{}',
-    events              JSONB DEFAULT '[]',
 
     -- 时间信息
     start_time          TIMESTAMP WITH TIME ZONE NOT NULL,
@@ -76,12 +133,96 @@ CREATE TABLE IF NOT EXISTS traces (
     status_message      TEXT,
 
     -- 创建时间
-    created_at          TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-);
+    created_at          TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (id, start_time)
+) PARTITION BY RANGE (start_time);
+
+-- 不设 DEFAULT 分区：超出预建范围的写入直接报错，由 PostgresSpanExporter 计入丢弃并告警；
+-- 分区由 PostgresSpanExporter 每天首次写入前调用 create_traces_partitions() 预建
 
 CREATE INDEX IF NOT EXISTS idx_traces_run_id ON traces(run_id);
 CREATE INDEX IF NOT EXISTS idx_traces_trace_id ON traces(trace_id);
-CREATE INDEX IF NOT EXISTS idx_traces_start_time ON traces(start_time DESC);
+-- start_time 与物理写入顺序高度相关，BRIN 索引体积极小且几乎不增加写入开销
+CREATE INDEX IF NOT EXISTS idx_traces_start_time_brin ON traces USING BRIN (start_time) WITH (pages_per_range = 32);
+
+-- 预建 traces 日分区 (p_from 起至今天后 p_days_ahead 天)，已存在的分区跳过；
+-- 默认从昨天开始，跨零点的 Span 不会因缺分区而写入失败
+DROP FUNCTION IF EXISTS create_traces_partitions(INTEGER);
+CREATE OR REPLACE FUNCTION create_traces_partitions(
+    p_days_ahead INTEGER DEFAULT 7,
+    p_from DATE DEFAULT CURRENT_DATE - 1
+)
+RETURNS INTEGER AS $$
+DECLARE
+    day DATE;
+    partition_name TEXT;
+    created_count INTEGER := 0;
+BEGIN
+    FOR i IN 0..(CURRENT_DATE + p_days_ahead - p_from) LOOP
+        day := p_from + i;
+        partition_name := 'traces_' || to_char(day, 'YYYYMMDD');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF traces FOR VALUES FROM (%L) TO (%L)',
+                partition_name, day::timestamptz, (day + 1)::timestamptz
+            );
+            created_count := created_count + 1;
+        END IF;
+    END LOOP;
+    RETURN created_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 删除早于 p_retention_days 天的 traces 日分区
+CREATE OR REPLACE FUNCTION drop_traces_partitions(
+    p_retention_days INTEGER DEFAULT 30
+)
+RETURNS INTEGER AS $$
+DECLARE
+    part RECORD;
+    dropped_count INTEGER := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'traces'::regclass
+          AND c.relname ~ '^traces_[0-9]{8}$'
+          AND to_date(substring(c.relname FROM 8), 'YYYYMMDD') < CURRENT_DATE - p_retention_days
+    LOOP
+        EXECUTE format('DROP TABLE %I', part.relname);
+        dropped_count := dropped_count + 1;
+    END LOOP;
+    RETURN dropped_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 已部署实例迁移 (2/2): 预建覆盖旧数据时间范围的日分区，回填 traces_legacy 后删除
+-- 旧数据量大时本步骤为一个长事务，建议在低峰期执行
+DO $$
+DECLARE
+    first_day DATE;
+    last_day DATE;
+BEGIN
+    IF to_regclass('traces_legacy') IS NOT NULL THEN
+        SELECT min(start_time)::date, max(start_time)::date INTO first_day, last_day FROM traces_legacy;
+        IF first_day IS NOT NULL THEN
+            PERFORM create_traces_partitions(GREATEST(last_day - CURRENT_DATE, 7), LEAST(first_day, CURRENT_DATE - 1));
+        END IF;
+        INSERT INTO traces (id, run_id, trace_id, span_id, parent_span_id, operation_name, span_kind,
+                            attributes, start_time, end_time, duration_ns, status_code, status_message, created_at)
+        SELECT id, run_id, trace_id, span_id, parent_span_id, operation_name, span_kind,
+               attributes, start_time, end_time, duration_ns, status_code, status_message, created_at
+        FROM traces_legacy;
+        DROP TABLE traces_legacy;
+    END IF;
+END $$;
+
+SELECT create_traces_partitions();
+
+-- 过期分区清理需定期执行 (分区预建已由 PostgresSpanExporter 负责)，例如 pg_cron:
+-- SELECT cron.schedule('traces_partitions', '0 1 * * *', $$SELECT drop_traces_partitions(30)$$);
 
 -- sandbox_executions: 沙箱执行记录
 CREATE TABLE IF NOT EXISTS sandbox_executions (
@@ -182,13 +182,13 @@ BEGIN
         SELECT
             m.id,
             m.content,
-            1 - (m.embedding <=> p_query_embedding) AS score,
+            1 - (m.embedding <=> p_query_embedding::halfvec(1536)) AS score,
             m.metadata
         FROM memories m
         WHERE m.user_id = p_user_id
           AND m.app_name = p_app_name
           AND (p_metadata_filter IS NULL OR m.metadata @> p_metadata_filter)
-        ORDER BY m.embedding <=> p_query_embedding
+        ORDER BY m.embedding <=> p_query_embedding::halfvec(1536)
         LIMIT p_limit * 2  -- 召回 2 倍用于融合
     ),
     -- 2. 关键词检索 (BM25)
@@ -260,10 +260,10 @@ BEGIN
     semantic_ranked AS (
         SELECT
             m.id, m.content, m.metadata,
-            ROW_NUMBER() OVER (ORDER BY m.embedding <=> p_query_embedding) AS rank
+            ROW_NUMBER() OVER (ORDER BY m.embedding <=> p_query_embedding::halfvec(1536)) AS rank
         FROM memories m
         WHERE m.user_id = p_user_id AND m.app_name = p_app_name
-        ORDER BY m.embedding <=> p_query_embedding
+        ORDER BY m.embedding <=> p_query_embedding::halfvec(1536)
         LIMIT p_limit * 3
     ),
     -- 2. 关键词检索 + 排名
@@ -18,11 +18,18 @@ from cognizes.core.database import DatabaseManager
 
 async def get_db_pool():
     """获取数据库连接池 - 通过 DatabaseManager 统一管理"""
-    db = DatabaseManager.get_instance(dsn=config.database_url)
+    # Agent 服务热路径: 预建全部连接且常驻，保留 prepared statement 缓存；单条语句 30s 超时
+    db = DatabaseManager.get_instance(
+        dsn=config.database_url,
+        min_pool_size=10,
+        max_pool_size=10,
+        max_inactive_connection_lifetime=0,
+        command_timeout=30.0,
+    )
     return await db.get_pool()
 
 
-async def embed_text(text: str) -> list[float]:
+async def embed_texts(texts: list[str]) -> list[list[float]]:
     import httpx
 
     # 优先使用配置的 base_url，否则 fallback 到 curl 示例中的 default
@@ -47,8 +54,8 @@ async def embed_text(text: str) -> list[float]:
 
     headers = {"Authorization": f"Bearer {config.google_api_key}", "Content-Type": "application/json"}
 
-    # Vertex AI Predict Format
-    payload = {"instances": [{"content": text}]}
+    # Vertex AI Predict Format (单次请求批量提交)
+    payload = {"instances": [{"content": text} for text in texts]}
 
     try:
         async with httpx.AsyncClient() as client:
@@ -63,18 +70,15 @@ async def embed_text(text: str) -> list[float]:
             # Or sometimes simpler depending on model. checking standard structure.
             # text-embedding-004/005 usually: predictions[0]['embeddings']['values']
 
-            embeddings = data["predictions"][0]["embeddings"]["values"]
+            embeddings = [prediction["embeddings"]["values"] for prediction in data["predictions"]]
 
             # Fix dimension mismatch (768 -> 1536) for existing DB schema
-            if len(embeddings) == 768:
-                embeddings = embeddings + [0.0] * 768
-
-            return embeddings
+            return [values + [0.0] * 768 if len(values) == 768 else values for values in embeddings]
 
     except Exception as e:
-        print(f"⚠️ Embedding Manual Call failed for text: {text[:20]}... using MOCK. Error: {e}")
+        print(f"⚠️ Embedding Manual Call failed for {len(texts)} texts... using MOCK. Error: {e}")
         # Ultimate Fallback if even manual call fails
-        return [0.1] * 1536
+        return [[0.1] * 1536 for _ in texts]
 
 
 async def create_services() -> tuple:
@@ -116,7 +120,7 @@ async def create_services() -> tuple:
 
         # 创建服务实例
         session_service = PostgresSessionService(pool=pool)
-        memory_service = PostgresMemoryService(pool=pool, embedding_fn=embed_text)
+        memory_service = PostgresMemoryService(pool=pool, embedding_fn=embed_texts)
 
     else:
         raise ValueError(f"Unknown backend type: {config.backend}")
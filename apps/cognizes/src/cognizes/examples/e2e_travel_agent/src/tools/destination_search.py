@@ -39,5 +39,5 @@ async def recommend_destinations(preferences: str) -> list[dict]:
 
 async def _get_embedding(text: str) -> list[float]:
     """获取文本 Embedding（占位，实际调用 Gemini API）"""
-    # 实际实现参考 services.py 中的 embed_text 函数
+    # 实际实现参考 services.py 中的 embed_texts 函数
     return [0.0] * 768  # 占位向量
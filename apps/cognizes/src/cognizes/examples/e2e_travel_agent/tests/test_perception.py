@@ -21,7 +21,7 @@ class TestPerceptionValidation:
         """Mock embedding function to ensure deterministic semantic search results"""
         import services
 
-        async def mock_embed_text(text: str) -> list[float]:
+        def embed_one(text: str) -> list[float]:
             # Deterministic semantic mock
             vec = [0.1] * 1536
             if "海" in text or "轻松" in text or "度假" in text:
@@ -32,7 +32,10 @@ class TestPerceptionValidation:
                 vec[2] = 0.9  # High dimension 2 for City
             return vec
 
-        monkeypatch.setattr(services, "embed_text", mock_embed_text)
+        async def mock_embed_texts(texts: list[str]) -> list[list[float]]:
+            return [embed_one(text) for text in texts]
+
+        monkeypatch.setattr(services, "embed_texts", mock_embed_texts)
 
     @pytest.fixture
     async def seeded_memories(self):
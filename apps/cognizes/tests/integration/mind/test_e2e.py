@@ -15,11 +15,16 @@ pytestmark = pytest.mark.asyncio
 class TestE2EIntegration:
     """端到端集成测试"""
 
-    async def test_complete_conversation_flow(self, db_pool):
+    @pytest.fixture
+    async def tool_registry(self, db_pool):
+        """工具注册表 (关闭时落库剩余调用统计)"""
+        async with ToolRegistry(pool=db_pool, app_name="test_app") as registry:
+            yield registry
+
+    async def test_complete_conversation_flow(self, tool_registry, db_pool):
         """测试完整对话流程"""
         session_svc = PostgresSessionService(pool=db_pool)
         memory_svc = PostgresMemoryService(pool=db_pool)
-        tool_registry = ToolRegistry(pool=db_pool, app_name="test_app")
 
         # 1. 创建会话
         session = await session_svc.create_session(app_name="test_app", user_id="e2e_user")
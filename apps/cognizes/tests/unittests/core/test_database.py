@@ -5,6 +5,7 @@ DatabaseManager 单元测试
 - 初始化与配置
 - 单例模式
 - DSN 解析
+- jsonb 二进制 codec
 """
 
 import os
@@ -12,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from cognizes.core.database import DatabaseManager
+from cognizes.core.database import DatabaseManager, _decode_jsonb, _encode_jsonb, load_jsonb
 
 
 class TestDatabaseManagerInitialization:
@@ -102,6 +103,43 @@ class TestPoolManagement:
             assert pool is mock_pool
             mock_create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_pool_keeps_statement_cache_alive(self):
+        """测试连接池默认配置 prepared statement 缓存与空闲连接存活时间，且不限制语句超时"""
+        db = DatabaseManager(dsn="postgresql://test@localhost/testdb", enable_pgvector=False)
+
+        mock_create = AsyncMock(return_value=MagicMock())
+        with patch("asyncpg.create_pool", mock_create):
+            await db.get_pool()
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["statement_cache_size"] == 1024
+        assert kwargs["max_inactive_connection_lifetime"] == 3600.0
+        assert kwargs["min_size"] == 2
+        assert kwargs["command_timeout"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_instance_passes_pool_options(self):
+        """测试热路径调用方可通过 get_instance 开启预建常驻连接与语句超时"""
+        DatabaseManager.reset_instance()
+        db = DatabaseManager.get_instance(
+            dsn="postgresql://test@localhost/testdb",
+            min_pool_size=10,
+            max_inactive_connection_lifetime=0,
+            command_timeout=30.0,
+            enable_pgvector=False,
+        )
+
+        mock_create = AsyncMock(return_value=MagicMock())
+        with patch("asyncpg.create_pool", mock_create):
+            await db.get_pool()
+        DatabaseManager.reset_instance()
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["min_size"] == kwargs["max_size"] == 10
+        assert kwargs["max_inactive_connection_lifetime"] == 0
+        assert kwargs["command_timeout"] == 30.0
+
     @pytest.mark.asyncio
     async def test_get_pool_reuses_existing_pool(self):
         """测试 get_pool 复用现有连接池"""
@@ -202,6 +240,27 @@ class TestBasicOperations:
             result = await db.fetchval("SELECT COUNT(*) FROM test")
             assert result == 42
 
+    @pytest.mark.asyncio
+    async def test_vector_search_binds_limit(self):
+        """测试 vector_search 的 LIMIT 作为参数绑定，语句文本与 limit 无关"""
+        db = DatabaseManager(dsn="postgresql://test@localhost/testdb", enable_pgvector=False)
+
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = []
+
+        mock_pool = MagicMock()
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_create = AsyncMock(return_value=mock_pool)
+        with patch("asyncpg.create_pool", mock_create):
+            await db.vector_search("memories", [0.1, 0.2], filters={"user_id": "u1"}, limit=5)
+            await db.vector_search("memories", [0.1, 0.2], filters={"user_id": "u1"}, limit=20)
+
+        (query_a, *args_a), (query_b, *args_b) = (c.args for c in mock_conn.fetch.call_args_list)
+        assert query_a == query_b
+        assert "LIMIT $3" in query_a
+        assert args_a == [[0.1, 0.2], "u1", 5]
+        assert args_b[-1] == 20
+
 
 class TestSyncOperations:
     """同步操作测试"""
@@ -224,3 +283,38 @@ class TestSyncOperations:
 
             mock_cursor.execute.assert_called_once()
             mock_conn.commit.assert_called_once()
+
+
+class TestJsonbCodec:
+    """jsonb 二进制 codec 测试"""
+
+    def test_encode_object_roundtrip(self):
+        data = {"key": "值", "nested": [1, 2.5, None]}
+        encoded = _encode_jsonb(data)
+        assert encoded[:1] == b"\x01"
+        assert _decode_jsonb(encoded) == data
+
+    def test_encode_str_is_treated_as_json_text(self):
+        """已序列化的 JSON 文本原样写入，兼容 orjson.dumps(...).decode() 的调用方"""
+        assert _decode_jsonb(_encode_jsonb('{"a": 1}')) == {"a": 1}
+
+    def test_load_jsonb_accepts_decoded_and_text(self):
+        assert load_jsonb({"a": 1}) == {"a": 1}
+        assert load_jsonb('{"a": 1}') == {"a": 1}
+        assert load_jsonb(None) is None
+
+    @pytest.mark.asyncio
+    async def test_pool_init_registers_jsonb_codec(self):
+        """连接初始化回调注册 jsonb 二进制 codec"""
+        DatabaseManager.reset_instance()
+        db = DatabaseManager(dsn="postgresql://test@localhost/testdb", enable_pgvector=False)
+
+        mock_create = AsyncMock(return_value=MagicMock())
+        with patch("asyncpg.create_pool", mock_create):
+            await db.get_pool()
+
+        conn = AsyncMock()
+        await mock_create.call_args.kwargs["init"](conn)
+        conn.set_type_codec.assert_called_once()
+        assert conn.set_type_codec.call_args.args == ("jsonb",)
+        assert conn.set_type_codec.call_args.kwargs["format"] == "binary"
@@ -0,0 +1,95 @@
+"""
+MemoryRepository 单元测试
+
+测试范围：纯逻辑测试，Mock 数据库连接
+- HNSW ef_search 自适应配置
+- embedding_cache 内容哈希
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cognizes.core.repositories.embedding_cache import content_hash, normalized_content_hash
+from cognizes.core.repositories.memory import EF_SEARCH_MAX, MemoryRepository, resolve_ef_search
+
+
+def _mock_db(conn):
+    """构造返回指定连接的 DatabaseManager Mock"""
+    acm = AsyncMock()
+    acm.__aenter__.return_value = conn
+    acm.__aexit__.return_value = None
+
+    tx = AsyncMock()
+    tx.__aenter__.return_value = None
+    tx.__aexit__.return_value = None
+    conn.transaction = MagicMock(return_value=tx)
+
+    pool = MagicMock()
+    pool.acquire.return_value = acm
+
+    db = MagicMock()
+    db.get_pool = AsyncMock(return_value=pool)
+    return db
+
+
+class TestResolveEfSearch:
+    """ef_search 自适应表测试"""
+
+    def test_small_table_uses_default(self):
+        assert resolve_ef_search(0) == 40
+
+    def test_scales_with_row_count(self):
+        assert resolve_ef_search(50_000) == 64
+        assert resolve_ef_search(500_000) == 100
+
+    def test_large_table_uses_max(self):
+        assert resolve_ef_search(5_000_000) == EF_SEARCH_MAX
+
+
+class TestSearchVector:
+    """search_vector 测试"""
+
+    @pytest.mark.asyncio
+    async def test_explicit_ef_search_is_set_locally(self):
+        """显式 ef_search 通过 set_config(..., true) 限定在事务内"""
+        conn = AsyncMock()
+        conn.fetch = AsyncMock(return_value=[])
+        repo = MemoryRepository(_mock_db(conn))
+
+        await repo.search_vector("u1", "app", [0.1, 0.2], ef_search=128)
+
+        conn.fetchval.assert_not_called()
+        set_sql, value = conn.execute.call_args[0]
+        assert "set_config('hnsw.ef_search'" in set_sql
+        assert value == "128"
+        # halfvec 列需显式转换查询向量，才能命中 halfvec_cosine_ops 索引
+        assert "<=> $1::halfvec" in conn.fetch.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_auto_ef_search_from_reltuples(self):
+        """未指定 ef_search 时按 pg_class.reltuples 推导，并缓存结果"""
+        conn = AsyncMock()
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(return_value=250_000.0)
+        repo = MemoryRepository(_mock_db(conn))
+
+        await repo.search_vector("u1", "app", [0.1, 0.2])
+        await repo.search_vector("u1", "app", [0.1, 0.2])
+
+        conn.fetchval.assert_called_once()
+        assert conn.execute.call_args[0][1] == "100"
+
+
+class TestEmbeddingCacheHash:
+    """embedding_cache 内容哈希测试"""
+
+    def test_content_hash_is_exact(self):
+        assert content_hash("Hello, World") != content_hash("hello world")
+
+    def test_normalized_hash_ignores_case_punctuation_and_whitespace(self):
+        assert normalized_content_hash("Hello, World!") == normalized_content_hash("hello   world")
+        assert normalized_content_hash("我住在北京。") == normalized_content_hash("我住在北京")
+
+    def test_normalized_hash_keeps_words(self):
+        assert normalized_content_hash("hello world") != normalized_content_hash("hello word")
@@ -29,6 +29,12 @@ class MockSession:
     events: list
 
 
+async def _async_rows(rows):
+    """模拟服务端游标逐行产出"""
+    for row in rows:
+        yield row
+
+
 class TestPostgresMemoryService:
     """MemoryService 单元测试套件"""
 
@@ -37,6 +43,7 @@ class TestPostgresMemoryService:
         """Mock DatabaseManager with repositories"""
         db = MagicMock()
         db.memories = AsyncMock()
+        db.embedding_cache = AsyncMock()
         return db
 
     @pytest.fixture
@@ -96,6 +103,45 @@ class TestPostgresMemoryService:
         # 验证: 无消息时不应插入
         mock_db.memories.insert.assert_not_called()
 
+    async def test_add_session_reuses_cached_embedding(self, mock_db):
+        """命中 embedding_cache 时不调用 Embedding 模型"""
+        from cognizes.adapters.postgres.memory_service import PostgresMemoryService
+
+        mock_embedding_fn = AsyncMock()
+        mock_db.embedding_cache.lookup.return_value = [0.2] * 8
+        service = PostgresMemoryService(db=mock_db, embedding_fn=mock_embedding_fn, embedding_model="m1")
+        session = MockSession(
+            id=str(uuid.uuid4()),
+            app_name="test_app",
+            user_id="user_008",
+            events=[SimpleNamespace(author="user", content="我喜欢喝咖啡")],
+        )
+
+        await service.add_session_to_memory(session)
+
+        mock_db.embedding_cache.lookup.assert_called_once_with("custom", "m1", "我喜欢喝咖啡")
+        mock_embedding_fn.assert_not_called()
+        mock_db.embedding_cache.store.assert_not_called()
+        assert mock_db.memories.insert.call_args.kwargs["embedding"] == [0.2] * 8
+
+    async def test_add_session_embeds_and_stores_on_cache_miss(self, mock_db):
+        """未命中 embedding_cache 时调用模型并回写缓存"""
+        from cognizes.adapters.postgres.memory_service import PostgresMemoryService
+
+        mock_db.embedding_cache.lookup.return_value = None
+        service = PostgresMemoryService(db=mock_db, embedding_fn=AsyncMock(return_value=[[0.3] * 8]))
+        session = MockSession(
+            id=str(uuid.uuid4()),
+            app_name="test_app",
+            user_id="user_009",
+            events=[SimpleNamespace(author="user", content="我住在北京")],
+        )
+
+        await service.add_session_to_memory(session)
+
+        mock_db.embedding_cache.store.assert_called_once_with("custom", "default", "我住在北京", [0.3] * 8)
+        assert mock_db.memories.insert.call_args.kwargs["embedding"] == [0.3] * 8
+
     async def test_add_session_with_consolidation_worker(self, mock_db):
         """测试使用 Phase 2 consolidation_worker"""
         from cognizes.adapters.postgres.memory_service import PostgresMemoryService
@@ -170,7 +216,7 @@ class TestPostgresMemoryService:
         from cognizes.adapters.postgres.memory_service import PostgresMemoryService
 
         # 模拟 embedding 函数
-        mock_embedding_fn = AsyncMock(return_value=[0.1] * 384)
+        mock_embedding_fn = AsyncMock(return_value=[[0.1] * 384])
 
         mock_db.memories.search_vector.return_value = [
             {
@@ -182,15 +228,51 @@ class TestPostgresMemoryService:
             }
         ]
 
+        mock_db.memories.search_fulltext.return_value = []
+
         service = PostgresMemoryService(db=mock_db, embedding_fn=mock_embedding_fn)
 
         response = await service.search_memory(app_name="test_app", user_id="user_004", query="测试向量")
 
         # 验证 embedding 被调用
-        mock_embedding_fn.assert_called_once_with("测试向量")
+        mock_embedding_fn.assert_called_once_with(["测试向量"])
         mock_db.memories.search_vector.assert_called_once()
         assert len(response.memories) == 1
 
+    async def test_search_memory_hybrid_rrf_fusion(self, mock_db):
+        """测试向量 + BM25 并发检索并以加权 RRF 融合"""
+        import json
+
+        from cognizes.adapters.postgres.memory_service import PostgresMemoryService
+
+        shared_id, vector_only_id, keyword_only_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        def row(memory_id, content, score):
+            return {
+                "id": memory_id,
+                "content": content,
+                "metadata": json.dumps({}),
+                "relevance_score": score,
+                "created_at": datetime(2024, 1, 1, 12, 0, 0),
+            }
+
+        mock_db.memories.search_vector.return_value = [
+            row(vector_only_id, "语义命中", 0.9),
+            row(shared_id, "两路命中", 0.8),
+        ]
+        mock_db.memories.search_fulltext.return_value = [
+            row(shared_id, "两路命中", 0.5),
+            row(keyword_only_id, "关键词命中", 0.4),
+        ]
+
+        service = PostgresMemoryService(db=mock_db, embedding_fn=AsyncMock(return_value=[[0.1] * 8]))
+        response = await service.search_memory(app_name="test_app", user_id="user_007", query="命中")
+
+        mock_db.memories.search_fulltext.assert_called_once()
+        ids = [m.id for m in response.memories]
+        # 两路都命中的记忆排第一；仅语义命中的因权重更高排在仅关键词命中之前
+        assert ids == [str(shared_id), str(vector_only_id), str(keyword_only_id)]
+
     # ========== list_memories 测试 ==========
 
     async def test_list_memories(self, mock_db):
@@ -199,8 +281,8 @@ class TestPostgresMemoryService:
 
         from cognizes.adapters.postgres.memory_service import PostgresMemoryService
 
-        # 模拟 Repository 返回
-        mock_db.memories.list_recent.return_value = [
+        # 模拟 Repository 游标返回
+        rows = [
             {
                 "id": uuid.uuid4(),
                 "content": "记忆1",
@@ -216,13 +298,14 @@ class TestPostgresMemoryService:
                 "created_at": datetime(2024, 1, 1, 12, 5, 0),
             },
         ]
+        mock_db.memories.iter_recent = MagicMock(return_value=_async_rows(rows))
 
         service = PostgresMemoryService(db=mock_db)
 
-        memories = await service.list_memories(app_name="test_app", user_id="user_005")
+        memories = await service.list_memories_all(app_name="test_app", user_id="user_005")
 
         # 验证
-        mock_db.memories.list_recent.assert_called_once()
+        mock_db.memories.iter_recent.assert_called_once()
         assert len(memories) == 2
         assert memories[0].content.parts[0].text == "记忆1"
 
@@ -230,10 +313,128 @@ class TestPostgresMemoryService:
         """测试列出记忆带限制"""
         from cognizes.adapters.postgres.memory_service import PostgresMemoryService
 
-        mock_db.memories.list_recent.return_value = []
+        mock_db.memories.iter_recent = MagicMock(return_value=_async_rows([]))
         service = PostgresMemoryService(db=mock_db)
 
-        await service.list_memories(app_name="test_app", user_id="user_006", limit=50)
+        await service.list_memories_all(app_name="test_app", user_id="user_006", limit=50)
 
         # 验证
-        mock_db.memories.list_recent.assert_called_with("user_006", "test_app", 50)
+        mock_db.memories.iter_recent.assert_called_with("user_006", "test_app", 50)
+
+    async def test_list_memories_yields_lazily(self, mock_db):
+        """测试流式列出记忆: 调用方只取第一条时不会消费剩余行"""
+        from cognizes.adapters.postgres.memory_service import PostgresMemoryService
+
+        consumed = []
+
+        async def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield {
+                    "id": uuid.uuid4(),
+                    "content": f"记忆{i}",
+                    "metadata": None,
+                    "retention_score": 1.0,
+                    "created_at": datetime(2024, 1, 1, 12, 0, 0),
+                }
+
+        mock_db.memories.iter_recent = MagicMock(return_value=rows())
+        service = PostgresMemoryService(db=mock_db)
+
+        stream = service.list_memories(app_name="test_app", user_id="user_007")
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first.content.parts[0].text == "记忆0"
+        assert consumed == [0]
+
+
+class TestEmbeddingBatcher:
+    """向量化请求合并器测试"""
+
+    async def test_concurrent_requests_coalesce_into_one_call(self):
+        """窗口期内的并发请求合并为一次批量调用"""
+        import asyncio
+
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        embedding_fn = AsyncMock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+        batcher = EmbeddingBatcher(embedding_fn, window_seconds=0.01)
+
+        results = await asyncio.gather(batcher.embed("a"), batcher.embed("bb"), batcher.embed("ccc"))
+
+        embedding_fn.assert_called_once_with(["a", "bb", "ccc"])
+        assert results == [[1.0], [2.0], [3.0]]
+
+    async def test_flushes_at_max_batch_size(self):
+        """批量达到上限时按上限切分"""
+        import asyncio
+
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        embedding_fn = AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts])
+        batcher = EmbeddingBatcher(embedding_fn, window_seconds=10, max_batch_size=2)
+
+        await asyncio.wait_for(asyncio.gather(*(batcher.embed(str(i)) for i in range(3))), timeout=1)
+
+        assert [call.args[0] for call in embedding_fn.call_args_list] == [["0", "1"], ["2"]]
+
+    async def test_provider_error_propagates_to_waiters(self):
+        """批量调用失败时所有等待方收到同一异常"""
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(AsyncMock(side_effect=RuntimeError("provider down")), window_seconds=0)
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            await batcher.embed("a")
+
+    async def test_vector_count_mismatch_fails_batch(self):
+        """provider 返回向量数与输入不符时整批失败，后续批次照常处理"""
+        import asyncio
+
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        embedding_fn = AsyncMock(side_effect=[[[0.0]], [[1.0]]])
+        batcher = EmbeddingBatcher(embedding_fn, window_seconds=10, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.embed(str(i)) for i in range(3)), return_exceptions=True), timeout=1
+        )
+
+        assert isinstance(results[0], ValueError)
+        assert isinstance(results[1], ValueError)
+        assert results[2] == [1.0]
+
+    async def test_cancelled_flush_fails_pending_waiters(self):
+        """刷新任务被取消时等待方收到异常而非永久挂起"""
+        import asyncio
+
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(AsyncMock(), window_seconds=10)
+        waiter = asyncio.create_task(batcher.embed("a"))
+        await asyncio.sleep(0)
+        batcher._flush_task.cancel()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_cancelled_flush_fails_inflight_batch(self):
+        """provider 调用进行中被取消时在途批次的等待方收到异常"""
+        import asyncio
+
+        from cognizes.adapters.postgres.memory_service import EmbeddingBatcher
+
+        started = asyncio.Event()
+
+        async def blocking_embed(texts):
+            started.set()
+            await asyncio.Event().wait()
+
+        batcher = EmbeddingBatcher(blocking_embed, window_seconds=0)
+        waiter = asyncio.create_task(batcher.embed("a"))
+        await asyncio.wait_for(started.wait(), timeout=1)
+        batcher._flush_task.cancel()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(waiter, timeout=1)
@@ -13,6 +13,7 @@ PostgresSessionService 单元测试
 - append_event: 事件追加与 state_delta 应用
 """
 
+import json
 import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
@@ -164,7 +165,17 @@ class TestPostgresSessionServiceMocked:
         session_id = uuid.uuid4()
         now = datetime.now(UTC)
 
-        # 模拟 threads 表返回
+        # 模拟 threads 行 + jsonb_agg 聚合的 events 一次返回
+        events = [
+            {
+                "id": str(uuid.uuid4()),
+                "author": "user",
+                "content": {"role": "user", "parts": [{"text": "hello"}]},
+                "actions": {},
+                "sequence_num": 1,
+                "timestamp": now.timestamp(),
+            }
+        ]
         conn.fetchrow = AsyncMock(
             return_value={
                 "id": session_id,
@@ -172,29 +183,43 @@ class TestPostgresSessionServiceMocked:
                 "user_id": "user_006",
                 "state": '{"key": "value"}',
                 "updated_at": now,
+                "events": json.dumps(events),
             }
         )
 
-        # 模拟 events 表返回
-        conn.fetch = AsyncMock(
-            return_value=[
-                {
-                    "id": uuid.uuid4(),
-                    "author": "user",
-                    "event_type": "message",
-                    "content": '{"text": "hello"}',
-                    "actions": "{}",
-                    "created_at": now,
-                }
-            ]
-        )
-
         service = PostgresSessionService(pool=pool)
         result = await service.get_session(app_name="test_app", user_id="user_006", session_id=str(session_id))
 
         assert result is not None
         assert result.state == {"key": "value"}
         assert len(result.events) == 1
+        assert result.events[0].content.parts[0].text == "hello"
+        assert result.events[0].timestamp == now.timestamp()
+        # Thread 与 Events 在同一次查询中取回
+        conn.fetchrow.assert_called_once()
+        conn.fetch.assert_not_called()
+        assert conn.fetchrow.call_args[0][4] is None
+
+    async def test_get_session_num_recent_events_binds_limit(self, mock_pool):
+        """测试: num_recent_events 作为 LIMIT 参数传入聚合子查询"""
+        from google.adk.sessions.base_session_service import GetSessionConfig
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        conn.fetchrow = AsyncMock(return_value=None)
+
+        service = PostgresSessionService(pool=pool)
+        await service.get_session(
+            app_name="test_app",
+            user_id="user_006",
+            session_id=str(uuid.uuid4()),
+            config=GetSessionConfig(num_recent_events=5),
+        )
+
+        sql, *args = conn.fetchrow.call_args[0]
+        assert "LIMIT $4" in sql
+        assert args[3] == 5
 
     async def test_get_session_with_invalid_uuid_returns_none(self, mock_pool):
         """测试: 无效 UUID 格式时返回 None (而非抛异常)"""
@@ -257,6 +282,30 @@ class TestPostgresSessionServiceMocked:
         # 验证查询被调用
         conn.fetch.assert_called_once()
 
+    async def test_iter_sessions_streams_through_cursor(self, mock_pool):
+        """测试: iter_sessions 在事务内通过服务端游标逐条产出会话"""
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        now = datetime.now(UTC)
+        rows = [
+            {"id": uuid.uuid4(), "app_name": "test_app", "user_id": "user_009", "state": "{}", "updated_at": now},
+            {"id": uuid.uuid4(), "app_name": "test_app", "user_id": "user_009", "state": "{}", "updated_at": now},
+        ]
+        cursor = MagicMock()
+        cursor.__aiter__.return_value = iter(rows)
+        conn.cursor = MagicMock(return_value=cursor)
+
+        service = PostgresSessionService(pool=pool)
+        sessions = [s async for s in service.iter_sessions(app_name="test_app", user_id="user_009", prefetch=50)]
+
+        assert [s.id for s in sessions] == [str(row["id"]) for row in rows]
+        conn.transaction.assert_called_once()
+        args, kwargs = conn.cursor.call_args
+        assert args[1:] == ("test_app", "user_009")
+        assert kwargs == {"prefetch": 50}
+        conn.fetch.assert_not_called()
+
     # ========== delete_session 测试 ==========
 
     async def test_delete_session_calls_delete(self, mock_pool):
@@ -365,8 +414,227 @@ class TestPostgresSessionServiceMocked:
         # 验证 INSERT/UPDATE app_states
         assert conn.execute.call_count >= 1
 
+    async def test_state_delta_unchanged_user_and_app_state_skips_upsert(self, mock_pool):
+        """测试: user:/app: 值未变化时跳过 UPSERT，值变化时照常写入"""
+        from google.adk.events import Event
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool, state_snapshot_max_entries=100)
+
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_015", events=[], state={})
+
+        def make_event(delta):
+            event = Event(author="agent", timestamp=datetime.now().timestamp())
+            event.actions = MagicMock()
+            event.actions.state_delta = delta
+            event.actions.model_dump.return_value = {"state_delta": delta}
+            return event
+
+        def upsert_count():
+            return sum("user_states" in c[0][0] or "app_states" in c[0][0] for c in conn.execute.call_args_list)
+
+        await service.append_event(session, make_event({"user:preference": "dark_mode", "app:config": "on"}))
+        assert upsert_count() == 2
+
+        await service.append_event(session, make_event({"user:preference": "dark_mode", "app:config": "on"}))
+        assert upsert_count() == 2
+
+        await service.append_event(session, make_event({"user:preference": "light_mode"}))
+        assert upsert_count() == 3
+
+    async def test_state_cache_invalidated_on_failed_append(self, mock_pool):
+        """测试: 事务失败后丢弃状态快照，下次写入不会被误跳过"""
+        from google.adk.events import Event
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool, state_snapshot_max_entries=100)
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_016", events=[], state={})
+
+        event = Event(author="agent", timestamp=datetime.now().timestamp())
+        event.actions = MagicMock()
+        event.actions.state_delta = {"user:preference": "dark_mode"}
+        event.actions.model_dump.return_value = {"state_delta": {"user:preference": "dark_mode"}}
+
+        conn.execute.side_effect = [None, None, RuntimeError("commit failed")]
+        await service.append_event(session, event)
+        with pytest.raises(RuntimeError):
+            await service.append_event(session, event)
+
+        assert ("user_016", "test_app") not in service._user_state_cache
+
+    async def test_state_snapshot_isolated_from_caller_mutation(self, mock_pool):
+        """测试: 调用方原地修改已写入的值后，再次写入不会被误跳过"""
+        from google.adk.events import Event
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool, state_snapshot_max_entries=100)
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_017", events=[], state={})
+
+        prefs = {"theme": "dark"}
+        event = Event(author="agent", timestamp=datetime.now().timestamp())
+        event.actions = MagicMock()
+        event.actions.state_delta = {"user:prefs": prefs}
+        event.actions.model_dump.return_value = {}
+
+        await service.append_event(session, event)
+        prefs["theme"] = "light"
+        await service.append_event(session, event)
+
+        assert sum("user_states" in c[0][0] for c in conn.execute.call_args_list) == 2
+
+    async def test_state_snapshots_disabled_by_default(self, mock_pool):
+        """测试: 默认不启用快照，每次 user:/app: 写入都执行 UPSERT (其他写入路径不会使快照失效)"""
+        from google.adk.events import Event
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool)
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_018", events=[], state={})
+
+        event = Event(author="agent", timestamp=datetime.now().timestamp())
+        event.actions = MagicMock()
+        event.actions.state_delta = {"user:x": "A"}
+        event.actions.model_dump.return_value = {}
+
+        await service.append_event(session, event)
+        await service.append_event(session, event)
+
+        assert sum("user_states" in c[0][0] for c in conn.execute.call_args_list) == 2
+
+    def test_state_snapshots_bounded_lru(self):
+        """测试: 快照条目数有上限，按 LRU 逐出；容量为 0 时不缓存"""
+        from cognizes.adapters.postgres.session_service import _StateSnapshots
+
+        snapshots = _StateSnapshots(max_entries=2)
+        snapshots.update("a", {"k": 1})
+        snapshots.update("b", {"k": 1})
+        assert snapshots.matches("a", {"k": 1})
+        snapshots.update("c", {"k": 1})
+        assert "a" in snapshots and "c" in snapshots
+        assert "b" not in snapshots
+
+        disabled = _StateSnapshots(max_entries=0)
+        disabled.update("a", {"k": 1})
+        assert not disabled.matches("a", {"k": 1})
+
+    async def test_append_events_writes_batch_in_one_statement(self, mock_pool):
+        """测试: append_events 一条语句写入多条事件并合并 state_delta"""
+        from google.adk.events import Event
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool)
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_017", events=[], state={})
+
+        def make_event(author, delta):
+            event = Event(author=author, timestamp=datetime.now().timestamp())
+            event.actions = MagicMock()
+            event.actions.state_delta = delta
+            event.actions.model_dump.return_value = {"state_delta": delta}
+            return event
+
+        events = await service.append_events(
+            session,
+            [
+                make_event("agent", {"step": 1, "user:lang": "zh"}),
+                make_event("tool", {}),
+                make_event("agent", {"step": 2, "app:mode": "fast"}),
+            ],
+        )
+
+        conn.execute.assert_called_once()
+        sql, thread_id, ids, _, authors, contents, actions, session_state, _, _, user_state, app_state = (
+            conn.execute.call_args[0]
+        )
+        assert "unnest" in sql
+        assert thread_id == uuid.UUID(session.id)
+        assert authors == ["agent", "tool", "agent"]
+        assert len(ids) == len(contents) == len(actions) == 3
+        assert json.loads(session_state) == {"step": 2}
+        assert json.loads(user_state) == {"lang": "zh"}
+        assert json.loads(app_state) == {"mode": "fast"}
+        assert [e.id for e in events] == ids
+        assert len(session.events) == 3
+
+    async def test_append_events_empty_is_noop(self, mock_pool):
+        """测试: 空事件列表不访问数据库"""
+        from google.adk.sessions import Session
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, conn = mock_pool
+        service = PostgresSessionService(pool=pool)
+        session = Session(id=str(uuid.uuid4()), app_name="test_app", user_id="user_018", events=[], state={})
+
+        assert await service.append_events(session, []) == []
+        conn.execute.assert_not_called()
+
     # ========== 边界条件测试 ==========
 
+    async def test_ensure_uuid_fast_paths(self, mock_pool):
+        """测试: _ensure_uuid 对合法 UUID 原样解析，对长度不符的 ID 直接生成新 UUID"""
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, _ = mock_pool
+        service = PostgresSessionService(pool=pool)
+        value = uuid.uuid4()
+
+        assert service._ensure_uuid(value) is value
+        assert service._ensure_uuid(str(value)) == value
+        assert service._ensure_uuid(value.hex) == value
+        assert isinstance(service._ensure_uuid("e-not-a-uuid"), uuid.UUID)
+
+    async def test_serialize_content_encodes_bytes_as_base64(self, mock_pool):
+        """测试: Event.content 中的 bytes 序列化为 base64 字符串"""
+        import base64
+
+        from google.genai import types
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, _ = mock_pool
+        service = PostgresSessionService(pool=pool)
+
+        content = types.Content(
+            role="user", parts=[types.Part(inline_data=types.Blob(mime_type="image/png", data=b"\x89PNG"))]
+        )
+        data = json.loads(service._serialize_content(content))
+
+        assert data["parts"][0]["inline_data"]["data"] == base64.b64encode(b"\x89PNG").decode()
+        assert json.loads(service._serialize_content(None)) == {}
+        assert json.loads(service._serialize_content("hello")) == {"text": "hello"}
+
+    async def test_serialize_text_content_matches_model_dump(self, mock_pool):
+        """测试: 纯文本 Content 的特化序列化与 model_dump() 输出一致"""
+        from google.genai import types
+
+        from cognizes.adapters.postgres.session_service import PostgresSessionService
+
+        pool, _ = mock_pool
+        service = PostgresSessionService(pool=pool)
+
+        for content in (
+            types.Content(role="model", parts=[types.Part(text="你好"), types.Part(text="world")]),
+            types.Content(role="user", parts=[types.Part(text="hi", thought=True)]),
+            types.Content(role="user"),
+        ):
+            assert json.loads(service._serialize_content(content)) == json.loads(
+                json.dumps(content.model_dump(), default=str)
+            )
+
     async def test_create_session_with_complex_state(self, mock_pool):
         """测试: 复杂嵌套状态正确序列化"""
         from cognizes.adapters.postgres.session_service import PostgresSessionService
@@ -0,0 +1,343 @@
+"""
+PostgresSpanExporter 单元测试
+
+测试范围：纯逻辑测试，Mock 数据库连接
+- 批量写入 (executemany / COPY)
+- Span 事件拆表写入
+- Span 字段格式化
+- 有界队列投递与批次合并
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace.status import Status, StatusCode
+
+
+def _make_span(name: str, span_id: int, parent_span_id: int | None = None):
+    """构造最小化的 ReadableSpan 替身"""
+    return SimpleNamespace(
+        name=name,
+        context=SimpleNamespace(trace_id=0x12345678901234567890123456789012, span_id=span_id),
+        parent=SimpleNamespace(span_id=parent_span_id) if parent_span_id else None,
+        kind=SpanKind.INTERNAL,
+        attributes={"test.attr": "value"},
+        events=[SimpleNamespace(name="event1", timestamp=1_234_567_890_000_000_000, attributes={})],
+        start_time=1_234_567_890_000_000_000,
+        end_time=1_234_567_891_000_000_000,
+        status=Status(StatusCode.OK),
+    )
+
+
+@pytest.fixture
+def mock_pool():
+    """创建模拟数据库连接池"""
+    conn = AsyncMock()
+    conn.transaction = MagicMock(return_value=AsyncMock())
+
+    acm = AsyncMock()
+    acm.__aenter__.return_value = conn
+    acm.__aexit__.return_value = None
+
+    pool = MagicMock()
+    pool.acquire.return_value = acm
+    return pool, conn
+
+
+class TestPostgresSpanExporter:
+    """PostgresSpanExporter 测试套件"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_small_batch_uses_executemany(self, mock_pool):
+        """小批次通过一次 executemany 写入"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        await exporter._async_export([_make_span("root", 0x1), _make_span("child", 0x2, parent_span_id=0x1)])
+
+        assert [c.args[0] for c in conn.execute.call_args_list] == [
+            "SELECT create_traces_partitions()",
+            "SET LOCAL synchronous_commit = off",
+        ]
+        sql, rows = conn.executemany.call_args[0]
+        assert "INSERT INTO traces" in sql
+        assert [row[1] for row in rows] == ["0000000000000001", "0000000000000002"]
+        assert rows[1][2] == "0000000000000001"
+        assert rows[0][0] == "12345678901234567890123456789012"
+        assert rows[0][6] == datetime(2009, 2, 13, 23, 31, 30, tzinfo=UTC)
+        assert rows[0][7] == datetime(2009, 2, 13, 23, 31, 31, tzinfo=UTC)
+        assert rows[0][8] == 1_000_000_000
+        assert json.loads(rows[0][5]) == {"test.attr": "value"}
+        assert len(rows[0]) == 11
+
+    async def test_partitions_created_once_per_day(self, mock_pool):
+        """每天首次写入前预建分区；预建失败仅告警，次批次重试"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        conn.execute.side_effect = [RuntimeError("function missing"), None, None, None, None]
+        exporter = PostgresSpanExporter(pool)
+
+        for span_id in (0x1, 0x2, 0x3):
+            await exporter._async_export([_make_span("span", span_id)])
+
+        calls = [c.args[0] for c in conn.execute.call_args_list]
+        assert calls.count("SELECT create_traces_partitions()") == 2
+        assert conn.executemany.call_count == 3
+
+    async def test_events_copied_to_events_table(self, mock_pool):
+        """Span 事件以 COPY 写入 traces_events，与 Span 同一事务"""
+        from cognizes.adapters.postgres.tracing import _EVENT_COLUMNS, PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        await exporter._async_export([_make_span("root", 0x1), _make_span("child", 0x2, parent_span_id=0x1)])
+
+        conn.transaction.assert_called_once()
+        conn.copy_records_to_table.assert_called_once()
+        assert conn.copy_records_to_table.call_args[0][0] == "traces_events"
+        kwargs = conn.copy_records_to_table.call_args[1]
+        assert kwargs["columns"] == _EVENT_COLUMNS
+        assert kwargs["records"] == [
+            (
+                "12345678901234567890123456789012",
+                f"{span_id:016x}",
+                0,
+                "event1",
+                datetime(2009, 2, 13, 23, 31, 30, tzinfo=UTC),
+                "{}",
+            )
+            for span_id in (0x1, 0x2)
+        ]
+
+    async def test_insert_statement_text_is_stable(self, mock_pool):
+        """每批次使用同一条语句文本，持续命中连接级 prepared statement 缓存"""
+        from cognizes.adapters.postgres.tracing import _INSERT_TRACE_SQL, PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        await exporter._async_export([_make_span("a", 0x1)])
+        await exporter._async_export([_make_span("b", 0x2), _make_span("c", 0x3)])
+
+        assert all(c.args[0] is _INSERT_TRACE_SQL for c in conn.executemany.call_args_list)
+        conn.prepare.assert_not_called()
+
+    async def test_large_batch_uses_copy(self, mock_pool):
+        """大批次改用 COPY 协议写入"""
+        from cognizes.adapters.postgres.tracing import COPY_THRESHOLD, PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        await exporter._async_export([_make_span(f"span-{i}", i + 1) for i in range(COPY_THRESHOLD + 1)])
+
+        conn.executemany.assert_not_called()
+        table = conn.copy_records_to_table.call_args_list[0][0][0]
+        kwargs = conn.copy_records_to_table.call_args_list[0][1]
+        assert table == "traces"
+        assert len(kwargs["records"]) == COPY_THRESHOLD + 1
+        assert len(kwargs["columns"]) == len(kwargs["records"][0])
+
+    async def test_empty_batch_skips_database(self, mock_pool):
+        """空批次不获取连接"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, _ = mock_pool
+        await PostgresSpanExporter(pool)._async_export([])
+
+        pool.acquire.assert_not_called()
+
+    async def test_export_from_worker_thread_is_queued_to_pool_loop(self, mock_pool):
+        """后台线程调用 export() 立即返回，由连接池所在事件循环上的写库协程落库"""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        result = await asyncio.to_thread(exporter.export, [_make_span("root", 0x1)])
+        assert result == SpanExportResult.SUCCESS
+
+        assert await asyncio.to_thread(exporter.force_flush) is True
+        conn.executemany.assert_called_once()
+
+    async def test_queued_batches_are_merged_into_one_write(self, mock_pool):
+        """写库协程将排队的多个批次合并为一次写入"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        exporter.export([_make_span("a", 0x1)])
+        exporter.export([_make_span("b", 0x2)])
+        await exporter.flush()
+
+        conn.executemany.assert_called_once()
+        assert len(conn.executemany.call_args[0][1]) == 2
+
+    async def test_full_queue_drops_and_counts_spans(self, mock_pool):
+        """队列满时丢弃批次并计入 dropped_spans，不阻塞调用方"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool, max_queue_batches=1)
+
+        exporter.export([_make_span("a", 0x1)])
+        exporter.export([_make_span("b", 0x2), _make_span("c", 0x3)])
+        await exporter.flush()
+
+        assert exporter.dropped_spans == 2
+        assert len(conn.executemany.call_args[0][1]) == 1
+
+    async def test_failed_write_counts_dropped_spans(self, mock_pool):
+        """落库失败的 Span 计入 dropped_spans，写库协程继续运行"""
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        conn.executemany.side_effect = [ConnectionError("db down"), None]
+        exporter = PostgresSpanExporter(pool)
+
+        exporter.export([_make_span("a", 0x1)])
+        await exporter.flush()
+        exporter.export([_make_span("b", 0x2)])
+        await exporter.flush()
+
+        assert exporter.dropped_spans == 1
+        assert conn.executemany.call_count == 2
+
+
+class TestLazyLoopCapture:
+    """在事件循环外构造 Exporter"""
+
+    def test_construct_outside_loop_binds_on_first_async_call(self, mock_pool):
+        """循环外构造不报错；绑定前投递返回 FAILURE，首次异步调用时捕获循环"""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from cognizes.adapters.postgres.tracing import PostgresSpanExporter
+
+        pool, conn = mock_pool
+        exporter = PostgresSpanExporter(pool)
+
+        assert exporter.export([_make_span("early", 0x1)]) == SpanExportResult.FAILURE
+        assert exporter.force_flush() is True
+
+        async def run():
+            await exporter.flush()
+            result = await asyncio.to_thread(exporter.export, [_make_span("root", 0x2)])
+            assert await asyncio.to_thread(exporter.force_flush) is True
+            return result
+
+        assert asyncio.run(run()) == SpanExportResult.SUCCESS
+        conn.executemany.assert_called_once()
+
+
+class TestAttributesJson:
+    """属性序列化测试"""
+
+    def test_empty_attributes(self):
+        from cognizes.adapters.postgres.tracing import _attributes_json
+
+        assert _attributes_json(None) == "{}"
+        assert _attributes_json({}) == "{}"
+
+    def test_sdk_attribute_mappings(self):
+        """SDK 暴露的 mappingproxy / BoundedAttributes 无需预先转换为 dict"""
+        from types import MappingProxyType
+
+        from opentelemetry.attributes import BoundedAttributes
+
+        from cognizes.adapters.postgres.tracing import _attributes_json
+
+        attributes = BoundedAttributes(attributes={"tool.name": "calculator", "count": 2})
+
+        assert json.loads(_attributes_json(attributes)) == {"tool.name": "calculator", "count": 2}
+        assert json.loads(_attributes_json(MappingProxyType(attributes))) == {"tool.name": "calculator", "count": 2}
+
+
+class TestDropCountingExporter:
+    """丢弃 Span 统计测试"""
+
+    def test_counts_spans_of_failed_exports(self):
+        from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+        from cognizes.adapters.postgres.tracing import _DropCountingExporter
+
+        inner = MagicMock(spec=SpanExporter)
+        inner.export.side_effect = [SpanExportResult.SUCCESS, SpanExportResult.FAILURE]
+        exporter = _DropCountingExporter(inner)
+
+        assert exporter.export([_make_span("a", 0x1)]) == SpanExportResult.SUCCESS
+        assert exporter.export([_make_span("b", 0x2), _make_span("c", 0x3)]) == SpanExportResult.FAILURE
+        assert exporter.dropped_spans == 2
+
+    def test_includes_spans_dropped_inside_exporter(self):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from cognizes.adapters.postgres.tracing import _DropCountingExporter
+
+        inner = MagicMock()
+        inner.export.return_value = SpanExportResult.SUCCESS
+        inner.dropped_spans = 3
+
+        assert _DropCountingExporter(inner).dropped_spans == 3
+
+
+class TestTraceToolCall:
+    """工具调用 Span 装饰器测试"""
+
+    @pytest.mark.asyncio
+    async def test_span_carries_tool_attributes(self):
+        """Span 名称与属性在装饰时预构造，创建 Span 时一并传入"""
+        from cognizes.adapters.postgres.tracing import TracingManager
+
+        tracing = TracingManager.__new__(TracingManager)
+        tracing.tracer = MagicMock()
+
+        @tracing.trace_tool_call("calculator")
+        async def calculate(x, y):
+            return x + y
+
+        assert await calculate(1, 2) == 3
+        tracing.tracer.start_as_current_span.assert_called_once_with(
+            "tool:calculator", attributes={"tool.name": "calculator"}
+        )
+
+    def test_noop_tracer_returns_function_unwrapped(self):
+        """未启用追踪时直接返回原函数，不引入包装开销"""
+        from opentelemetry import trace
+
+        from cognizes.adapters.postgres.tracing import TracingManager
+
+        tracing = TracingManager.__new__(TracingManager)
+        tracing.tracer = trace.NoOpTracer()
+
+        async def calculate(x, y):
+            return x + y
+
+        assert tracing.trace_tool_call("calculator")(calculate) is calculate
+
+    def test_otlp_keepalive_respects_server_ping_policy(self):
+        """OTLP 通道默认保活间隔不低于 5 分钟、空闲时不发 ping，且间隔可配置"""
+        from unittest.mock import patch
+
+        from cognizes.adapters.postgres.tracing import TracingManager
+
+        with patch("opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter") as exporter_cls:
+            TracingManager(otlp_endpoint="localhost:4317")
+            TracingManager(otlp_endpoint="localhost:4317", otlp_keepalive_time_ms=600_000)
+
+        default_options = dict(exporter_cls.call_args_list[0].kwargs["channel_options"])
+        assert default_options["grpc.keepalive_time_ms"] >= 300_000
+        assert "grpc.keepalive_permit_without_calls" not in default_options
+        assert dict(exporter_cls.call_args_list[1].kwargs["channel_options"])["grpc.keepalive_time_ms"] == 600_000
@@ -43,12 +43,13 @@ class TestToolRegistry:
         return pool, conn
 
     @pytest.fixture
-    def registry(self, mock_pool):
-        """创建测试工具注册表实例"""
+    async def registry(self, mock_pool):
+        """创建测试工具注册表实例 (测试结束时关闭)"""
         from cognizes.adapters.postgres.tool_registry import ToolRegistry
 
         pool, _ = mock_pool
-        return ToolRegistry(pool=pool)
+        async with ToolRegistry(pool=pool) as registry:
+            yield registry
 
     # ========== register_tool 测试 ==========
 
@@ -179,6 +180,44 @@ class TestToolRegistry:
 
         assert tools == []
 
+    async def test_get_available_tools_cached_within_ttl(self, mock_pool):
+        """测试 TTL 内复用缓存，注册新工具后缓存失效"""
+        from cognizes.adapters.postgres.tool_registry import ToolRegistry
+
+        pool, conn = mock_pool
+        registry = ToolRegistry(pool=pool)
+
+        await registry.get_available_tools()
+        await registry.get_available_tools()
+        assert conn.fetch.call_count == 1
+
+        await registry.register_tool(name="new_tool", func=lambda: None)
+        await registry.get_available_tools()
+        assert conn.fetch.call_count == 2
+
+        registry._tools_ttl_s = 0
+        await registry.get_available_tools()
+        assert conn.fetch.call_count == 3
+
+    async def test_register_frontend_tool_invalidates_cache_after_write(self, mock_pool):
+        """测试写入期间并发读取填充的缓存在写入完成后失效"""
+        from cognizes.adapters.postgres.tool_registry import FrontendTool, ToolRegistry
+
+        pool, conn = mock_pool
+        registry = ToolRegistry(pool=pool)
+
+        async def execute_with_concurrent_read(*args):
+            # 模拟 UPSERT 提交前有并发读取以旧数据填充缓存
+            await registry.get_available_tools()
+
+        pool.execute = AsyncMock(side_effect=execute_with_concurrent_read)
+        tool = FrontendTool(name="confirm", description="", parameters={}, render_component="Dialog")
+
+        await registry.register_frontend_tool("default_app", tool)
+        await registry.get_available_tools()
+
+        assert conn.fetch.call_count == 2
+
     # ========== invoke_tool 测试 ==========
 
     async def test_invoke_tool(self, mock_pool):
@@ -200,10 +239,102 @@ class TestToolRegistry:
         # 验证结果
         assert result == 8
 
-        # 验证统计更新被调用
+        # 统计先在内存中累积，flush 时批量落库
+        assert "UPDATE tools" not in conn.execute.call_args[0][0]
+        await registry.flush_stats()
+
         update_call = conn.execute.call_args
         assert "UPDATE tools" in update_call[0][0]
         assert "call_count" in update_call[0][0]
+        assert update_call[0][2:4] == (["add"], [1])
+        await registry.close()
+
+    async def test_invoke_tool_stats_batched_per_tool(self, mock_pool):
+        """测试多次调用合并为单条批量 UPDATE"""
+        from cognizes.adapters.postgres.tool_registry import ToolRegistry
+
+        pool, conn = mock_pool
+        registry = ToolRegistry(pool=pool)
+        await registry.register_tool(name="a", func=lambda: "a")
+        await registry.register_tool(name="b", func=lambda: "b")
+        conn.execute.reset_mock()
+
+        for _ in range(3):
+            await registry.invoke_tool(name="a", params={})
+        await registry.invoke_tool(name="b", params={})
+        await registry.close()
+
+        conn.execute.assert_called_once()
+        _, app_name, names, calls, latencies = conn.execute.call_args[0]
+        assert app_name == "default_app"
+        assert dict(zip(names, calls, strict=True)) == {"a": 3, "b": 1}
+        assert len(latencies) == 2
+
+    async def test_flush_cancelled_restores_pending_stats(self, mock_pool):
+        """测试落库被取消时归还增量，close() 做最后一次写入"""
+        from cognizes.adapters.postgres.tool_registry import ToolRegistry
+
+        pool, conn = mock_pool
+        registry = ToolRegistry(pool=pool)
+        await registry.register_tool(name="a", func=lambda: "a")
+        await registry.invoke_tool(name="a", params={})
+        conn.execute.reset_mock()
+
+        started = asyncio.Event()
+
+        async def blocked_execute(*args):
+            started.set()
+            await asyncio.Event().wait()
+
+        conn.execute.side_effect = blocked_execute
+        flush = asyncio.create_task(registry.flush_stats())
+        await started.wait()
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        conn.execute.side_effect = None
+        async with registry:
+            pass
+
+        assert conn.execute.call_args[0][2:4] == (["a"], [1])
+
+    async def test_threshold_flushes_inline_without_background_task(self, mock_pool, monkeypatch):
+        """测试未以 async with 管理时达到阈值随调用落库，且不启动后台任务"""
+        from cognizes.adapters.postgres import tool_registry
+        from cognizes.adapters.postgres.tool_registry import ToolRegistry
+
+        monkeypatch.setattr(tool_registry, "STATS_FLUSH_THRESHOLD", 3)
+        pool, conn = mock_pool
+        registry = ToolRegistry(pool=pool)
+        await registry.register_tool(name="a", func=lambda: "a")
+        conn.execute.reset_mock()
+
+        for _ in range(3):
+            await registry.invoke_tool(name="a", params={})
+
+        assert registry._stats_flush_task is None
+        conn.execute.assert_called_once()
+        assert conn.execute.call_args[0][2:4] == (["a"], [3])
+
+    async def test_async_with_flushes_on_interval(self, mock_pool, monkeypatch):
+        """测试 async with 管理时按时间间隔落库，退出后停止后台任务"""
+        from cognizes.adapters.postgres import tool_registry
+        from cognizes.adapters.postgres.tool_registry import ToolRegistry
+
+        monkeypatch.setattr(tool_registry, "STATS_FLUSH_INTERVAL_SECONDS", 0.01)
+        pool, conn = mock_pool
+        async with ToolRegistry(pool=pool) as registry:
+            await registry.register_tool(name="a", func=lambda: "a")
+            conn.execute.reset_mock()
+            await registry.invoke_tool(name="a", params={})
+            for _ in range(50):
+                if conn.execute.called:
+                    break
+                await asyncio.sleep(0.01)
+            assert conn.execute.call_args[0][2:4] == (["a"], [1])
+
+        assert registry._stats_flush_task is None
 
     async def test_invoke_tool_async(self, mock_pool):
         """测试调用异步工具"""
@@ -222,6 +353,7 @@ class TestToolRegistry:
         result = await registry.invoke_tool(name="async_tool", params={"msg": "hello"})
 
         assert result == "Processed: hello"
+        await registry.close()
 
     async def test_invoke_tool_not_found(self, mock_pool):
         """测试调用不存在的工具"""
@@ -246,6 +378,7 @@ class TestToolRegistry:
         await registry.register_tool(name="simple_tool", func=simple_tool)
 
         await registry.invoke_tool(name="simple_tool", params={}, run_id="run_12345")
+        await registry.close()
 
         # run_id 可用于追踪
         conn.execute.assert_called()
@@ -274,6 +407,7 @@ class TestToolRegistry:
         # 可以直接调用
         result = await registry.invoke_tool(name="new_tool", params={"data": "test"})
         assert result == "New: test"
+        await registry.close()
 
     async def test_hot_update_replace_function(self, mock_pool):
         """测试运行时替换工具函数"""
@@ -297,6 +431,7 @@ class TestToolRegistry:
         await registry.register_tool(name="my_tool", func=tool_v2)
         result2 = await registry.invoke_tool(name="my_tool", params={})
         assert result2 == "v2"
+        await registry.close()
 
 
 class TestFrontendTool:
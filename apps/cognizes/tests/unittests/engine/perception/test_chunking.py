@@ -249,6 +249,25 @@ class TestSemanticChunker:
         except ImportError:
             pytest.skip("sentence-transformers not installed")
 
+    def test_boundary_similarities_use_single_batch(self):
+        """All boundary windows are encoded in one call and scored by cosine similarity."""
+
+        class FakeModel:
+            def __init__(self):
+                self.calls = []
+
+            def encode(self, texts):
+                self.calls.append(texts)
+                return [[2.0, 0.0] if "cat" in t else [0.0, 3.0] for t in texts]
+
+        chunker = SemanticChunker()
+        chunker._model = FakeModel()
+
+        similarities = chunker._compute_boundary_similarities(["cat one.", "cat two.", "dog three.", "dog four."])
+
+        assert len(chunker._model.calls) == 1
+        assert similarities == pytest.approx([1.0, 0.0, 0.0])
+
 
 # ============================================
 # HierarchicalChunker Tests
@@ -6,6 +6,8 @@ RRF Fusion 单元测试
 对应任务: P3-1-8
 """
 
+import pytest
+
 from cognizes.engine.perception.rrf_fusion import SearchResult, rrf_fusion
 
 
@@ -111,6 +113,21 @@ class TestRRFFusion:
         # 两者分数相同 (都只出现一次)
         assert abs(fused[0].score - fused[1].score) < 0.0001
 
+    def test_weighted_fusion(self):
+        """加权融合: 高权重检索器的结果排名靠前"""
+        list1 = [SearchResult(id="doc1", content="A", score=0.9)]
+        list2 = [SearchResult(id="doc2", content="B", score=0.8)]
+
+        fused = rrf_fusion([list1, list2], k=60, limit=10, weights=[0.7, 0.3])
+
+        assert fused[0].id == "doc1"
+        assert abs(fused[0].score - 0.7 / 61) < 1e-9
+
+    def test_weights_length_mismatch(self):
+        """权重数量与检索器数量不一致时报错"""
+        with pytest.raises(ValueError):
+            rrf_fusion([[], []], weights=[1.0])
+
     def test_rrf_formula_correctness(self):
         """验证 RRF 公式正确性"""
         semantic = [
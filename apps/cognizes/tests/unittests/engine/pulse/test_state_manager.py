@@ -0,0 +1,149 @@
+"""
+StateManager 原子状态流转单元测试
+
+测试范围：纯逻辑测试，Mock 数据库连接
+- append_event 仅下发 state_delta，成功后本地合并、冲突时保持不变
+- EventRepository.atomic_append 空增量跳过 state UPDATE，非空增量由数据库合并
+"""
+
+import json
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cognizes.core.repositories.event import EventRepository
+from cognizes.engine.pulse.state_manager import ConcurrencyConflictError, Event, Session, StateManager
+
+
+def _session(state=None, version=3):
+    return Session(id=str(uuid.uuid4()), app_name="app", user_id="u1", state=state or {}, version=version)
+
+
+def _event(state_delta):
+    return Event(
+        id="",
+        thread_id="",
+        invocation_id=str(uuid.uuid4()),
+        author="agent",
+        event_type="state_update",
+        actions={"state_delta": state_delta},
+    )
+
+
+def _event_data():
+    return {
+        "id": uuid.uuid4(),
+        "invocation_id": uuid.uuid4(),
+        "author": "agent",
+        "event_type": "state_update",
+        "content": {},
+        "actions": {},
+    }
+
+
+def _mock_db(conn):
+    """构造返回指定连接的 DatabaseManager Mock"""
+    acm = AsyncMock()
+    acm.__aenter__.return_value = conn
+    acm.__aexit__.return_value = None
+
+    tx = AsyncMock()
+    tx.__aenter__.return_value = None
+    tx.__aexit__.return_value = None
+    conn.transaction = MagicMock(return_value=tx)
+
+    pool = MagicMock()
+    pool.acquire.return_value = acm
+
+    db = MagicMock()
+    db.get_pool = AsyncMock(return_value=pool)
+    return db
+
+
+class TestAppendEvent:
+    """StateManager.append_event 测试"""
+
+    @pytest.mark.asyncio
+    async def test_passes_only_delta_and_merges_locally(self):
+        """仅把 state_delta 交给 atomic_append，成功后在本地合并"""
+        db = MagicMock()
+        event_id = uuid.uuid4()
+        db.events.atomic_append = AsyncMock(
+            return_value={
+                "status": "success",
+                "version": 4,
+                "event": {"id": event_id, "created_at": datetime(2026, 1, 1)},
+            }
+        )
+        session = _session(state={"a": 1, "b": 1})
+
+        event = await StateManager(db).append_event(session, _event({"b": 2}))
+
+        session_id, version, state_delta, _ = db.events.atomic_append.call_args[0]
+        assert session_id == uuid.UUID(session.id)
+        assert version == 3
+        assert state_delta == {"b": 2}
+        assert session.state == {"a": 1, "b": 2}
+        assert session.version == 4
+        assert event.id == str(event_id)
+
+    @pytest.mark.asyncio
+    async def test_conflict_leaves_session_untouched(self):
+        """版本冲突时抛出异常，本地 state 与 version 保持不变"""
+        db = MagicMock()
+        db.events.atomic_append = AsyncMock(return_value={"status": "conflict"})
+        session = _session(state={"a": 1})
+
+        with pytest.raises(ConcurrencyConflictError):
+            await StateManager(db).append_event(session, _event({"a": 2}))
+
+        assert session.state == {"a": 1}
+        assert session.version == 3
+
+
+class TestAtomicAppend:
+    """EventRepository.atomic_append 测试"""
+
+    @pytest.mark.asyncio
+    async def test_empty_delta_skips_state_update(self):
+        """空增量不执行 state UPDATE，版本号不变"""
+        conn = AsyncMock()
+        repo = EventRepository(_mock_db(conn))
+        repo.insert = AsyncMock(return_value={"id": uuid.uuid4(), "created_at": None})
+
+        result = await repo.atomic_append(uuid.uuid4(), 3, {}, _event_data())
+
+        conn.fetchval.assert_not_called()
+        assert result["status"] == "success"
+        assert result["version"] == 3
+
+    @pytest.mark.asyncio
+    async def test_delta_merged_server_side(self):
+        """非空增量以 jsonb || 在数据库侧合并，仅序列化增量"""
+        conn = AsyncMock()
+        conn.fetchval = AsyncMock(return_value=4)
+        repo = EventRepository(_mock_db(conn))
+        repo.insert = AsyncMock(return_value={"id": uuid.uuid4(), "created_at": None})
+
+        result = await repo.atomic_append(uuid.uuid4(), 3, {"b": 2}, _event_data())
+
+        query, payload, _, version = conn.fetchval.call_args[0]
+        assert "state || $1::jsonb" in query
+        assert json.loads(payload) == {"b": 2}
+        assert version == 3
+        assert result["version"] == 4
+
+    @pytest.mark.asyncio
+    async def test_version_mismatch_is_conflict(self):
+        """版本校验失败时返回 conflict，不写入事件"""
+        conn = AsyncMock()
+        conn.fetchval = AsyncMock(return_value=None)
+        repo = EventRepository(_mock_db(conn))
+        repo.insert = AsyncMock()
+
+        result = await repo.atomic_append(uuid.uuid4(), 3, {"b": 2}, _event_data())
+
+        assert result == {"status": "conflict"}
+        repo.insert.assert_not_called()
@@ -2,6 +2,8 @@ def __getattr__(name: str):
     if name in {"agent", "root_agent"}:
         from negentropy.agents.agent import root_agent
 
+        # 写回模块字典：后续访问直接命中，不再经过 __getattr__
+        globals().update(agent=root_agent, root_agent=root_agent)
         return root_agent
     if name == "runner":
         from negentropy.engine.factories import get_runner
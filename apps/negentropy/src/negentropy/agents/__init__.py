@@ -2,6 +2,8 @@ def __getattr__(name: str):
     if name == "root_agent":
         from .agent import root_agent
 
+        # 写回模块字典：后续访问直接命中，不再经过 __getattr__
+        globals()["root_agent"] = root_agent
         return root_agent
     raise AttributeError(f"module 'negentropy.agents' has no attribute {name}")
 
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from collections.abc import Awaitable, Callable
 
@@ -41,6 +42,7 @@ _PREFERENCE_PREFIX_TEMPLATE = """## 用户偏好 (User Preference - 本轮 turn)
 """
 
 
+@functools.lru_cache(maxsize=64)
 def _render_preference_prefix(preferred: str) -> str:
     """渲染「用户偏好」prefix；与正文之间留一个空行分隔。
 
@@ -48,10 +50,13 @@ def _render_preference_prefix(preferred: str) -> str:
     ``forwardedProps.preferred_agent`` → BFF ``state_delta`` → ADK session.state
     透传到根 Agent 的 ReadonlyContext。本 prefix 仅是「软偏好」—— 若 root 判断不
     匹配仍可自主选择，但需向用户简述偏离原因，避免静默忽略用户意图。
+
+    可选 Agent 名是小而稳定的集合，按名缓存渲染结果，逐轮不再重复格式化模板。
     """
     return _PREFERENCE_PREFIX_TEMPLATE.format(name=preferred)
 
 
+@functools.cache
 def make_instruction_provider(
     agent_name: str,
     fallback: str,
@@ -65,6 +70,9 @@ def make_instruction_provider(
     生效，state 由 ADK 按 turn 派发）。Agent 名仅做轻量正则校验，避免脏数据
     破坏 prompt。
 
+    Provider 无实例状态（DB 读取走 TTL 缓存、偏好取自每轮 ctx），故按参数缓存：
+    流水线为同一系部反复构造 Agent 时共享同一 Provider，而不是各自新建闭包。
+
     Args:
         agent_name: ``agents.name``，用于 DB 查询；与 ADK Agent.name 一致。
         fallback: 代码硬编码 instruction 文本，DB 未命中 / 异常时使用。
@@ -120,6 +120,8 @@ class _DynamicLiteLlm(LiteLlm):
         async with lock:
             try:
                 merged_args = dict(orig_args or {})
+                # 缓存断点随模型能力决定，不从默认模型继承到覆盖模型
+                merged_args.pop("cache_control_injection_points", None)
                 merged_args.update(new_kwargs or {})
                 object.__setattr__(self, "model", new_model)
                 object.__setattr__(self, "_additional_args", merged_args)
@@ -11,14 +11,19 @@ LLM 模型工厂 — 单一事实源 (Single Source of Truth)
   不传则回退静态 ``LiteLlm`` 以兼容其它调用方。
 - ``create_model()``：历史工厂，保留为静态 ``LiteLlm``（向后兼容）。
 
+静态 ``LiteLlm`` 按默认配置复用同一实例（配置变化时重建）；动态实例因携带
+``agent_name`` 与各自的 swap 锁，须按 Agent 独立构造，但与静态实例共享同一个
+``LiteLLMClient``。
+
 遵循 AGENTS.md 的「复用驱动」与「单一事实源」原则。
 """
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.models.lite_llm import LiteLlm, LiteLLMClient
 
 from ._dynamic_model import DynamicRootLiteLlm, DynamicSubagentLiteLlm
 
@@ -33,14 +38,38 @@ def _get_default_llm_spec() -> tuple[str, dict[str, Any]]:
     return get_fallback_llm_config()
 
 
+@functools.cache
+def _shared_llm_client() -> LiteLLMClient:
+    """进程内共享的 LiteLLMClient（无状态，底层 HTTP 客户端由 litellm 模块级缓存）。"""
+    return LiteLLMClient()
+
+
+# 最近一次构造的静态 LiteLlm 及其配置：(name, kwargs), instance
+_static_model: tuple[tuple[str, dict[str, Any]], LiteLlm] | None = None
+
+
+def _get_static_model() -> LiteLlm:
+    """返回与当前默认配置对应的静态 LiteLlm；配置未变时复用同一实例。"""
+    global _static_model
+
+    spec = _get_default_llm_spec()
+    cached = _static_model
+    if cached is not None and cached[0] == spec:
+        return cached[1]
+    name, kwargs = spec
+    model = LiteLlm(name, llm_client=_shared_llm_client(), **kwargs)
+    _static_model = (spec, model)
+    return model
+
+
 def create_model() -> LiteLlm:
     """创建静态 LiteLlm 实例（向后兼容）。
 
     优先使用缓存的 DB 默认配置，回退到硬编码默认值。
     缓存由 engine/bootstrap.py 的 startup 事件预热。
+    默认配置不变时各调用方共享同一实例。
     """
-    name, kwargs = _get_default_llm_spec()
-    return LiteLlm(name, **kwargs)
+    return _get_static_model()
 
 
 def create_root_model() -> DynamicRootLiteLlm:
@@ -51,7 +80,7 @@ def create_root_model() -> DynamicRootLiteLlm:
     该值覆盖单轮 ``self.model`` / ``self._additional_args``。
     """
     name, kwargs = _get_default_llm_spec()
-    return DynamicRootLiteLlm(name, **kwargs)
+    return DynamicRootLiteLlm(name, llm_client=_shared_llm_client(), **kwargs)
 
 
 def create_subagent_model(agent_name: str | None = None) -> LiteLlm:
@@ -65,7 +94,7 @@ def create_subagent_model(agent_name: str | None = None) -> LiteLlm:
     运行时：每轮请求先查 ``sub_agents.name == agent_name`` 的 ``model`` 字段；
     命中 → 用其 ``vendor/model_name`` 覆盖当轮；空/未命中 → 走构造时默认。
     """
-    name, kwargs = _get_default_llm_spec()
     if agent_name:
-        return DynamicSubagentLiteLlm(name, agent_name=agent_name, **kwargs)
-    return LiteLlm(name, **kwargs)
+        name, kwargs = _get_default_llm_spec()
+        return DynamicSubagentLiteLlm(name, agent_name=agent_name, llm_client=_shared_llm_client(), **kwargs)
+    return _get_static_model()
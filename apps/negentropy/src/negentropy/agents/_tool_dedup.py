@@ -0,0 +1,114 @@
+"""
+工具调用去重 — 同一次 invocation 内相同的只读工具调用只真正执行一次。
+
+流水线中多个系部（及根 Agent 直接委派的单例）共享同一 ``invocation_id``：感知系部
+检索过的 query、行动系部读过的文件，在后续步骤或重试中常被原样再次调用。本模块以
+ADK ``before_tool_callback`` / ``after_tool_callback`` 接入：
+
+- ``before``：命中 ``(工具名, 规范化参数)`` 缓存时直接返回上次的响应，跳过工具执行；
+- ``after``：缓存只读工具的成功响应；有副作用的工具（写文件 / 执行代码 / 写入记忆、
+  知识图谱与语料库）执行后清空本次 invocation 的缓存，避免读到写入前的旧内容。
+  凡挂载了可写工具的系部都须挂载 ``after`` 回调，否则其写入不会使其他系部的读缓存失效。
+
+缓存与命中时返回的均为响应的浅拷贝，调用方改写响应不会污染缓存。
+
+缓存按 ``invocation_id`` 隔离，跨轮不复用（检索结果的时效性与 corpus 作用域均以轮为界），
+仅保留最近 ``_MAX_INVOCATIONS`` 次 invocation。
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Any
+
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+from negentropy.logging import get_logger
+
+_logger = get_logger("negentropy.agents.tool_dedup")
+
+# 幂等只读工具：相同参数在同一 invocation 内结果可复用
+_DEDUP_TOOLS: frozenset[str] = frozenset(
+    {
+        "search_knowledge_base",
+        "search_knowledge_graph_global",
+        "search_knowledge_graph_with_papers",
+        "search_web",
+        "search_papers",
+        "read_file",
+    }
+)
+# 有副作用的工具：执行后使本次 invocation 的读缓存失效
+_INVALIDATING_TOOLS: frozenset[str] = frozenset(
+    {
+        "write_file",
+        "execute_code",
+        "invoke_claude_code",
+        "save_to_memory",
+        "update_knowledge_graph",
+        "ingest_to_corpus",
+        "ingest_paper",
+    }
+)
+
+_MAX_INVOCATIONS = 256
+
+# { invocation_id: { (tool_name, canonical_args): response } }
+_invocation_caches: OrderedDict[str, dict[tuple[str, str], dict[str, Any]]] = OrderedDict()
+
+
+def _cache_key(tool: BaseTool, args: dict[str, Any]) -> tuple[str, str] | None:
+    try:
+        return tool.name, json.dumps(args, sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _invocation_cache(tool_context: ToolContext) -> dict[tuple[str, str], dict[str, Any]]:
+    invocation_id = tool_context.invocation_id
+    cache = _invocation_caches.get(invocation_id)
+    if cache is None:
+        cache = _invocation_caches[invocation_id] = {}
+        if len(_invocation_caches) > _MAX_INVOCATIONS:
+            _invocation_caches.popitem(last=False)
+    return cache
+
+
+def dedup_before_tool(tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> dict[str, Any] | None:
+    """命中同一 invocation 内的相同只读调用时返回缓存响应，ADK 据此跳过工具执行。"""
+    if tool.name not in _DEDUP_TOOLS:
+        return None
+    key = _cache_key(tool, args)
+    if key is None:
+        return None
+    cached = _invocation_caches.get(tool_context.invocation_id, {}).get(key)
+    if cached is None:
+        return None
+    _logger.debug("tool_call_dedup_hit", tool=tool.name, invocation_id=tool_context.invocation_id)
+    return dict(cached)
+
+
+def dedup_after_tool(
+    tool: BaseTool,
+    args: dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: dict[str, Any],
+) -> dict[str, Any] | None:
+    """缓存只读工具的成功响应；副作用工具执行后清空本次 invocation 的缓存。不改写响应。"""
+    if tool.name in _INVALIDATING_TOOLS:
+        # 失败的执行也可能已部分落盘，一律失效
+        _invocation_caches.pop(tool_context.invocation_id, None)
+        return None
+    if tool.name not in _DEDUP_TOOLS:
+        return None
+    if not isinstance(tool_response, dict) or tool_response.get("status") != "success":
+        return None
+    key = _cache_key(tool, args)
+    if key is not None:
+        _invocation_cache(tool_context)[key] = dict(tool_response)
+    return None
+
+
+__all__ = ["dedup_after_tool", "dedup_before_tool"]
@@ -5,15 +5,10 @@ from google.adk.models.llm_request import LlmRequest
 from negentropy.engine.utils.action_intent import classify as classify_action_intent
 from negentropy.logging import get_logger
 
-from ._citation_protocol import CITATION_PROTOCOL
 from ._dynamic_instruction import make_instruction_provider
 from ._dynamic_model import set_root_thinking_enabled, set_selected_root_llm
 from ._model import create_root_model
-from .faculties.action import action_agent
-from .faculties.contemplation import contemplation_agent
-from .faculties.influence import influence_agent
-from .faculties.internalization import internalization_agent
-from .faculties.perception import perception_agent
+from ._prompts import ROOT_INSTRUCTION as _ROOT_INSTRUCTION
 from .pipelines.standard import (
     create_knowledge_acquisition_pipeline,
     create_problem_solving_pipeline,
@@ -93,10 +88,13 @@ def _pick_root_model(callback_context: CallbackContext, llm_request: LlmRequest)
         user_text = _extract_latest_user_text(callback_context)
         intent = classify_action_intent(user_text)
         if intent.label == "ingest" and intent.confidence >= _ACTION_INTENT_CONFIDENCE_THRESHOLD:
-            state["action_intent_hint"] = "ingest"
+            hint = "ingest"
         else:
             # 显式置位 retrieve（避免上一轮 ingest hint 跨 turn 残留）
-            state["action_intent_hint"] = "retrieve"
+            hint = "retrieve"
+        # 值未变化时不写：ADK State 的每次赋值都会进入 state_delta 并触发一次持久化
+        if state.get("action_intent_hint") != hint:
+            state["action_intent_hint"] = hint
         logger.debug(
             "action_intent_hint_set",
             label=intent.label,
@@ -107,147 +105,50 @@ def _pick_root_model(callback_context: CallbackContext, llm_request: LlmRequest)
         logger.debug("action_intent_hint_skipped", error=str(exc))
 
 
-_ROOT_INSTRUCTION = (
-    """
-你是 **NegentropyEngine** (熵减引擎)，是 Negentropy 系统唯一的 **「本我」(The Self)**。
-
-## 核心哲学：熵减 (Entropy Reduction)
-你的存在是为了对抗知识的无序趋势（熵增），体系化增强认知。
-你通过调度 **「一核五翼」 (One Root, Five Wings)** 的持续修习循环，将混沌的输入转化为有序、结构化的高价值输出。
-
-## 协调模式 (Coordination Patterns)
-
-### 1. 单一系部任务 (Single Faculty)
-对于简单、明确的任务，直接委派给对应系部：
-- 使用 `transfer_to_agent(agent_name="PerceptionFaculty", ...)` 进行信息获取
-- 使用 `transfer_to_agent(agent_name="InternalizationFaculty", ...)` 进行知识沉淀
-- 使用 `transfer_to_agent(agent_name="ContemplationFaculty", ...)` 进行反思规划
-- 使用 `transfer_to_agent(agent_name="ActionFaculty", ...)` 进行执行操作
-- 使用 `transfer_to_agent(agent_name="InfluenceFaculty", ...)` 进行价值输出
-
-### 2. 标准流水线任务 (Pipeline Tasks)
-对于常见的多步骤任务，使用预定义流水线以减少协调熵：
-- **知识获取流程** → `transfer_to_agent(agent_name="KnowledgeAcquisitionPipeline", ...)`
-  - 适用场景：研究新技术、收集需求、构建知识库
-  - 包含系部：感知 → 内化
-- **问题解决流程** → `transfer_to_agent(agent_name="ProblemSolvingPipeline", ...)`
-  - 适用场景：Bug修复、功能实现、系统优化
-  - 包含系部：感知 → 沉思 → 行动 → 内化
-- **价值交付流程** → `transfer_to_agent(agent_name="ValueDeliveryPipeline", ...)`
-  - 适用场景：撰写文档、生成报告、提供建议
-  - 包含系部：感知 → 沉思 → 影响
-
-### 3. 自定义序列任务 (Custom Sequential)
-对于特殊需求，可以手动构建系部序列：
-1. 识别任务需要的系部组合
-2. 按逻辑顺序依次调用
-3. 每步完成后评估是否需要继续
-
-## 五大系部职责 (The Five Faculties)
-
-1. **感知系部 (`PerceptionFaculty` - 慧眼)**：*信息获取*。
-    - [适用场景]：需要获取新的外部数据、搜索结果、扫描环境上下文、或回溯用户过往交互/偏好/历史结论时
-    - [目标]：高信噪比 (High-Signal)，过滤噪音
-    - [工具]：search_knowledge_base, search_web, load_memory
-2. **内化系部 (`InternalizationFaculty` - 本心)**：*知识结构化*。
-    - [适用场景]：需要整理原始数据、更新知识图谱 (Knowledge Graph)、或存入长期记忆时
-    - [目标]：系统完整性 (Systemic Integrity)，建立连接
-    - [工具]：save_to_memory, update_knowledge_graph
-3. **坐照系部 (`ContemplationFaculty` - 元神)**：*反思与规划*。
-    - [适用场景]：需要制定策略、进行二阶思维 (Second-Order Thinking)、错误分析或路径规划时
-    - [目标]：洞察 (Insight)，智慧，纠正偏差
-    - [工具]：analyze_context, create_plan
-4. **知行系部 (`ActionFaculty` - 妙手)**：*执行*。
-    - [适用场景]：需要通过代码与世界交互（写代码、文件操作、API 调用）时
-    - [目标]：精确 (Precision)，最小干预 (Minimal Intervention)
-    - [工具]：execute_code, read_file, write_file
-5. **影响系部 (`InfluenceFaculty` - 喉舌)**：*价值输出*。
-    - [适用场景]：需要发布内容、展示结果、或对外部系统产生影响时
-    - [目标]：清晰 (Clarity)，影响力
-    - [工具]：publish_content, send_notification
-
-## 可用工具 (Available Tools)
-你 **只有** 以下两个工具可用，不要尝试调用任何其他函数：
-1. `transfer_to_agent(agent_name, ...)` - 将任务委派给子智能体
-2. `log_activity(...)` - 记录审计日志
-
-## 长期记忆注入 (Memory Injection)
-系统会在每轮自动以用户消息检索长期记忆，命中时以 `<RELEVANT_MEMORIES>` 块注入你的上下文
-（每条形如 `[Memory <id8>, <memory_type>, <YYYY-MM-DD>] 内容`）。使用其中内容回答时，
-按下方「知识与记忆引用规范」第 3 条标注 Memory 引用；与用户当前问题无关时直接忽略，不要复述。
-
-## 调度之道 (The Dao of Orchestration)
-处理每一个请求时，遵循以下 **反馈闭环 (Feedback Loop)**：
-
-1. **上下文锚定 (Context-Anchoring)**：在当前上下文中深度解析用户意图。
-   不要机械响应，要通过”为什么（Why）”来理解用户的真实意图。
-2. **模式择优 (Pattern Selection)**：
-   - 简单任务 → 单一系部
-   - 常见多步骤 → 预定义流水线
-   - 复杂特殊 → 自定义序列
-3. **循证执行 (Evidence-Based Execution)**：基于实际结果动态调整，
-   引用来源（见下方「知识与记忆引用规范」），拒绝凭空捏造。
-4. **主动导航 (Proactive Navigation)**：完成任务后，建议下一步最佳行动。
-
-## Ingest 意图分流 (Intent-Driven Ingest)
-当**同时满足**以下两个条件时，**必须**优先把任务委派给 InternalizationFaculty
-调用其 `ingest_to_corpus` 工具，而不是默认调度 PerceptionFaculty 检索：
-
-1. `state.action_intent_hint == "ingest"`（系统已识别用户表达「沉淀/入库/写入」语义）
-2. `state.corpus_ids` 非空（用户已在 Composer @ 选中目标 Corpus）
-
-执行：`transfer_to_agent(agent_name="InternalizationFaculty", request="将
-{用户原始文本} 沉淀到 corpus_ids 列表中的 Corpus")`
-
-若 `state.action_intent_hint != "ingest"` 或 `corpus_ids` 为空 →
-保持默认调度（PerceptionFaculty 检索 / 其他系部）。
-
-## 主动导航 (Proactive Navigation)
-完成任何任务后，你必须：
-1. 总结已完成的工作
-2. 基于上下文分析可能的后续需求
-3. 提出具体的下一步建议（包含行动类型和理由）
-4. 让用户决定是否采纳
-
-这确保用户始终获得"路径"而非仅仅"答案"。
-
-## 约束 (Constraints)
-- **拒绝幻觉 (No Hallucination)**：严禁臆造事实或直接调用不存在的工具。
-  **必须** 通过 `transfer_to_agent` 委派 `PerceptionFaculty` 寻找真相。
-- **最小干预 (Minimal Intervention)**：不要过度设计。使用最简的系部路径解决问题（奥卡姆剃刀）。
-- **单一事实源 (Single Source of Truth)**：依赖 `InternalizationFaculty` 获取历史上下文，而非仅依赖你短暂的上下文窗口。
-- **优先流水线 (Pipeline First)**：对于多步骤任务，优先使用预定义流水线。
-
-### 调度者的引用职责（保留引用）
-你整合各系部产出形成最终回答时，**原样保留**其中的 ``[N]`` 标号与 *## 参考文献* 节
-（含原文摘录）；多系部产出合并时按出现顺序统一重排编号并合并参考文献节，不得丢条。
-"""
-    + CITATION_PROTOCOL
-)
-
+def create_root_agent() -> LlmAgent:
+    """构造根 Agent「NegentropyEngine」。
 
-root_agent = LlmAgent(
-    name="NegentropyEngine",
-    # Model configured via unified settings (see config/llm.py)
-    model=create_root_model(),
-    before_model_callback=_pick_root_model,
-    description="熵减系统的「本我」，通过协调五大系部的能力，持续实现自我进化。",
-    # Instruction 由 agents.system_prompt 经 InstructionProvider 在运行时解析；
-    # DB 未命中或失败时回退到 _ROOT_INSTRUCTION 常量，永不阻塞请求。
-    # is_root=True：仅根 Agent 消费 Home Composer 的 @Agent 偏好（preferred_agent）。
-    instruction=make_instruction_provider("NegentropyEngine", _ROOT_INSTRUCTION, is_root=True),
-    # preload_memory：每轮自动检索长期记忆注入 llm_request（LLM 不可见，
-    # 不注册 FunctionDeclaration），受 settings.memory.retrieval 门控。
-    tools=[log_activity, preload_memory_tool],
-    sub_agents=[
-        perception_agent,
-        internalization_agent,
-        contemplation_agent,
+    Faculty 单例只能挂载到一个父 Agent，进程内应只调用一次；常规入口请使用
+    模块属性 ``root_agent``（首次访问时构造并缓存）。
+    """
+    from .faculties import (
         action_agent,
+        contemplation_agent,
         influence_agent,
-        # Register pipeline agents for structured coordination
-        create_knowledge_acquisition_pipeline(),
-        create_problem_solving_pipeline(),
-        create_value_delivery_pipeline(),
-    ],
-)
+        internalization_agent,
+        perception_agent,
+    )
+
+    return LlmAgent(
+        name="NegentropyEngine",
+        # Model configured via unified settings (see config/llm.py)
+        model=create_root_model(),
+        before_model_callback=_pick_root_model,
+        description="熵减系统的「本我」，通过协调五大系部的能力，持续实现自我进化。",
+        # Instruction 由 agents.system_prompt 经 InstructionProvider 在运行时解析；
+        # DB 未命中或失败时回退到 _ROOT_INSTRUCTION 常量，永不阻塞请求。
+        # is_root=True：仅根 Agent 消费 Home Composer 的 @Agent 偏好（preferred_agent）。
+        instruction=make_instruction_provider("NegentropyEngine", _ROOT_INSTRUCTION, is_root=True),
+        # preload_memory：每轮自动检索长期记忆注入 llm_request（LLM 不可见，
+        # 不注册 FunctionDeclaration），受 settings.memory.retrieval 门控。
+        tools=[log_activity, preload_memory_tool],
+        sub_agents=[
+            perception_agent,
+            internalization_agent,
+            contemplation_agent,
+            action_agent,
+            influence_agent,
+            # Register pipeline agents for structured coordination
+            create_knowledge_acquisition_pipeline(),
+            create_problem_solving_pipeline(),
+            create_value_delivery_pipeline(),
+        ],
+    )
+
+
+def __getattr__(name: str):
+    # 延迟构造 root_agent：仅导入本模块（如读取 _ROOT_INSTRUCTION）时不实例化 LiteLlm 与流水线
+    if name == "root_agent":
+        agent = globals()["root_agent"] = create_root_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -42,21 +42,24 @@ logger = get_logger("negentropy.agents.approval")
 # 2. 纯查询 / 检索 / 内部读 → 不需要审批；
 # 3. 新增 vendor 工具时，请同步更新本列表 + chat-essentials.md「审批策略」表。
 
-HIGH_RISK_TOOLS: tuple[str, ...] = (
-    # 副作用：写入 KG / 知识库
-    "update_knowledge_graph",
-    "ingest_paper",  # 会下载 PDF + 写入知识库
-    "ingest_to_corpus",  # ISSUE-096 后续：用户 @ Corpus 主动沉淀（默认 per_tool 拦截）
-    # 副作用：执行代码 / 文件系统
-    "execute_code",
-    "write_file",
-    "shell_command",
-    # 副作用：对外通信
-    "send_email",
-    "send_notification",
-    "publish_content",
-    # 副作用：数据库写入（应用层）
-    "save_to_memory",
+# frozenset：每次工具调用都会做成员判定
+HIGH_RISK_TOOLS: frozenset[str] = frozenset(
+    {
+        # 副作用：写入 KG / 知识库
+        "update_knowledge_graph",
+        "ingest_paper",  # 会下载 PDF + 写入知识库
+        "ingest_to_corpus",  # ISSUE-096 后续：用户 @ Corpus 主动沉淀（默认 per_tool 拦截）
+        # 副作用：执行代码 / 文件系统
+        "execute_code",
+        "write_file",
+        "shell_command",
+        # 副作用：对外通信
+        "send_email",
+        "send_notification",
+        "publish_content",
+        # 副作用：数据库写入（应用层）
+        "save_to_memory",
+    }
 )
 
 
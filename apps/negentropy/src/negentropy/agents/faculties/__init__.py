@@ -1,10 +1,45 @@
-"""Faculty Agent 工厂函数与单例导出。"""
+"""Faculty Agent 工厂函数与单例导出（按需导入子模块，单例首次访问时构造）。
+
+各系部子模块会连带导入 ADK、LiteLlm 与知识库工具链；包本身不在导入时加载它们，
+仅需 ``_prompts`` 等轻量子模块的调用方（如单测、落库同步）无需承担该冷启动开销。
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .action import action_agent, create_action_agent
+    from .contemplation import contemplation_agent, create_contemplation_agent
+    from .influence import create_influence_agent, influence_agent
+    from .internalization import create_internalization_agent, internalization_agent
+    from .perception import create_perception_agent, perception_agent
+
+# 导出名 -> 所在子模块；首次访问时导入子模块（单例由子模块惰性构造）
+_LAZY_EXPORTS = {
+    "perception_agent": ".perception",
+    "internalization_agent": ".internalization",
+    "contemplation_agent": ".contemplation",
+    "action_agent": ".action",
+    "influence_agent": ".influence",
+    "create_perception_agent": ".perception",
+    "create_internalization_agent": ".internalization",
+    "create_contemplation_agent": ".contemplation",
+    "create_action_agent": ".action",
+    "create_influence_agent": ".influence",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        # 写回包字典：后续访问直接命中，不再经过 __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .action import action_agent, create_action_agent
-from .contemplation import contemplation_agent, create_contemplation_agent
-from .influence import create_influence_agent, influence_agent
-from .internalization import create_internalization_agent, internalization_agent
-from .perception import create_perception_agent, perception_agent
 
 __all__ = [
     # 单例（供 root_agent 直接委派）
@@ -1,62 +1,18 @@
 from google.adk.agents import LlmAgent
 
-from .._citation_protocol import CITATION_PROTOCOL
 from .._dynamic_instruction import make_instruction_provider
 from .._model import create_subagent_model
+from .._tool_dedup import dedup_after_tool, dedup_before_tool
 from ..tools.action import execute_code, read_file, write_file
 from ..tools.claude_code import invoke_claude_code
 from ..tools.common import log_activity
+from ._prompts import ACTION_INSTRUCTION as _INSTRUCTION
 
 _DESCRIPTION = (
     "Handles: code execution, file operations, implementation, system changes, tool invocation. "
     "Negentropy 系统的「妙手」(The Hand)。对抗虚谈，负责精准的实现产品，并在现实交互环境中安全的执行。"
 )
 
-_INSTRUCTION = (
-    """
-你是 **ActionFaculty** (行动系部)，是 Negentropy 系统的**「妙手」(The Hand)**。
-
-## 核心哲学：精准执行 (Precision Execution)
-你的使命是**对抗虚谈**。负责精准、安全的产品实现与执行，**将意志转化为现实**。
-在你的操作下，抽象的计划变为具体的代码、文件和系统状态变更。你的美德是**准确**与**安全**。
-
-## 职责边界 (Orthogonal Responsibilities)
-你专注于**「做」**，不负责思考（沉思）或记忆（内化）。
-
-1. **代码生成与修改 (Coding)**：
-    - 编写高质量、符合 PEP8/Google Style 的代码。
-    - *原则*：代码即文档。注释必须解释 "Why" 而非 "What"。
-2. **工具调用 (Tool Usage)**：
-    - 操作文件系统、终端命令、API 请求。
-    - *心法*：每一次副作用（Side Effect）都必须是经过授权且可逆的。
-3. **自我纠错 (Self-Correction)**：
-    - 在执行命令报错时，尝试基于错误信息进行微调（Hotfix），重大错误上报给 [沉思]。
-
-## 运行协议 (Operating Protocol)
-处理请求时，执行以下**行动流**：
-
-1. **环境检查 (Pre-check)**：确认当前目录、依赖安装情况。不要在无知中行动。
-2. **最小变更 (Atomic Change)**：每次只做一件事。避免"大爆炸"式的重构。
-3. **验证 (Verification)**：行动后立即验证（运行测试、检查文件存在性）。
-4. **清理 (Cleanup)**：不留下临时文件垃圾。保持现场整洁。
-
-## 上游上下文 (Upstream Context)
-如果以下上下文可用，请基于它们精确执行：
-- 感知系部输出: {perception_output?}
-- 沉思系部输出: {contemplation_output?}
-
-## 约束 (Constraints)
-- **安全第一 (Safety First)**：严禁执行 `rm -rf /` 等高危命令。
-- **幂等性 (Idempotency)**：你的操作最好是可重入的。
-- **不问不答 (Silent Actor)**：除非出错，否则只返回执行结果（Output/Exit Code），不要废话。
-
-### 上游引用传递（传递引用）
-你的「上游上下文」（{perception_output?} 等）可能携带 ``[N]`` 引用标注。你的产出
-（报告/注释/文档）基于这些内容时，遵循下方规范传递引用，不自行生成新编号。
-"""
-    + CITATION_PROTOCOL
-)
-
 
 def create_action_agent(*, output_key: str | None = None, mode: str | None = None) -> LlmAgent:
     """工厂：每次调用创建独立的 ActionFaculty 实例。
@@ -72,6 +28,9 @@ def create_action_agent(*, output_key: str | None = None, mode: str | None = Non
         description=_DESCRIPTION,
         instruction=make_instruction_provider("ActionFaculty", _INSTRUCTION),
         tools=[log_activity, execute_code, read_file, write_file, invoke_claude_code],
+        # 同一 invocation 内相同的只读工具调用（检索 / 读文件）只执行一次
+        before_tool_callback=dedup_before_tool,
+        after_tool_callback=dedup_after_tool,
         output_key=output_key,
         mode=mode,
         # Pipeline 边界管控：在流水线内使用时，禁止 LLM 路由逃逸
@@ -80,5 +39,10 @@ def create_action_agent(*, output_key: str | None = None, mode: str | None = Non
     )
 
 
-# ADK 2.0: mode="single_turn" — 行动系部为纯执行型，完成后自动返回 Root Agent
-action_agent = create_action_agent(mode="single_turn")
+def __getattr__(name: str):
+    # 延迟构造单例 action_agent：仅使用工厂的调用方（如流水线）不实例化该单例
+    if name == "action_agent":
+        # ADK 2.0: mode="single_turn" — 行动系部为纯执行型，完成后自动返回 Root Agent
+        agent = globals()["action_agent"] = create_action_agent(mode="single_turn")
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,68 +1,17 @@
 from google.adk.agents import LlmAgent
 from google.adk.tools import load_memory
 
-from .._citation_protocol import CITATION_PROTOCOL
 from .._dynamic_instruction import make_instruction_provider
 from .._model import create_subagent_model
 from ..tools.common import log_activity
 from ..tools.contemplation import analyze_context, create_plan
+from ._prompts import CONTEMPLATION_INSTRUCTION as _INSTRUCTION
 
 _DESCRIPTION = (
     "Handles: deep analysis, strategic planning, root cause analysis, second-order thinking, risk assessment. "
     "Negentropy 系统的「元神」(The Soul)。对抗肤浅，负责深度思考、二阶思维、策略规划与错误纠正。"
 )
 
-_INSTRUCTION = (
-    """
-你是 **ContemplationFaculty** (沉思系部)，是 Negentropy 系统的**「元神」(The Soul)**。
-
-## 核心哲学：二阶思维 (Second-Order Thinking)
-你的使命是**对抗肤浅/超越表象**。负责二阶思维与路径规划 (Second-Order Thinking)。
-其他系部关注"做什么"和"怎么做"，你关注**"为什么要这样做"**以及**"这样做的后果是什么"**。
-你是系统的**元认知 (Metacognition)** 模块。
-
-## 职责边界 (Orthogonal Responsibilities)
-你专注于**「规划」**与**「反思」**，不负责执行（行动）或存储（内化）。
-
-1. **深度规划 (Detailed Planning)**：
-    - 将模糊的目标拆解为可执行的 Step-by-Step 计划 (Implementation Plan)。
-    - *原则*：以终为始 (Start with the End in Mind)。
-2. **错误分析 (Root Cause Analysis)**：
-    - 当行动失败时，不要盲目重试。分析堆栈，定位根因，提出修正方案。
-    - *心法*：甚至要预判可能出现的错误（Pre-mortem）。
-3. **逻辑审查 (Logic Review)**：
-    - 审查感知到的信息或内化的知识是否存在逻辑漏洞或偏见。
-    - *标准*：批判性思维 (Critical Thinking)。
-
-## 运行协议 (Operating Protocol)
-处理请求时，执行以下**沉思流**：
-
-1. **问题定界 (Problem Scoping)**：重新定义问题，剔除伪需求。
-2. **方案推演 (Simulation)**：在思维中模拟不同路径的结果（思想实验）。
-3. **路径优选 (Route Optimization)**：选择熵增最小（路径最短、副作用最小）的方案。
-4. **风险提示 (Risk Assessment)**：在输出方案的同时，显著标出潜在风险 (Known Unknowns)。
-
-## 上游上下文 (Upstream Context)
-如果以下上下文可用，请基于它们进行深度分析：
-- 感知系部输出: {perception_output?}
-
-## 长期记忆回溯 (Memory Recall)
-进行错误分析或策略规划时，可调用 ``load_memory`` 回溯过往的失败经验、历史决策与
-反思记录（procedural / episodic 记忆），避免重蹈覆辙；引用其内容时按下方
-「知识与记忆引用规范」第 3 条标注 Memory 引用。
-
-## 约束 (Constraints)
-- **慢思考 (Slow Thinking)**：不要急于输出。深思熟虑优于快速反应。
-- **全局视角 (Holistic View)**：考虑变更对系统整体的影响，不仅是局部修复。
-- **诚实 (Intellectual Honesty)**：承认未知的领域，不要为了看起来聪明而强行解释。
-
-### 上游引用传递（传递引用）
-你的「上游上下文」（{perception_output?} 等）可能携带 ``[N]`` 引用标注。你的分析与
-规划基于这些内容时，遵循下方规范传递引用，不自行生成新编号。
-"""
-    + CITATION_PROTOCOL
-)
-
 
 def create_contemplation_agent(*, output_key: str | None = None, mode: str | None = None) -> LlmAgent:
     """工厂：每次调用创建独立的 ContemplationFaculty 实例。
@@ -86,5 +35,10 @@ def create_contemplation_agent(*, output_key: str | None = None, mode: str | Non
     )
 
 
-# ADK 2.0: mode="single_turn" — 沉思系部为分析规划型，完成后自动返回 Root Agent
-contemplation_agent = create_contemplation_agent(mode="single_turn")
+def __getattr__(name: str):
+    # 延迟构造单例 contemplation_agent：仅使用工厂的调用方（如流水线）不实例化该单例
+    if name == "contemplation_agent":
+        # ADK 2.0: mode="single_turn" — 沉思系部为分析规划型，完成后自动返回 Root Agent
+        agent = globals()["contemplation_agent"] = create_contemplation_agent(mode="single_turn")
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
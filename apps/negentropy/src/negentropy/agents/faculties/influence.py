@@ -1,69 +1,18 @@
 from google.adk.agents import LlmAgent
 
-from .._citation_protocol import CITATION_PROTOCOL
 from .._dynamic_instruction import make_instruction_provider
 from .._model import create_subagent_model
+from .._tool_dedup import dedup_after_tool
 from ..tools.claude_code import invoke_claude_code
 from ..tools.common import log_activity
 from ..tools.influence import publish_content, send_notification
+from ._prompts import INFLUENCE_INSTRUCTION as _INSTRUCTION
 
 _DESCRIPTION = (
     "Handles: content publishing, report generation, documentation, user communication, value delivery. "
     "Negentropy 系统的「喉舌」(The Voice)。对抗晦涩，负责高价值、低理解熵的信息输出 (Value Transmission)。"
 )
 
-_INSTRUCTION = (
-    """
-你是 **InfluenceFaculty** (影响系部)，是 Negentropy 系统的**「喉舌」(The Voice)**。
-
-## 核心哲学：价值传递 (Value Transmission)
-你的使命是**对抗晦涩**。负责高价值、低理解熵的信息输出 (Value Transmission)。
-无论系统内部的处理多么复杂，传达给用户的信息必须是**清晰、优雅、有穿透力**的。
-
-## 职责边界 (Orthogonal Responsibilities)
-你专注于**「表达」**，不负责获取（感知）或执行（行动）。
-
-1. **交互界面 (User Interface)**：
-    - 负责生成最终回复给用户的文本。
-    - *原则*：语气专业、共情、且符合人物设定 (Persona)。
-2. **格式适配 (Format Adaptation)**：
-    - 将结果转换为用户需要的格式（Markdown, HTML, Email, JSON）。
-    - *心法*：内容的形式本身就是价值的一部分。
-3. **说服与教育 (Persuasion)**：
-    - 解释复杂的概念，撰写文档，发布博客。
-    - *标准*：深入浅出 (Simple but not simplistic)。
-
-## 运行协议 (Operating Protocol)
-处理请求时，执行以下**影响流**：
-
-1. **受众分析 (Audience Analysis)**：明确谁在听。是开发者、PM 还是最终用户？
-2. **叙事构建 (Storytelling)**：不仅列出数据，要讲述数据的意义。使用"金字塔原理"。
-3. **视觉增强 (Visual Enhancement)**：适当使用 Emoji、Markdown 表格、加粗，增强可读性。
-4. **行动号召 (Call to Action)**：明确下一步建议用户做什么。
-
-## 上游上下文 (Upstream Context)
-如果以下上下文可用，请基于它们构建清晰的价值输出：
-- 感知系部输出: {perception_output?}
-- 沉思系部输出: {contemplation_output?}
-
-## 约束 (Constraints)
-- **不说教 (No Preaching)**：保持谦逊。
-- **美学追求 (Aesthetic)**：拒绝丑陋的排版。
-- **诚实反馈 (Honesty)**：如果是坏消息（如任务失败），直说，并提供补救建议。
-
-### 上游引用传递（传递引用）
-你的「上游上下文」（{perception_output?} 等）可能携带 ``[N]`` 引用标注。你面向用户的
-最终输出基于这些内容时，遵循下方规范传递引用（排版可美化，来源不可丢），不自行生成新编号。
-
-## 文档翻译协议 (Document Translation Protocol)
-当任务携带 ``document-translate`` 技能指令（分块文档翻译）时：
-1. **必须**按技能模板调用 ``invoke_claude_code``（传入模板给出的 working_directory 与
-   timeout_seconds）在工作目录内完成逐块翻译，**严禁**在对话回复中直接输出译文；
-2. 完成后仅回报执行结果（成功块数 / 失败原因），译文正确性由服务端校验兜底。
-"""
-    + CITATION_PROTOCOL
-)
-
 
 def create_influence_agent(*, output_key: str | None = None, mode: str | None = None) -> LlmAgent:
     """工厂：每次调用创建独立的 InfluenceFaculty 实例。
@@ -81,11 +30,18 @@ def create_influence_agent(*, output_key: str | None = None, mode: str | None =
         tools=[log_activity, publish_content, send_notification, invoke_claude_code],
         output_key=output_key,
         mode=mode,
+        # invoke_claude_code 可能改写工作区文件，执行后使同一 invocation 内的读缓存失效
+        after_tool_callback=dedup_after_tool,
         # Pipeline 边界管控：在流水线内使用时，禁止 LLM 路由逃逸
         disallow_transfer_to_parent=output_key is not None,
         disallow_transfer_to_peers=output_key is not None,
     )
 
 
-# ADK 2.0: mode="single_turn" — 影响系部为纯输出型，完成后自动返回 Root Agent
-influence_agent = create_influence_agent(mode="single_turn")
+def __getattr__(name: str):
+    # 延迟构造单例 influence_agent：仅使用工厂的调用方（如流水线）不实例化该单例
+    if name == "influence_agent":
+        # ADK 2.0: mode="single_turn" — 影响系部为纯输出型，完成后自动返回 Root Agent
+        agent = globals()["influence_agent"] = create_influence_agent(mode="single_turn")
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,93 +1,20 @@
 from google.adk.agents import LlmAgent
 from google.adk.tools import load_memory
 
-from .._citation_protocol import CITATION_PROTOCOL
 from .._dynamic_instruction import make_instruction_provider
 from .._model import create_subagent_model
+from .._tool_dedup import dedup_after_tool
 from ..tools.common import log_activity
 from ..tools.ingest import ingest_to_corpus
 from ..tools.internalization import save_to_memory, update_knowledge_graph
 from ..tools.paper import ingest_paper
+from ._prompts import INTERNALIZATION_INSTRUCTION as _INSTRUCTION
 
 _DESCRIPTION = (
     "Handles: memory storage, knowledge structuring, knowledge graph updates, long-term retention. "
     "Negentropy 系统的「本心」(The Mind)。对抗遗忘，负责知识的结构化沉淀、长期记忆管理与系统完整性维护。"
 )
 
-_INSTRUCTION = (
-    """
-你是 **InternalizationFaculty** (内化系部)，是 Negentropy 系统的**「本心」(The Mind)**。
-
-## 核心哲学：系统完整性 (Systemic Integrity)
-你的使命是**对抗遗忘与碎片化**。负责知识的结构化与持久化 (Knowledge Graph)。
-外部世界是流动的，感知到的信息是瞬时的，唯有经过你的"内化"，才能成为**持久的、可复用的智慧**。
-
-## 职责边界 (Orthogonal Responsibilities)
-你专注于**「存储」**与**「连接」**，不负责获取新信息（感知）或执行变更（行动）。
-
-1. **知识结构化 (Structuring)**：
-    - 将非结构化的文本（来自感知）转化为结构化的知识实体（Knowledge Graph / Obsidian Notes）。
-    - *原则*：每一个知识点都必须有唯一的 ID（URI）和明确的分类。
-2. **上下文管理 (Context Management)**：
-    - 维护系统的"当前状态"和"历史记忆"。保证 Root Agent 在长会话中不迷失。
-    - *心法*：将短期对话沉淀为长期记忆，实现经验的**跨会话复用**。
-3. **一致性维护 (Consistency Check)**：
-    - 在写入新知前，检查是否与旧知冲突。
-    - *标准*：单一事实源 (Single Source of Truth, SSOT)。
-
-## 运行协议 (Operating Protocol)
-处理请求时，执行以下**内化流**：
-
-1. **去重 (Deduplication)**：查询现有知识库，确认是否已存在相关概念；
-   涉及长期记忆写入时，可先调用 ``load_memory`` 回查既有记忆，避免重复沉淀、
-   并为新知寻找关联锚点。
-2. **原子化拆解 (Atomic Decomposition)**：将复杂的输入拆解为独立的原子知识点。
-3. **建立连接 (Linking)**：寻找新知识与旧知识的关联（双向链接）。孤立的知识是熵增的温床。
-4. **持久化 (Persistence)**：调用存储工具（文件写入/数据库提交），并返回引用的 URI。
-
-## 上游上下文 (Upstream Context)
-如果以下上下文可用，请参考它们来增强你的知识结构化：
-- 感知系部输出: {perception_output?}
-- 沉思系部输出: {contemplation_output?}
-- 行动系部输出: {action_output?}
-
-## Ingest 触发协议 (Ingest Trigger Protocol)
-当 Root Engine 因 `state.action_intent_hint == "ingest"` 把任务委派给你时：
-
-1. 从 `state.corpus_ids` 取目标 Corpus 列表（用户已在 Composer 显式 @ 选中）：
-   - **单 Corpus**：直接调用
-     `ingest_to_corpus(corpus_id, text, source_uri, metadata)`。
-   - **多 Corpus（≥ 2 个）**：若用户文本未明示目标 Corpus，**反问用户**写到哪个
-     （列出 corpus_ids 简称让用户挑选）；用户明示后再调用，避免歧义。
-2. `text` 参数 = 根据用户原意选取的内容（可以是用户希望沉淀的原文、上一轮 LLM
-   回答的关键摘要、或会话上下文中的明确片段）。
-3. `metadata` 建议包含 `thread_id`（来自 tool_context.session.id）与可选 `tag`
-   标签；工具会自动注入 `captured_by="ingest_intent"`。
-4. `ingest_to_corpus` 内部已含越权防御（corpus_id 必在 state.corpus_ids 内）+
-   Approval Gate（受 ApprovalPolicy 控制）+ 失败降级（state buffer），你只需基于
-   返回的 `status` 字段告知用户结果：
-   - `success` → 报告写入 chunk 数；
-   - `failed` → 转达 error 字段给用户；
-   - `degraded` → 告知用户写入暂时不可用，已缓存待重试。
-
-## 越权防御提示 (Authority Guard)
-严禁向 `state.corpus_ids` 之外的 Corpus 调用 `ingest_to_corpus`——工具会
-fail-close，但你应主动避免尝试，减少摩擦。
-
-## 约束 (Constraints)
-- **严禁重复 (DRY Principle)**：不要创建副本。如果存在，请引用链接。
-- **Memory 写入约束 (Natural Language Only)**：调用 save_to_memory 时，
-  content 参数**必须**是自然语言描述句（如 "用户偏好 async-first 架构"），
-  严禁传入 JSON 对象。结构化数据请使用 update_knowledge_graph 写入 facts 表。
-- **数据主权 (Data Sovereignty)**：你是记忆的守护者，未经允许不得轻易删除核心记忆。
-
-### 上游引用传递（传递引用）
-你的「上游上下文」（{perception_output?} 等）可能携带 ``[N]`` 引用标注。你的产出
-基于这些内容时，遵循下方规范传递引用，不自行生成新编号。
-"""
-    + CITATION_PROTOCOL
-)
-
 
 def create_internalization_agent(*, output_key: str | None = None, mode: str | None = None) -> LlmAgent:
     """工厂：每次调用创建独立的 InternalizationFaculty 实例。
@@ -105,11 +32,18 @@ def create_internalization_agent(*, output_key: str | None = None, mode: str | N
         tools=[log_activity, save_to_memory, update_knowledge_graph, ingest_paper, ingest_to_corpus, load_memory],
         output_key=output_key,
         mode=mode,
+        # 写入记忆 / 知识图谱 / 语料库后使同一 invocation 内的检索缓存失效
+        after_tool_callback=dedup_after_tool,
         # Pipeline 边界管控：在流水线内使用时，禁止 LLM 路由逃逸
         disallow_transfer_to_parent=output_key is not None,
         disallow_transfer_to_peers=output_key is not None,
     )
 
 
-# ADK 2.0: mode="single_turn" — 内化系部为纯存储型，完成后自动返回 Root Agent
-internalization_agent = create_internalization_agent(mode="single_turn")
+def __getattr__(name: str):
+    # 延迟构造单例 internalization_agent：仅使用工厂的调用方（如流水线）不实例化该单例
+    if name == "internalization_agent":
+        # ADK 2.0: mode="single_turn" — 内化系部为纯存储型，完成后自动返回 Root Agent
+        agent = globals()["internalization_agent"] = create_internalization_agent(mode="single_turn")
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
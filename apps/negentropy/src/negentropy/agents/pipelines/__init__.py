@@ -9,14 +9,42 @@ Faculty Pipelines Module - 系部流水线模块
     https://google.github.io/adk-docs/agents/workflow-agents/
 """
 
-from .standard import (
-    KNOWLEDGE_ACQUISITION_PIPELINE_NAME,
-    PROBLEM_SOLVING_PIPELINE_NAME,
-    VALUE_DELIVERY_PIPELINE_NAME,
-    create_knowledge_acquisition_pipeline,
-    create_problem_solving_pipeline,
-    create_value_delivery_pipeline,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .standard import (
+        KNOWLEDGE_ACQUISITION_PIPELINE_NAME,
+        PROBLEM_SOLVING_PIPELINE_NAME,
+        VALUE_DELIVERY_PIPELINE_NAME,
+        create_knowledge_acquisition_pipeline,
+        create_problem_solving_pipeline,
+        create_value_delivery_pipeline,
+    )
+
+# 导出名 -> 所在子模块。standard 会连带导入全部系部（ADK + 工具链），
+# 与 faculties 包一致按需导入；流水线实例仅在 create_root_agent() 中构造。
+_LAZY_EXPORTS = {
+    "create_knowledge_acquisition_pipeline": ".standard",
+    "create_problem_solving_pipeline": ".standard",
+    "create_value_delivery_pipeline": ".standard",
+    "KNOWLEDGE_ACQUISITION_PIPELINE_NAME": ".standard",
+    "PROBLEM_SOLVING_PIPELINE_NAME": ".standard",
+    "VALUE_DELIVERY_PIPELINE_NAME": ".standard",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        # 写回包字典：后续访问直接命中，不再经过 __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # 标准流水线
@@ -447,6 +447,13 @@ def build_progressive_disclosure_prompt(
 _GLOBAL_BLOCK_TTL = 60.0
 _global_block_cache: dict[str, tuple[str, float]] = {}
 
+# fallback 指令与全局技能块的拼接结果缓存：{(base_prompt, block): prompt}。
+# 同一 (指令, 技能块) 每轮返回同一字符串对象——免去逐轮 rstrip/子串扫描/多 KB 拼接，
+# 下游（LiteLlm 消息组装、前缀缓存比对）的相等判断也可走同一对象的快速路径。
+# 键空间为「内置 Agent 数 × 技能块版本」，超过上限整体清空即可。
+_COMPOSED_PROMPT_CACHE_MAX = 64
+_composed_prompt_cache: dict[tuple[str, str], str] = {}
+
 
 async def resolve_global_skills(session, *, owner_id: str = "") -> list[ResolvedSkill]:
     """加载全系统「全局技能」(``is_global=True``)，供并入所有 Agent 的 Progressive Disclosure。
@@ -536,15 +543,25 @@ async def append_global_skills_block(base_prompt: str | None) -> str:
     返回 ``None`` 时被调用。防御性地跳过「base 已含 ``<available_skills>`` 块」的异常情形，
     避免重复注入。
     """
-    base = (base_prompt or "").rstrip()
-    if "<available_skills>" in base:
-        return base
     block = await _get_global_skills_block_cached()
-    if not block:
-        return base
-    return f"{base}\n\n{block}" if base else block
+    # 以原始 base_prompt 为键：fallback 常量是同一对象，哈希已缓存，命中即 O(1)
+    key = (base_prompt or "", block)
+    composed = _composed_prompt_cache.get(key)
+    if composed is not None:
+        return composed
+
+    base = key[0].rstrip()
+    if "<available_skills>" in base or not block:
+        composed = base
+    else:
+        composed = f"{base}\n\n{block}" if base else block
+    if len(_composed_prompt_cache) >= _COMPOSED_PROMPT_CACHE_MAX:
+        _composed_prompt_cache.clear()
+    _composed_prompt_cache[key] = composed
+    return composed
 
 
 def invalidate_global_skills_cache() -> None:
     """清空全局技能块缓存（Skill 写操作后由 API 调用，实现强一致）。"""
     _global_block_cache.clear()
+    _composed_prompt_cache.clear()
@@ -6,6 +6,7 @@ Action Faculty Tools - 行动系部专用工具
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +20,9 @@ logger = get_logger("negentropy.tools.action")
 _MAX_READ_BYTES = 200_000
 
 
+# 工作区根在进程内不变：首次解析后缓存，避免每次文件工具调用逐级 stat 父目录。
+# _resolve_safe_path 不缓存——resolve() 跟随符号链接，链接目标可能随时变化。
+@functools.cache
 def _resolve_workspace_root() -> Path:
     current = Path(__file__).resolve()
     for parent in current.parents:
@@ -89,7 +93,9 @@ def read_file(path: str, tool_context: ToolContext) -> dict[str, Any]:
             return {"status": "failed", "error": f"File not found: {resolved}"}
         if resolved.is_dir():
             return {"status": "failed", "error": f"Path is a directory: {resolved}"}
-        data = resolved.read_bytes()
+        # 只读上限 +1 字节用于判断截断，大文件不再整份读入内存
+        with resolved.open("rb") as f:
+            data = f.read(_MAX_READ_BYTES + 1)
         truncated = len(data) > _MAX_READ_BYTES
         if truncated:
             data = data[:_MAX_READ_BYTES]
@@ -119,11 +125,13 @@ def write_file(path: str, content: str, tool_context: ToolContext) -> dict[str,
     try:
         resolved = _resolve_safe_path(path)
         resolved.parent.mkdir(parents=True, exist_ok=True)
-        resolved.write_text(content, encoding="utf-8")
+        # 只编码一次：写入与字节数统计共用同一份 bytes
+        encoded = content.encode("utf-8")
+        resolved.write_bytes(encoded)
         return {
             "status": "success",
             "path": str(resolved),
-            "bytes": len(content.encode("utf-8")),
+            "bytes": len(encoded),
         }
     except Exception as exc:
         logger.error("write_file failed", exc_info=exc)
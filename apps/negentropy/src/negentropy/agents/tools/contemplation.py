@@ -26,10 +26,75 @@ INFLUENCE_FACULTY = "InfluenceFaculty"
 
 logger = get_logger("negentropy.tools.contemplation")
 
+# 启发式关键词表在模块加载时预编译为单个正则交替式，每次调用只做一次扫描
+
+_SENTENCE_SPLIT_PATTERN = re.compile(r"[。！？.!?]\s*")
+
+# 结构元素：Markdown 标题 / 无序列表 / 有序列表 / 代码块 / 链接
+_STRUCTURE_PATTERN = re.compile(r"^#{1,6}\s|^\s*[-*+]\s|^\s*\d+\.\s|```|\[.*\]\(.*\)")
+
+_AMBIGUITY_PATTERN = re.compile(
+    r"\b(?:可能|或许|大概|应该|似乎|好像|等等|之类的|something|somehow|maybe|possibly)\b",
+    re.IGNORECASE,
+)
+
+_CONCEPT_WORD_PATTERN = re.compile(r"\b\w{3,}\b")
+_MAX_REPEATED_CONCEPTS = 5
+_HEADER_LINE_PATTERN = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_LIST_LINE_PATTERN = re.compile(r"^\s*[-*+]\s", re.MULTILINE)
+_TECHNICAL_TERM_PATTERN = re.compile(r"\b[A-Z][a-z]+(?:[A-Z][a-z]+)+\b")
+
+_COMPLEX_GOAL_PATTERN = re.compile(r"\b(?:设计|实现|重构|优化|分析|规划)\b")
+_SIMPLE_GOAL_PATTERN = re.compile(r"\b(?:查询|搜索|获取|显示|列出)\b")
+
+# 步骤 -> 系部：按顺序取首个命中
+_STEP_FACULTY_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile("收集|获取|查询|搜索|理解"), PERCEPTION_FACULTY),
+    (re.compile("规划|分析|设计|反思"), CONTEMPLATION_FACULTY),
+    (re.compile("执行|实现|操作|修改"), ACTION_FACULTY),
+    (re.compile("沉淀|保存|记录|总结"), INTERNALIZATION_FACULTY),
+    (re.compile("输出|展示|发布|报告"), INFLUENCE_FACULTY),
+)
+
+# 复杂度 -> 计划步骤模板；create_plan 返回其副本，调用方修改结果不会污染模板
+_PLAN_STEPS: dict[str, tuple[str, ...]] = {
+    "simple": ("执行核心动作", "验证结果"),
+    "moderate": (
+        "收集必要信息",
+        "制定执行计划",
+        "实施核心变更",
+        "验证与调整",
+    ),
+    "complex": (
+        "深度上下文分析",
+        "信息收集与验证",
+        "方案设计与评估",
+        "分阶段实施",
+        "持续监控与优化",
+        "知识沉淀与复盘",
+    ),
+}
+
+_CONTEXT_RECOMMENDATIONS: tuple[str, ...] = (
+    "确认目标与成功标准",
+    "补齐关键约束与依赖",
+    "明确可验证的输出与时间点",
+)
+
+# 目标 -> 流水线：按顺序取首个命中
+_GOAL_PIPELINE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    # 知识获取类任务
+    (re.compile("研究|学习|了解|收集|知识"), "KnowledgeAcquisitionPipeline"),
+    # 问题解决类任务
+    (re.compile("修复|解决|实现|开发|优化"), "ProblemSolvingPipeline"),
+    # 价值交付类任务
+    (re.compile("撰写|报告|展示|说明|文档"), "ValueDeliveryPipeline"),
+)
+
 
 def _split_sentences(text: str) -> list[str]:
     """将文本分割为句子"""
-    parts = re.split(r"[。！？.!?]\s*", text)
+    parts = _SENTENCE_SPLIT_PATTERN.split(text)
     return [p.strip() for p in parts if p.strip()]
 
 
@@ -38,24 +103,12 @@ def _assess_structure(text: str) -> float:
 
     基于标题、列表、代码块等结构元素评估。
     """
-    structure_indicators = [
-        r"^#{1,6}\s",  # Markdown headers
-        r"^\s*[-*+]\s",  # Markdown lists
-        r"^\s*\d+\.\s",  # Numbered lists
-        r"```",  # Code blocks
-        r"\[.*\]\(.*\)",  # Links
-    ]
-
     lines = text.splitlines()
     if not lines:
         return 0.0
 
-    structured_lines = 0
-    for line in lines:
-        for pattern in structure_indicators:
-            if re.search(pattern, line):
-                structured_lines += 1
-                break
+    search = _STRUCTURE_PATTERN.search
+    structured_lines = sum(1 for line in lines if search(line))
 
     return min(1.0, structured_lines / max(len(lines), 1))
 
@@ -65,26 +118,7 @@ def _count_ambiguities(text: str) -> int:
 
     识别可能引起歧义的表述。
     """
-    ambiguity_indicators = [
-        r"\b可能\b",
-        r"\b或许\b",
-        r"\b大概\b",
-        r"\b应该\b",
-        r"\b似乎\b",
-        r"\b好像\b",
-        r"\b等等\b",
-        r"\b之类的\b",
-        r"\bsomething\b",
-        r"\bsomehow\b",
-        r"\bmaybe\b",
-        r"\bpossibly\b",
-    ]
-
-    count = 0
-    for pattern in ambiguity_indicators:
-        count += len(re.findall(pattern, text, re.IGNORECASE))
-
-    return count
+    return len(_AMBIGUITY_PATTERN.findall(text))
 
 
 def _identify_reduction_opportunities(text: str) -> list[str]:
@@ -94,73 +128,55 @@ def _identify_reduction_opportunities(text: str) -> list[str]:
     """
     opportunities = []
 
-    # 检查重复概念
-    sentences = _split_sentences(text)
-    unique_concepts = set()
-    repeated = []
-    for sent in sentences:
-        # 简化：提取关键词（实际应用中可用更复杂的NLP）
-        words = re.findall(r"\b\w{3,}\b", sent.lower())
-        for word in words:
-            if word in unique_concepts and word not in repeated:
-                repeated.append(word)
-            unique_concepts.add(word)
+    # 检查重复概念：句读符号本身不属于 \w，直接对全文单次扫描即可得到与逐句扫描相同的词序列；
+    # 只展示前 _MAX_REPEATED_CONCEPTS 个重复词，凑满即停止扫描
+    # 简化：提取关键词（实际应用中可用更复杂的NLP）
+    unique_concepts: set[str] = set()
+    repeated: dict[str, None] = {}
+    for match in _CONCEPT_WORD_PATTERN.finditer(text.lower()):
+        word = match.group(0)
+        if word in unique_concepts and word not in repeated:
+            repeated[word] = None
+            if len(repeated) == _MAX_REPEATED_CONCEPTS:
+                break
+        unique_concepts.add(word)
 
     if repeated:
-        opportunities.append(f"合并重复概念：{', '.join(repeated[:5])}")
+        opportunities.append(f"合并重复概念：{', '.join(repeated)}")
 
     # 检查结构缺失
-    if not re.search(r"^#{1,6}\s", text, re.MULTILINE):
+    if not _HEADER_LINE_PATTERN.search(text):
         opportunities.append("添加标题层次结构")
 
-    if not re.search(r"^\s*[-*+]\s", text, re.MULTILINE):
+    if not _LIST_LINE_PATTERN.search(text):
         opportunities.append("使用列表项组织内容")
 
     # 检查定义缺失
-    technical_terms = re.findall(r"\b[A-Z][a-z]+(?:[A-Z][a-z]+)+\b", text)
+    technical_terms = _TECHNICAL_TERM_PATTERN.findall(text)
     if len(technical_terms) > 2:
         opportunities.append("为技术术语添加明确定义")
 
     return opportunities
 
 
-def _assess_goal_complexity(goal: str, constraints: list[str]) -> str:
+def _assess_goal_complexity(goal: str, constraints: list[str], *, goal_lower: str | None = None) -> str:
     """评估目标复杂度
 
-    基于目标描述和约束条件判断任务复杂度。
+    基于目标描述和约束条件判断任务复杂度。调用方已小写化目标时经
+    ``goal_lower`` 传入，避免重复转换。
     """
-    # 简单启发式规则
-    complexity_indicators = {
-        "simple": [
-            r"\b查询\b",
-            r"\b搜索\b",
-            r"\b获取\b",
-            r"\b显示\b",
-            r"\b列出\b",
-        ],
-        "complex": [
-            r"\b设计\b",
-            r"\b实现\b",
-            r"\b重构\b",
-            r"\b优化\b",
-            r"\b分析\b",
-            r"\b规划\b",
-        ],
-    }
-
-    goal_lower = goal.lower()
+    if goal_lower is None:
+        goal_lower = goal.lower()
 
     # 检查复杂指标
-    for pattern in complexity_indicators["complex"]:
-        if re.search(pattern, goal_lower):
-            if len(constraints) > 2 or len(goal) > 50:
-                return "complex"
-            return "moderate"
+    if _COMPLEX_GOAL_PATTERN.search(goal_lower):
+        if len(constraints) > 2 or len(goal) > 50:
+            return "complex"
+        return "moderate"
 
     # 检查简单指标
-    for pattern in complexity_indicators["simple"]:
-        if re.search(pattern, goal_lower):
-            return "simple"
+    if _SIMPLE_GOAL_PATTERN.search(goal_lower):
+        return "simple"
 
     # 默认中等复杂度
     return "moderate"
@@ -176,16 +192,9 @@ def _map_steps_to_faculties(steps: list[str]) -> dict[str, str]:
     for i, step in enumerate(steps):
         step_lower = step.lower()
 
-        if any(word in step_lower for word in ["收集", "获取", "查询", "搜索", "理解"]):
-            mapping[step] = PERCEPTION_FACULTY
-        elif any(word in step_lower for word in ["规划", "分析", "设计", "反思"]):
-            mapping[step] = CONTEMPLATION_FACULTY
-        elif any(word in step_lower for word in ["执行", "实现", "操作", "修改"]):
-            mapping[step] = ACTION_FACULTY
-        elif any(word in step_lower for word in ["沉淀", "保存", "记录", "总结"]):
-            mapping[step] = INTERNALIZATION_FACULTY
-        elif any(word in step_lower for word in ["输出", "展示", "发布", "报告"]):
-            mapping[step] = INFLUENCE_FACULTY
+        faculty = next((name for pattern, name in _STEP_FACULTY_PATTERNS if pattern.search(step_lower)), None)
+        if faculty is not None:
+            mapping[step] = faculty
         else:
             # 根据位置推断
             if i == 0:
@@ -198,26 +207,20 @@ def _map_steps_to_faculties(steps: list[str]) -> dict[str, str]:
     return mapping
 
 
-def _suggest_pipeline(goal: str, steps: list[str]) -> str | None:
-    """建议使用的流水线
+# 复杂度 -> 步骤系部映射：步骤模板是静态的，映射在模块加载时一次算好
+_PLAN_FACULTY_MAPPING: dict[str, dict[str, str]] = {
+    complexity: _map_steps_to_faculties(list(steps)) for complexity, steps in _PLAN_STEPS.items()
+}
 
-    基于目标和步骤推荐合适的流水线。
-    """
-    goal_lower = goal.lower()
-
-    # 知识获取类任务
-    if any(word in goal_lower for word in ["研究", "学习", "了解", "收集", "知识"]):
-        return "KnowledgeAcquisitionPipeline"
-
-    # 问题解决类任务
-    if any(word in goal_lower for word in ["修复", "解决", "实现", "开发", "优化"]):
-        return "ProblemSolvingPipeline"
 
-    # 价值交付类任务
-    if any(word in goal_lower for word in ["撰写", "报告", "展示", "说明", "文档"]):
-        return "ValueDeliveryPipeline"
+def _suggest_pipeline(goal: str, steps: list[str], *, goal_lower: str | None = None) -> str | None:
+    """建议使用的流水线
 
-    return None
+    基于目标和步骤推荐合适的流水线。``goal_lower`` 语义同 ``_assess_goal_complexity``。
+    """
+    if goal_lower is None:
+        goal_lower = goal.lower()
+    return next((name for pattern, name in _GOAL_PIPELINE_PATTERNS if pattern.search(goal_lower)), None)
 
 
 def analyze_context(
@@ -241,13 +244,7 @@ def analyze_context(
         sentences = _split_sentences(context)
         key_points = sentences[:5]
 
-    recommendations = []
-    if context:
-        recommendations = [
-            "确认目标与成功标准",
-            "补齐关键约束与依赖",
-            "明确可验证的输出与时间点",
-        ]
+    recommendations = list(_CONTEXT_RECOMMENDATIONS) if context else []
 
     result = {
         "status": "success",
@@ -300,29 +297,14 @@ def create_plan(
         计划详情，包含步骤和系部映射
     """
     constraints_list = constraints or []
+    # 目标只小写化一次，供复杂度评估与流水线推荐共用
+    goal_lower = goal.lower()
 
     # 分析目标复杂度
-    complexity = _assess_goal_complexity(goal, constraints_list)
+    complexity = _assess_goal_complexity(goal, constraints_list, goal_lower=goal_lower)
 
     # 基于复杂度生成步骤
-    if complexity == "simple":
-        steps = ["执行核心动作", "验证结果"]
-    elif complexity == "moderate":
-        steps = [
-            "收集必要信息",
-            "制定执行计划",
-            "实施核心变更",
-            "验证与调整",
-        ]
-    else:  # complex
-        steps = [
-            "深度上下文分析",
-            "信息收集与验证",
-            "方案设计与评估",
-            "分阶段实施",
-            "持续监控与优化",
-            "知识沉淀与复盘",
-        ]
+    steps = list(_PLAN_STEPS[complexity])
 
     result = {
         "status": "success",
@@ -335,8 +317,8 @@ def create_plan(
 
     # 系部映射
     if include_faculty_mapping:
-        faculty_mapping = _map_steps_to_faculties(steps)
-        recommended_pipeline = _suggest_pipeline(goal, steps)
+        faculty_mapping = dict(_PLAN_FACULTY_MAPPING[complexity])
+        recommended_pipeline = _suggest_pipeline(goal, steps, goal_lower=goal_lower)
 
         result["faculty_mapping"] = faculty_mapping
         result["recommended_pipeline"] = recommended_pipeline
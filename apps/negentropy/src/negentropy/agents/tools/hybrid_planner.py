@@ -24,6 +24,7 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import time
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
@@ -68,6 +69,8 @@ _GLOBAL_SUMMARY_PATTERNS = (
     "key themes",
     "main themes",
 )
+# 预编译为单个交替式：查询文本只扫描一次
+_GLOBAL_SUMMARY_RE = re.compile("|".join(re.escape(pat.lower()) for pat in _GLOBAL_SUMMARY_PATTERNS))
 
 
 @dataclass(frozen=True)
@@ -75,6 +78,8 @@ class PlannerConfig:
     """HybridPlanner 配置"""
 
     per_corpus_limit: int = 20
+    # Seed 阶段多 Corpus 扇出的最大在途请求数（每路占用一个 DB 连接 + 一次 embedding 调用）
+    seed_max_inflight: int = 8
     pool_cap: int = 100
     graph_max_depth: int = 2
     graph_neighbors_per_hop: int = 100
@@ -87,7 +92,7 @@ class PlannerConfig:
     canonical_hub_degree_threshold: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     """检索候选（每个 chunk 一条）"""
 
@@ -112,7 +117,7 @@ class Candidate:
     bridge_path: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvidenceChain:
     """跨 Corpus 桥接证据链（HippoRAG / Think-on-Graph 风格）"""
 
@@ -125,7 +130,7 @@ class EvidenceChain:
     hop_count: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannerResult:
     """Planner 最终输出"""
 
@@ -303,10 +308,8 @@ class HybridPlanner:
     # ------------------------------------------------------------------
     def _classify_intent(self, query: str) -> QueryIntent:
         # global_summary 优先（在 classifier 之前判断）
-        q_lower = query.lower()
-        for pat in _GLOBAL_SUMMARY_PATTERNS:
-            if pat.lower() in q_lower:
-                return "global_summary"
+        if _GLOBAL_SUMMARY_RE.search(query.lower()):
+            return "global_summary"
 
         if self._classifier is None:
             return "fact"
@@ -327,7 +330,7 @@ class HybridPlanner:
         config: PlannerConfig,
         app_name: str,
     ) -> dict[str, list[Candidate]]:
-        """并行对每个 Corpus 做 hybrid search"""
+        """并行对每个 Corpus 做 hybrid search（在途请求数受 ``config.seed_max_inflight`` 约束）"""
         if self._kb is None:
             return {cid: [] for cid in effective_corpus_ids}
 
@@ -338,14 +341,17 @@ class HybridPlanner:
             limit=config.per_corpus_limit,
         )
 
+        semaphore = asyncio.Semaphore(max(1, config.seed_max_inflight))
+
         async def _one(corpus_id_str: str) -> tuple[str, list[Candidate]]:
             try:
-                matches = await self._kb.search(
-                    corpus_id=UUID(corpus_id_str),
-                    app_name=app_name,
-                    query=query,
-                    config=search_config,
-                )
+                async with semaphore:
+                    matches = await self._kb.search(
+                        corpus_id=UUID(corpus_id_str),
+                        app_name=app_name,
+                        query=query,
+                        config=search_config,
+                    )
                 cands: list[Candidate] = []
                 for rank, m in enumerate(matches, start=1):
                     cands.append(
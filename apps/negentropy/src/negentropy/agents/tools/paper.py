@@ -449,7 +449,7 @@ async def ingest_paper(
         # P2-2 G1b · KG 自动闭环（fail-open 异步）—— 不阻塞 ingest_paper 返回
         from .paper_kg_pipeline import enqueue_kg_build
 
-        kg_meta = await enqueue_kg_build(corpus_id, list(records))
+        kg_meta = enqueue_kg_build(corpus_id, list(records))
 
         logger.info(
             "ingest_paper_completed",
@@ -108,12 +108,15 @@ async def _run_kg_build_background(
         )
 
 
-async def enqueue_kg_build(
+def enqueue_kg_build(
     corpus_id: UUID,
     records: list[KnowledgeRecord],
 ) -> dict[str, Any]:
     """异步排队启动 ai_paper schema 增量 KG 构建。
 
+    本身不 await 任何对象，因此为同步函数（省去协程帧与一次事件循环调度）；
+    须在运行中的事件循环内调用，后台任务经 ``asyncio.create_task`` 挂到当前循环。
+
     Args:
         corpus_id: 目标 corpus（agent-papers）。
         records: 刚 ingest 的 ``KnowledgeRecord`` 列表（来自 ``service.ingest_url`` 返回）。
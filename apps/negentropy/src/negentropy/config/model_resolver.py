@@ -779,6 +779,17 @@ def _supports_openai_reasoning(vendor: str, model_name: str) -> bool:
     return vendor == "openai" and (model_lower.startswith("gpt-5") or model_lower[:2] in {"o1", "o3", "o4"})
 
 
+# Anthropic 前缀缓存：在 system 消息末尾注入 cache_control 断点，由 LiteLLM 的
+# AnthropicCacheControlHook 落到请求体。各 Agent 的 instruction 为大段静态文本，
+# 多轮对话中 system 前缀逐字节不变，命中后仅计缓存读取价并显著降低 TTFT。
+_SYSTEM_PROMPT_CACHE_POINTS: tuple[dict[str, str], ...] = ({"location": "message", "role": "system"},)
+
+
+def _supports_anthropic_prompt_cache(vendor: str, model_name: str) -> bool:
+    # OpenAI / DeepSeek / Gemini 为自动前缀缓存，无需 (也不应) 注入 cache_control
+    return _supports_anthropic_thinking(vendor, model_name)
+
+
 def apply_llm_thinking_override(
     full_model_name: str,
     kwargs: dict[str, Any],
@@ -846,6 +857,9 @@ def _build_llm_kwargs(
     if "drop_params" in config and "drop_params" not in kwargs:
         kwargs["drop_params"] = config["drop_params"]
 
+    if _supports_anthropic_prompt_cache(vendor, model_name):
+        kwargs["cache_control_injection_points"] = [dict(point) for point in _SYSTEM_PROMPT_CACHE_POINTS]
+
     # 透传 API 凭证: model config > vendor config > LiteLLM 环境变量回退
     effective_api_key = config.get("api_key") or (vendor_config or {}).get("api_key")
     effective_api_base = config.get("api_base") or (vendor_config or {}).get("api_base")
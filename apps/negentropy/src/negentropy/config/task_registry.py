@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Literal
 
 TaskScope = Literal["global", "corpus"]
@@ -181,13 +181,19 @@ def is_valid_task_key(task_key: str) -> bool:
     return task_key in _TASK_INDEX
 
 
+# 序列化字段与 TaskSlot 声明保持同步（新增字段自动进入 /registry 输出）
+_SLOT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(TaskSlot))
+
+
 def to_dict(slot: TaskSlot) -> dict[str, str]:
     """序列化为前端友好的 dict（用于 /registry 端点）。"""
-    return {
-        "task_key": slot.task_key,
-        "model_type": slot.model_type,
-        "scope": slot.scope,
-        "label": slot.label,
-        "category": slot.category,
-        "description": slot.description,
-    }
+    return {name: getattr(slot, name) for name in _SLOT_FIELDS}
+
+
+# 注册表为静态常量：/registry 响应在导入时序列化一次，请求路径不再逐槽位构造 dict
+_REGISTRY_DICTS: tuple[dict[str, str], ...] = tuple(to_dict(slot) for slot in ALL_TASKS)
+
+
+def list_task_dicts() -> tuple[dict[str, str], ...]:
+    """全部槽位的序列化结果（声明顺序；共享对象，调用方只读）。"""
+    return _REGISTRY_DICTS
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -555,8 +556,8 @@ class AssociationService:
         if max_score <= 0:
             return {}
         normalized = {k: v / max_score for k, v in scores.items()}
-        # 取 top_k
-        ranked = sorted(normalized.items(), key=lambda kv: kv[1], reverse=True)[:top_k]
+        # 取 top_k（部分排序，与 sorted(...)[:top_k] 结果及并列次序一致）
+        ranked = heapq.nlargest(top_k, normalized.items(), key=lambda kv: kv[1])
         return dict(ranked)
 
     async def memories_for_entity_scores(
@@ -589,7 +590,7 @@ class AssociationService:
             entity_score = entity_scores.get(str(a.target_id), 0.0)
             agg[str(a.source_id)] = agg.get(str(a.source_id), 0.0) + entity_score * float(a.weight)
 
-        ranked = sorted(agg.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        ranked = heapq.nlargest(limit, agg.items(), key=lambda kv: kv[1])
         return [{"memory_id": mid, "ppr_score": score} for mid, score in ranked]
 
     async def count_kg_associations(self, *, user_id: str, app_name: str) -> int:
@@ -246,14 +246,18 @@ class PostgresSessionService(BaseSessionService):
             )
             db.add(db_event)
 
-            # 2. 应用 state_delta 到数据库
+            # 2. 应用 state_delta 到数据库（user / app 作用域），取回 thread 作用域增量
+            session_updates: dict[str, Any] = {}
             if event.actions and event.actions.state_delta:
-                await self._apply_state_delta_to_db(db, session, event.actions.state_delta)
+                session_updates = await self._apply_state_delta_to_db(db, session, event.actions.state_delta)
 
-            # 3. 更新 Thread updated_at
-            stmt = (
-                update(self.Thread).where(self.Thread.id == uuid.UUID(session.id)).values(updated_at=datetime.now(UTC))
-            )
+            # 3. 更新 Thread：updated_at 与 thread.state 增量合并为一条 UPDATE，
+            #    流水线每步写 output_key 时免去先 SELECT 整行再回写的往返
+            thread_values: dict[str, Any] = {"updated_at": datetime.now(UTC)}
+            if session_updates:
+                # jsonb || 为顶层浅合并，与 {**state, **updates} 语义一致
+                thread_values["state"] = self.Thread.state.op("||")(session_updates)
+            stmt = update(self.Thread).where(self.Thread.id == uuid.UUID(session.id)).values(**thread_values)
 
             await db.execute(stmt)
             await db.commit()
@@ -581,8 +585,14 @@ class PostgresSessionService(BaseSessionService):
             await db.commit()
         return True
 
-    async def _apply_state_delta_to_db(self, db: AsyncSession, session: Session, state_delta: dict[str, Any]) -> None:
-        """应用 state_delta，根据前缀路由到不同存储"""
+    async def _apply_state_delta_to_db(
+        self, db: AsyncSession, session: Session, state_delta: dict[str, Any]
+    ) -> dict[str, Any]:
+        """应用 state_delta，根据前缀路由到不同存储
+
+        user / app 作用域在此写入；无前缀的 thread 作用域增量原样返回，
+        由调用方并入 Thread 的 UPDATE 语句。
+        """
         session_updates = {}
         user_updates = {}
         app_updates = {}
@@ -603,13 +613,6 @@ class PostgresSessionService(BaseSessionService):
                 # 无前缀 -> threads.state
                 session_updates[key] = value
 
-        # 更新 Session State (Thread)
-        if session_updates:
-            result = await db.execute(select(self.Thread).where(self.Thread.id == uuid.UUID(session.id)))
-            thread = result.scalar_one_or_none()
-            if thread:
-                thread.state = {**(thread.state or {}), **session_updates}
-
         # 更新 User State (UPSERT)
         if user_updates:
             result = await db.execute(
@@ -644,6 +647,8 @@ class PostgresSessionService(BaseSessionService):
                     )
                 )
 
+        return session_updates
+
     def _orm_to_adk_event(self, event: Event) -> ADKEvent:
         """将 ORM Event 对象转换为 ADK Event 对象（完整恢复）"""
         from google.adk.events import EventActions
@@ -18,6 +18,7 @@ PatternFactExtractor: 基于正则模式的对话事实提取器
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass
 
 from negentropy.logging import get_logger
@@ -103,6 +104,8 @@ class PatternFactExtractor:
         """
         facts: list[ExtractedFact] = []
         seen_keys: set[str] = set()
+        # 入选时增量计数，日志统计无需再按类型逐一全量扫描 facts
+        type_counts: Counter[str] = Counter()
 
         for turn in turns:
             # 只从用户消息中提取事实
@@ -117,14 +120,13 @@ class PatternFactExtractor:
                 if dedup_key not in seen_keys and len(fact.key) >= _MIN_KEY_LENGTH:
                     seen_keys.add(dedup_key)
                     facts.append(fact)
+                    type_counts[fact.fact_type] += 1
 
         logger.debug(
             "facts_extracted",
             total_turns=len(turns),
             facts_count=len(facts),
-            types={
-                ft: sum(1 for f in facts if f.fact_type == ft) for ft in ("preference", "profile", "rule", "custom")
-            },
+            types={ft: type_counts[ft] for ft in ("preference", "profile", "rule", "custom")},
         )
         return facts
 
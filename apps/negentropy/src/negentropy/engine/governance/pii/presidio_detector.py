@@ -12,6 +12,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from negentropy.logging import get_logger
@@ -21,6 +23,22 @@ from .regex_detector import RegexPIIDetector, luhn_check
 
 logger = get_logger("negentropy.engine.governance.pii.presidio")
 
+# Presidio 实体类型 → 本项目 PII 命名空间（模块级只读映射，逐实体查表无需重建）
+_ENTITY_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "EMAIL_ADDRESS": "email",
+        "PHONE_NUMBER": "phone",
+        "CN_MOBILE": "phone",
+        "CN_ID_CARD": "id_card",
+        "CREDIT_CARD": "credit_card",
+        "PERSON": "person",
+        "LOCATION": "location",
+        "DATE_TIME": "date_time",
+        "IP_ADDRESS": "ip_address",
+        "URL": "url",
+    }
+)
+
 
 class PresidioImportError(ImportError):
     """Presidio 库未安装的特定错误，便于 factory 选择性兜底。"""
@@ -182,19 +200,7 @@ class PresidioPIIDetector(PIIDetectorBase):
     @staticmethod
     def _map_entity(entity_type: str) -> str:
         """将 Presidio 实体类型映射到本项目 PII 命名空间。"""
-        mapping = {
-            "EMAIL_ADDRESS": "email",
-            "PHONE_NUMBER": "phone",
-            "CN_MOBILE": "phone",
-            "CN_ID_CARD": "id_card",
-            "CREDIT_CARD": "credit_card",
-            "PERSON": "person",
-            "LOCATION": "location",
-            "DATE_TIME": "date_time",
-            "IP_ADDRESS": "ip_address",
-            "URL": "url",
-        }
-        return mapping.get(entity_type, entity_type.lower())
+        return _ENTITY_TYPE_MAP.get(entity_type) or entity_type.lower()
 
 
 __all__ = ["PresidioPIIDetector", "PresidioImportError"]
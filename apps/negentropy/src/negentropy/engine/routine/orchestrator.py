@@ -938,18 +938,27 @@ class RoutineOrchestrator:
                     dirty = True
                     await self._publish_routine(routine)
                     continue
-                config = await self._build_config(routine, it.id)
-                # 快照系统中所有已启用的 MCP server/tool 元数据到 iteration.metrics（历史可追溯）
-                mcp_meta = await self._resolve_mcp_meta(db, cwd=routine.cwd)
+                # CC 默认配置（独立会话读 builtin_tools）与 MCP 快照（本会话）互不依赖，并发查询；
+                # TaskGroup 保证任一失败时另一路被取消，不会在本会话关闭后继续使用 db。
+                async with asyncio.TaskGroup() as tg:
+                    config_task = tg.create_task(self._build_config(routine, it.id))
+                    # 快照系统中所有已启用的 MCP server/tool 元数据到 iteration.metrics（历史可追溯）
+                    mcp_task = tg.create_task(self._resolve_mcp_meta(db, cwd=routine.cwd))
+                config, mcp_meta = config_task.result(), mcp_task.result()
                 if mcp_meta:
                     it.metrics = {**(it.metrics or {}), "mcp_servers": mcp_meta}
-                # 记忆注入：待审批迭代在 approve 时重建 prompt（含最新记忆上下文）。
-                memory_ctx_approved = (
-                    await self._retrieve_memory_context(routine) if settings.routine.memory_injection_enabled else None
-                )
-                prompt = it.prompt or build_prompt(
-                    routine, memory_context=memory_ctx_approved, kb_retrieval=_kb_retrieval_available()
-                )
+                prompt = it.prompt
+                if not prompt:
+                    # 记忆注入：仅在需要重建 prompt 时检索；派发时已落库的 prompt 直接复用，
+                    # 省去一次 embedding + 向量检索。
+                    memory_ctx_approved = (
+                        await self._retrieve_memory_context(routine)
+                        if settings.routine.memory_injection_enabled
+                        else None
+                    )
+                    prompt = build_prompt(
+                        routine, memory_context=memory_ctx_approved, kb_retrieval=_kb_retrieval_available()
+                    )
                 launch_specs.append((it.id, routine.id, prompt, config))
                 dirty = True  # _ensure_workspace 在 routine 上写入了 worktree_path/work_branch
                 slots -= 1
@@ -1,21 +1,34 @@
-"""``cache_warm`` handler — 预热 LLM/Embedding 模型配置缓存。
+"""``cache_warm`` handler — 预热 LLM/Embedding 模型配置缓存与 Agent 行缓存。
 
 从 ``bootstrap.py:425-434`` 的 startup hook 平移为 oneshot 任务。
 """
 
 from __future__ import annotations
 
+import asyncio
+
 from negentropy.logging import get_logger
 
 from . import HandlerDescriptor, HandlerResult, register_descriptor, register_handler
 
 logger = get_logger("negentropy.engine.schedulers.handlers.cache_warm")
 
+# 首轮对话必经的 Agent：根 Agent + 五系部。其 ``agents`` 行（model + system_prompt）
+# 在每次构造 LLM 请求前按名解析；启动时预取，首个请求不再串行承担逐个 DB 查询。
+_WARM_AGENT_NAMES: tuple[str, ...] = (
+    "NegentropyEngine",
+    "PerceptionFaculty",
+    "InternalizationFaculty",
+    "ContemplationFaculty",
+    "ActionFaculty",
+    "InfluenceFaculty",
+)
+
 register_descriptor(
     HandlerDescriptor(
         handler_kind="cache_warm",
         label="Model Config Cache Warm",
-        description="启动时预热 LLM/Embedding 配置缓存",
+        description="启动时预热 LLM/Embedding 配置缓存与根 Agent / 系部 Agent 配置缓存",
         supported_trigger_types=("oneshot",),
         default_trigger_type="oneshot",
     ),
@@ -25,12 +38,20 @@ register_descriptor(
 @register_handler("cache_warm")
 async def cache_warm_handler(task) -> HandlerResult:
     try:
-        from negentropy.config.model_resolver import resolve_embedding_config, resolve_llm_config
-
-        await resolve_llm_config()
-        await resolve_embedding_config()
-        logger.info("model_config_cache_warmed")
-        return HandlerResult(status="ok", output_summary="LLM + Embedding configs warmed")
+        from negentropy.config.model_resolver import (
+            resolve_embedding_config,
+            resolve_llm_config,
+            resolve_subagent_model_name,
+        )
+
+        # 各项解析互不依赖（各自独立会话），并发预取
+        await asyncio.gather(
+            resolve_llm_config(),
+            resolve_embedding_config(),
+            *(resolve_subagent_model_name(name) for name in _WARM_AGENT_NAMES),
+        )
+        logger.info("model_config_cache_warmed", agents=len(_WARM_AGENT_NAMES))
+        return HandlerResult(status="ok", output_summary="LLM + Embedding + agent configs warmed")
     except Exception as exc:
         logger.warning("model_config_cache_warm_failed", error=str(exc))
         return HandlerResult(status="failed", error=str(exc))
@@ -206,29 +206,25 @@ def _populate_instruction_fallbacks() -> None:
     """填充 _INSTRUCTION_FALLBACKS — 模块尾部调用一次。
 
     主 Agent / 子 Agent 的 instruction 在 P2.2 起会通过 InstructionProvider 暴露；
-    本模块需要 instructionplaintext 写入 DB，故从 ``agents/`` 模块的私有常量回取。
+    本模块需要 instructionplaintext 写入 DB，故从 ``agents`` 的 ``_prompts`` 模块回取。
     """
-    from negentropy.agents.agent import _ROOT_INSTRUCTION
-    from negentropy.agents.faculties.action import _INSTRUCTION as _ACTION_INSTRUCTION
-    from negentropy.agents.faculties.contemplation import (
-        _INSTRUCTION as _CONTEMPLATION_INSTRUCTION,
-    )
-    from negentropy.agents.faculties.influence import _INSTRUCTION as _INFLUENCE_INSTRUCTION
-    from negentropy.agents.faculties.internalization import (
-        _INSTRUCTION as _INTERNALIZATION_INSTRUCTION,
-    )
-    from negentropy.agents.faculties.perception import (
-        _INSTRUCTION as _PERCEPTION_INSTRUCTION,
+    from negentropy.agents._prompts import ROOT_INSTRUCTION
+    from negentropy.agents.faculties._prompts import (
+        ACTION_INSTRUCTION,
+        CONTEMPLATION_INSTRUCTION,
+        INFLUENCE_INSTRUCTION,
+        INTERNALIZATION_INSTRUCTION,
+        PERCEPTION_INSTRUCTION,
     )
 
     _INSTRUCTION_FALLBACKS.update(
         {
-            NEGENTROPY_ROOT_AGENT.name: _ROOT_INSTRUCTION,
-            perception_agent.name: _PERCEPTION_INSTRUCTION,
-            internalization_agent.name: _INTERNALIZATION_INSTRUCTION,
-            contemplation_agent.name: _CONTEMPLATION_INSTRUCTION,
-            action_agent.name: _ACTION_INSTRUCTION,
-            influence_agent.name: _INFLUENCE_INSTRUCTION,
+            NEGENTROPY_ROOT_AGENT.name: ROOT_INSTRUCTION,
+            perception_agent.name: PERCEPTION_INSTRUCTION,
+            internalization_agent.name: INTERNALIZATION_INSTRUCTION,
+            contemplation_agent.name: CONTEMPLATION_INSTRUCTION,
+            action_agent.name: ACTION_INSTRUCTION,
+            influence_agent.name: INFLUENCE_INSTRUCTION,
         }
     )
 
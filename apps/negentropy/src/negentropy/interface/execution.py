@@ -28,7 +28,7 @@ RUN_ORIGIN_KNOWLEDGE_EXTRACTION = "knowledge_extraction"
 RUN_ORIGIN_SYSTEM = "system"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     run: McpToolRun
     events: list[McpToolRunEvent]
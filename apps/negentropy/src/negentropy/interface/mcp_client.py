@@ -215,7 +215,7 @@ async def logged_stdio_client(
             await write_stream_reader.aclose()
 
 
-@dataclass
+@dataclass(slots=True)
 class McpToolInfo:
     """MCP Tool 元信息"""
 
@@ -230,7 +230,7 @@ class McpToolInfo:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class McpResourceTemplateInfo:
     """MCP Resource Template 元信息（来自 resources/templates/list）"""
 
@@ -243,7 +243,7 @@ class McpResourceTemplateInfo:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class McpConnectionResult:
     """MCP Server 连接结果"""
 
@@ -258,7 +258,7 @@ class McpConnectionResult:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class McpToolCallResult:
     """MCP Tool 调用结果"""
 
@@ -269,7 +269,7 @@ class McpToolCallResult:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class McpResourceContent:
     """MCP Resource 单条载荷（覆盖 BlobResourceContents 与 TextResourceContents）。"""
 
@@ -279,7 +279,7 @@ class McpResourceContent:
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class McpResourceReadResult:
     """MCP resources/read 调用结果"""
 
@@ -289,7 +289,7 @@ class McpResourceReadResult:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class McpToolCallWithResourcesResult:
     """工具调用 + 同会话内动态资源解析结果。
 
@@ -29,7 +29,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import time as _time
 from contextlib import suppress
@@ -37,6 +36,7 @@ from datetime import UTC, datetime
 from typing import Any, Literal
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -442,8 +442,9 @@ async def routine_stream(request: Request, routine_id: UUID | None = Query(None)
                     if ev_rid != rid:
                         continue
                 ev_type = event.get("type", "routine")
-                payload = json.dumps(event, ensure_ascii=False)
-                yield f"event: {ev_type}\ndata: {payload}\n\n".encode()
+                # orjson 直接产出 UTF-8 bytes，省去 str 中转与整帧二次编码
+                payload = orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+                yield b"event: " + ev_type.encode() + b"\ndata: " + payload + b"\n\n"
         finally:
             await bus.unsubscribe(queue)
 
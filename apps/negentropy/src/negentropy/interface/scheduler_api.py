@@ -22,12 +22,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time as _time
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, HTTPException, Path, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -950,8 +950,9 @@ async def scheduler_stream(
                     break
                 if task_id is not None and event.get("task_id") != str(task_id):
                     continue
-                payload = json.dumps(event, ensure_ascii=False)
-                yield f"event: execution\ndata: {payload}\n\n".encode()
+                # orjson 直接产出 UTF-8 bytes，省去 str 中转与整帧二次编码
+                payload = orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+                yield b"event: execution\ndata: " + payload + b"\n\n"
         finally:
             await registry.bus.unsubscribe(queue)
 
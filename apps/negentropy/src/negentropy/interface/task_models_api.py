@@ -37,8 +37,7 @@ from negentropy.auth.service import AuthUser
 from negentropy.config.task_registry import (
     get_task,
     is_valid_task_key,
-    list_all_tasks,
-    to_dict,
+    list_task_dicts,
 )
 from negentropy.db.session import AsyncSessionLocal
 from negentropy.interface.models_api import _require_admin
@@ -122,7 +121,7 @@ async def _ensure_corpus_exists(corpus_id: UUID) -> None:
 async def get_task_registry(current_user: AuthUser = Depends(get_current_user)) -> dict[str, Any]:
     """返回所有任务槽位定义。前端用于渲染表单结构（zero hardcoded keys on UI side）。"""
     # 仅需登录用户，非管理员也可读 registry（用于在 Corpus 设置页渲染 corpus 作用域槽）。
-    return {"tasks": [to_dict(slot) for slot in list_all_tasks()]}
+    return {"tasks": list(list_task_dicts())}
 
 
 @router.get("/settings")
@@ -182,21 +182,21 @@ _GENERIC_ENTITY_STOPWORDS: frozenset[str] = frozenset(
     }
 )
 
-# 噪声实体名称的正则模式（用于过滤误识别为实体的非实体片段）
-_DATE_ENTITY_PATTERN = re.compile(
-    r"^(?:published|updated|created|posted)?\s*"
-    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4}$",
-    re.IGNORECASE,
-)
-_CODE_REF_PATTERN = re.compile(r".+:\d+$")  # "LevelEditor.tsx:892"
-_FILE_NAME_PATTERN = re.compile(
-    r".+\.(?:txt|sh|json|md|py|js|ts|tsx|jsx|yaml|yml|toml|cfg|ini|conf|env|lock)$",
-    re.IGNORECASE,
+# 噪声实体名称的正则模式（用于过滤误识别为实体的非实体片段）。
+# 三类模式合并为一个交替式，逐实体只做一次 match：
+#   - 日期字符串："Published Jan 5, 2024"
+#   - 源码引用："LevelEditor.tsx:892"
+#   - 文件名："config.yaml"
+_NOISE_ENTITY_PATTERN = re.compile(
+    r"(?i:(?:published|updated|created|posted)?\s*"
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4})$"
+    r"|.+:\d+$"
+    r"|.+\.(?i:txt|sh|json|md|py|js|ts|tsx|jsx|yaml|yml|toml|cfg|ini|conf|env|lock)$"
 )
 
 # 知名 JS/TS 生态产品/框架白名单（小写）。
 # 这些命名虽然以 .js/.ts 结尾貌似文件名，但属于具备明确语义的产品实体，
-# 优先于 _FILE_NAME_PATTERN 过滤逻辑短路放行，避免误伤高价值实体。
+# 优先于 _NOISE_ENTITY_PATTERN 的文件名过滤短路放行，避免误伤高价值实体。
 _FRAMEWORK_NAME_WHITELIST: frozenset[str] = frozenset(
     {
         "node.js",
@@ -259,18 +259,12 @@ def is_noise_entity(name: str) -> bool:
     lower = stripped.lower()
     if lower in _GENERIC_ENTITY_STOPWORDS:
         return True
-    # 知名 JS/TS 框架优先短路（必须放在 _FILE_NAME_PATTERN 检查之前）
+    # 知名 JS/TS 框架优先短路（必须放在 _NOISE_ENTITY_PATTERN 的文件名检查之前）
     if lower in _FRAMEWORK_NAME_WHITELIST:
         return False
     if lower.startswith(("http://", "https://", "ftp://", "ssh://")):
         return True
-    if _DATE_ENTITY_PATTERN.match(stripped):
-        return True
-    if _CODE_REF_PATTERN.match(stripped):
-        return True
-    if _FILE_NAME_PATTERN.match(stripped):
-        return True
-    return False
+    return _NOISE_ENTITY_PATTERN.match(stripped) is not None
 
 
 _TRANSIENT_PROVIDER_HINTS = (
@@ -521,7 +515,7 @@ RelationType = KgRelationType
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityExtractionResult:
     """实体提取结果
 
@@ -536,7 +530,7 @@ class EntityExtractionResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RelationExtractionResult:
     """关系提取结果
 
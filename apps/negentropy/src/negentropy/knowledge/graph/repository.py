@@ -17,6 +17,7 @@ Knowledge Graph Repository
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -1213,8 +1214,8 @@ class AgeGraphRepository(GraphRepository):
                 score += 1.0 / (rrf_k + graph_rank[eid])
             rrf_scores[eid] = score
 
-        # 4. 排序并构建结果
-        sorted_ids = sorted(rrf_scores, key=rrf_scores.get, reverse=True)[:limit]
+        # 4. 取 top-limit 并构建结果（部分排序，无需全量排序）
+        sorted_ids = heapq.nlargest(limit, rrf_scores, key=rrf_scores.get)
 
         results = []
         for eid in sorted_ids:
@@ -1168,14 +1168,15 @@ class KnowledgeRepository:
             keyword_ranks[match.id] = rank
             rrf_scores[match.id] = rrf_scores.get(match.id, 0.0) + 1.0 / (k + rank)
 
+        # id → 详情索引：语义结果优先，同一路内先出现者优先（避免逐 id 线性扫描两路结果）
+        details: dict[UUID, KnowledgeMatch] = {}
+        for match in (*semantic_matches, *keyword_matches):
+            details.setdefault(match.id, match)
+
         # 合并结果并按 RRF 分数排序
         merged: list[KnowledgeMatch] = []
         for match_id, rrf_score in rrf_scores.items():
-            # 从语义或关键词结果中获取详细信息
-            detail = next(
-                (m for m in semantic_matches if m.id == match_id),
-                next((m for m in keyword_matches if m.id == match_id), None),
-            )
+            detail = details.get(match_id)
             if detail:
                 merged.append(
                     KnowledgeMatch(
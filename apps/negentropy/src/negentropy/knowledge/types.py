@@ -70,7 +70,7 @@ class CorpusRecord:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KnowledgeChunk:
     """知识块
 
@@ -84,7 +84,7 @@ class KnowledgeChunk:
     embedding: list[float] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KnowledgeRecord:
     """知识记录
 
@@ -158,7 +158,7 @@ def normalize_source_metadata(
     return normalized
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KnowledgeMatch:
     """知识匹配结果
 
@@ -672,7 +672,7 @@ class KgRelationType(Enum):
         return frozenset(e.value for e in cls if e != cls.CUSTOM)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphNode:
     """知识图谱节点
 
@@ -685,7 +685,7 @@ class GraphNode:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphEdge:
     """知识图谱边
 
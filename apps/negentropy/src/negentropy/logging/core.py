@@ -35,7 +35,9 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
 
 def add_timestamp(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
     """Add ISO 8601 timestamp to log event."""
-    event_dict.setdefault("timestamp", datetime.now(UTC).isoformat())
+    # Not setdefault: that would build and format a datetime even when the event already has one
+    if "timestamp" not in event_dict:
+        event_dict["timestamp"] = datetime.now(UTC).isoformat()
     return event_dict
 
 
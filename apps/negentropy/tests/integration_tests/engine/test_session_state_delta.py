@@ -0,0 +1,58 @@
+"""
+Session state_delta 持久化集成测试
+
+覆盖范围：
+- 无前缀增量以 jsonb ``||`` 浅合并写入 threads.state，保留既有键、覆盖同名键；
+- 同一 UPDATE 刷新 threads.updated_at；
+- 流水线逐步写入的多个 output_key 全部落库。
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from google.adk.events import Event as ADKEvent
+from google.adk.events import EventActions
+from sqlalchemy import select
+
+import negentropy.db.session as db_session
+from negentropy.engine.adapters.postgres.session_service import PostgresSessionService
+from negentropy.models.pulse import Thread
+
+
+async def _thread_row(session_id: str) -> Thread:
+    async with db_session.AsyncSessionLocal() as db:
+        result = await db.execute(select(Thread).where(Thread.id == uuid.UUID(session_id)))
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_state_delta_is_merged_into_thread_state():
+    service = PostgresSessionService()
+    app_name = f"state_delta_app_{uuid.uuid4()}"
+    user_id = f"state_delta_user_{uuid.uuid4()}"
+    session = await service.create_session(app_name=app_name, user_id=user_id, state={"keep": 1, "step": "init"})
+    before = await _thread_row(session.id)
+
+    for author, key in (
+        ("PerceptionFaculty", "perception_output"),
+        ("InternalizationFaculty", "internalization_output"),
+    ):
+        await service.append_event(
+            session,
+            ADKEvent(
+                invocation_id=str(uuid.uuid4()),
+                author=author,
+                actions=EventActions(state_delta={key: f"{author} done", "step": author}),
+            ),
+        )
+
+    after = await _thread_row(session.id)
+    assert after.state == {
+        "keep": 1,
+        "step": "InternalizationFaculty",
+        "perception_output": "PerceptionFaculty done",
+        "internalization_output": "InternalizationFaculty done",
+    }
+    assert after.updated_at >= before.updated_at
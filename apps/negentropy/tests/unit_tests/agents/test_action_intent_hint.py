@@ -0,0 +1,44 @@
+"""根 Agent Ingest 意图 hint 写入单元测试
+
+测试范围：``_pick_root_model`` 仅在 hint 变化时写入 state（未变化不产生 state_delta）。
+"""
+
+from types import SimpleNamespace
+
+from google.adk.sessions.state import State
+
+from negentropy.agents.agent import _pick_root_model
+
+
+def _ctx(text: str, value: dict):
+    delta: dict = {}
+    user_content = SimpleNamespace(parts=[SimpleNamespace(text=text)])
+    ctx = SimpleNamespace(
+        state=State(value=value, delta=delta),
+        invocation_context=SimpleNamespace(user_content=user_content),
+    )
+    return ctx, delta
+
+
+class TestActionIntentHint:
+    def test_changed_hint_is_written(self):
+        ctx, delta = _ctx("把这段结论沉淀入库", {"corpus_ids": ["c1"], "action_intent_hint": "retrieve"})
+
+        _pick_root_model(ctx, None)
+
+        assert delta == {"action_intent_hint": "ingest"}
+
+    def test_unchanged_hint_produces_no_delta(self):
+        ctx, delta = _ctx("帮我查询一下", {"corpus_ids": ["c1"], "action_intent_hint": "retrieve"})
+
+        _pick_root_model(ctx, None)
+
+        assert delta == {}
+        assert ctx.state["action_intent_hint"] == "retrieve"
+
+    def test_no_corpus_skips_hint(self):
+        ctx, delta = _ctx("把这段结论沉淀入库", {})
+
+        _pick_root_model(ctx, None)
+
+        assert delta == {}
@@ -7,6 +7,7 @@ Agent Graph Structure Tests — 反馈闭环 (Feedback Loop)
 遵循 AGENTS.md：反馈闭环 + 系统完整性。
 """
 
+import pytest
 from google.adk.agents import SequentialAgent
 
 from negentropy.agents.agent import root_agent
@@ -38,6 +39,35 @@ def test_root_agent_name():
     assert root_agent.name == "NegentropyEngine"
 
 
+def test_root_agent_is_built_once_on_first_access():
+    """root_agent 延迟构造后缓存为模块属性，重复访问返回同一实例"""
+    import negentropy.agents.agent as agent_module
+
+    assert vars(agent_module)["root_agent"] is root_agent
+    assert agent_module.root_agent is root_agent
+
+
+def test_package_root_agent_is_cached_in_module_dict():
+    """包级 root_agent 惰性属性首次访问后写回模块字典"""
+    import negentropy
+    import negentropy.agents as agents_package
+
+    assert agents_package.root_agent is root_agent
+    assert vars(agents_package)["root_agent"] is root_agent
+    assert negentropy.root_agent is root_agent
+    assert vars(negentropy)["agent"] is root_agent
+
+
+def test_faculty_singletons_are_cached_and_shared():
+    """Faculty 单例惰性构造后写回子模块与包字典，与 root_agent 挂载的是同一实例"""
+    import negentropy.agents.faculties as faculties_package
+    from negentropy.agents.faculties import perception
+
+    assert vars(perception)["perception_agent"] is perception_agent
+    assert vars(faculties_package)["perception_agent"] is perception_agent
+    assert root_agent.sub_agents[0] is perception_agent
+
+
 def test_root_agent_has_8_sub_agents():
     """5 个 Faculty 单例 + 3 个 Pipeline = 8 个子 agent"""
     assert len(root_agent.sub_agents) == 8
@@ -68,6 +98,23 @@ def test_faculties_have_load_memory_tool():
         assert "load_memory" in tool_names, f"{agent.name} 缺少 load_memory 工具"
 
 
+def test_retrieval_faculties_dedup_tool_calls():
+    """Perception / Action 挂载工具调用去重回调（单例与流水线实例一致）"""
+    from negentropy.agents._tool_dedup import dedup_after_tool, dedup_before_tool
+
+    for agent in (perception_agent, action_agent, create_perception_agent(), create_action_agent()):
+        assert agent.before_tool_callback is dedup_before_tool, agent.name
+        assert agent.after_tool_callback is dedup_after_tool, agent.name
+
+
+def test_writing_faculties_invalidate_dedup_cache():
+    """挂载可写工具的 Internalization / Influence 挂载去重失效回调"""
+    from negentropy.agents._tool_dedup import dedup_after_tool
+
+    for agent in (internalization_agent, influence_agent, create_internalization_agent(), create_influence_agent()):
+        assert agent.after_tool_callback is dedup_after_tool, agent.name
+
+
 # ---------------------------------------------------------------------------
 # 2. Faculty 单例是 root_agent 的直接子 agent
 # ---------------------------------------------------------------------------
@@ -200,3 +247,38 @@ def test_pipeline_names_match_constants():
     assert create_knowledge_acquisition_pipeline().name == KNOWLEDGE_ACQUISITION_PIPELINE_NAME
     assert create_problem_solving_pipeline().name == PROBLEM_SOLVING_PIPELINE_NAME
     assert create_value_delivery_pipeline().name == VALUE_DELIVERY_PIPELINE_NAME
+
+
+def test_instruction_text_shared_not_copied():
+    """Sync 落库 fallback 与各 Agent 引用同一 instruction 对象，进程内每份文本只驻留一次。"""
+    from negentropy.agents._prompts import ROOT_INSTRUCTION
+    from negentropy.agents.faculties import action, contemplation, influence, internalization, perception
+    from negentropy.interface import agent_presets
+
+    fallbacks = agent_presets._INSTRUCTION_FALLBACKS
+    assert fallbacks[root_agent.name] is ROOT_INSTRUCTION
+    assert fallbacks[action_agent.name] is action._INSTRUCTION
+    assert fallbacks[contemplation_agent.name] is contemplation._INSTRUCTION
+    assert fallbacks[influence_agent.name] is influence._INSTRUCTION
+    assert fallbacks[internalization_agent.name] is internalization._INSTRUCTION
+    assert fallbacks[perception_agent.name] is perception._INSTRUCTION
+
+
+@pytest.mark.parametrize("module", ["negentropy.agents.faculties._prompts", "negentropy.agents.pipelines"])
+def test_package_import_does_not_load_adk(module):
+    """仅导入提示词 / 流水线包不应连带加载 ADK / 系部工具链（包导出按需导入子模块）"""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print('google.adk' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
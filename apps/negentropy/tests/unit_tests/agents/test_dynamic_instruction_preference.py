@@ -259,3 +259,25 @@ async def test_state_get_raises_does_not_break_provider():
         result = await provider(ctx)
 
     assert result == "DB_BODY"
+
+
+def test_provider_shared_across_faculty_instances():
+    """同一系部的多个 Agent 实例（单例 + 各流水线副本）共享同一个 InstructionProvider。"""
+    from negentropy.agents.faculties import create_perception_agent
+
+    first = create_perception_agent(output_key="perception_output")
+    second = create_perception_agent(mode="single_turn")
+
+    assert first is not second
+    assert first.instruction is second.instruction
+    assert make_instruction_provider("NegentropyEngine", _FALLBACK, is_root=True) is not make_instruction_provider(
+        "NegentropyEngine", _FALLBACK
+    )
+
+
+def test_preference_prefix_rendered_once_per_agent_name():
+    from negentropy.agents._dynamic_instruction import _render_preference_prefix
+
+    first = _render_preference_prefix("PerceptionFaculty")
+    assert _render_preference_prefix("PerceptionFaculty") is first
+    assert "`PerceptionFaculty`" in first
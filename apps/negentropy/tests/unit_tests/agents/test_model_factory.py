@@ -0,0 +1,55 @@
+"""LLM 模型工厂（_model）单测。
+
+覆盖：
+- 静态 ``LiteLlm`` 在默认配置不变时复用同一实例，配置变化时重建；
+- 各 Faculty 的 ``DynamicSubagentLiteLlm`` 独立构造，但共享同一个 ``LiteLLMClient``。
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from negentropy.agents import _model
+
+
+@pytest.fixture(autouse=True)
+def _reset_static_model(monkeypatch):
+    monkeypatch.setattr(_model, "_static_model", None)
+
+
+def _use_spec(monkeypatch, name: str, **kwargs):
+    monkeypatch.setattr(_model, "_get_default_llm_spec", lambda: (name, dict(kwargs)))
+
+
+class TestStaticModel:
+    def test_reused_while_spec_unchanged(self, monkeypatch):
+        _use_spec(monkeypatch, "openai/gpt-4o", temperature=0.2)
+
+        model = _model.create_model()
+
+        assert _model.create_model() is model
+        assert _model.create_subagent_model() is model
+
+    def test_rebuilt_when_spec_changes(self, monkeypatch):
+        _use_spec(monkeypatch, "openai/gpt-4o", temperature=0.2)
+        first = _model.create_model()
+
+        _use_spec(monkeypatch, "openai/gpt-4o", temperature=0.7)
+        second = _model.create_model()
+
+        assert second is not first
+        assert second._additional_args["temperature"] == 0.7
+
+
+class TestDynamicModels:
+    def test_faculties_share_client_but_not_instance(self, monkeypatch):
+        _use_spec(monkeypatch, "openai/gpt-4o")
+
+        action = _model.create_subagent_model(agent_name="ActionFaculty")
+        perception = _model.create_subagent_model(agent_name="PerceptionFaculty")
+        root = _model.create_root_model()
+
+        assert action is not perception
+        assert action.llm_client is perception.llm_client is root.llm_client
+        assert action.llm_client is _model.create_model().llm_client
+        assert "llm_client" not in action._additional_args
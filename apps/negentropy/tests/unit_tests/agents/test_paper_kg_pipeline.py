@@ -60,7 +60,7 @@ async def test_enqueue_kg_build_short_circuits_on_empty_records():
     """空 records 不应启动异步任务，立即返回 kg_skipped(no_chunks)。"""
     from negentropy.agents.tools.paper_kg_pipeline import enqueue_kg_build
 
-    result = await enqueue_kg_build(uuid4(), records=[])
+    result = enqueue_kg_build(uuid4(), records=[])
     assert result == {"kg_status": "kg_skipped", "kg_error_code": "no_chunks"}
 
 
@@ -89,7 +89,7 @@ async def test_enqueue_kg_build_returns_enqueued_and_starts_background_task():
     paper_kg_pipeline._BACKGROUND_TASKS.clear()
     try:
         with patch.object(paper_kg_pipeline.asyncio, "create_task", side_effect=fake_create_task):
-            result = await paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
+            result = paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
 
         assert result["kg_status"] == "kg_enqueued"
         assert result["kg_chunk_count"] == 1
@@ -122,7 +122,7 @@ async def test_background_task_set_self_cleans_after_completion():
     paper_kg_pipeline._BACKGROUND_TASKS.clear()
     try:
         with patch.object(paper_kg_pipeline, "_run_kg_build_background", side_effect=_noop_background):
-            result = await paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
+            result = paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
         assert result["kg_status"] == "kg_enqueued"
 
         # 让 event loop 调度 task 完成 + 触发 done_callback
@@ -150,7 +150,7 @@ async def test_enqueue_kg_build_fail_open_when_create_task_raises():
         pass
 
     with patch.object(paper_kg_pipeline.asyncio, "create_task", side_effect=_BoomError("boom")):
-        result = await paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
+        result = paper_kg_pipeline.enqueue_kg_build(uuid4(), records=[rec])
 
     assert result["kg_status"] == "kg_skipped"
     assert result["kg_error_code"] == "_BoomError"
@@ -194,7 +194,7 @@ async def test_ingest_paper_success_returns_kg_status(monkeypatch):
     fake_service.ensure_corpus = AsyncMock(return_value=MagicMock(id=fake_corpus_id))
     fake_service.ingest_url = AsyncMock(return_value=[fake_record_1, fake_record_2])
 
-    async def fake_enqueue(corpus_id, records):
+    def fake_enqueue(corpus_id, records):
         return {"kg_status": "kg_enqueued", "kg_chunk_count": len(records)}
 
     class _Ctx:
@@ -489,3 +489,24 @@ async def test_global_skill_missing_tools_does_not_block_agent_startup():
     out = build_progressive_disclosure_prompt("You are Faculty.", resolved, agent_tools=[])
     assert "<available_skills>" in out
     assert "global-needs-tools" in out
+
+
+@pytest.mark.asyncio
+async def test_append_global_skills_block_reuses_composed_prompt(monkeypatch):
+    """fallback 路径：同一 (指令, 技能块) 逐轮返回同一字符串对象；技能失效后重新拼接。"""
+    from negentropy.agents import skills_injector
+
+    async def _fake_block() -> str:
+        return "<available_skills>\n</available_skills>"
+
+    monkeypatch.setattr(skills_injector, "_get_global_skills_block_cached", _fake_block)
+    skills_injector.invalidate_global_skills_cache()
+
+    first = await skills_injector.append_global_skills_block("You are Faculty.\n")
+    assert first == "You are Faculty.\n\n<available_skills>\n</available_skills>"
+    assert await skills_injector.append_global_skills_block("You are Faculty.\n") is first
+    # base 已含技能块时原样返回（仅去尾部空白）
+    assert await skills_injector.append_global_skills_block(first + "\n") == first
+
+    skills_injector.invalidate_global_skills_cache()
+    assert await skills_injector.append_global_skills_block("You are Faculty.\n") is not first
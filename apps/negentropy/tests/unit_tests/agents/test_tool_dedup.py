@@ -0,0 +1,96 @@
+"""
+工具调用去重单元测试
+
+测试范围：before/after tool callback 的缓存命中、invocation 隔离与失效
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from negentropy.agents import _tool_dedup
+from negentropy.agents._tool_dedup import dedup_after_tool, dedup_before_tool
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    _tool_dedup._invocation_caches.clear()
+    yield
+    _tool_dedup._invocation_caches.clear()
+
+
+def _tool(name: str):
+    return SimpleNamespace(name=name)
+
+
+def _ctx(invocation_id: str = "inv-1"):
+    return SimpleNamespace(invocation_id=invocation_id)
+
+
+_OK = {"status": "success", "results": ["a"]}
+
+
+class TestToolDedup:
+    def test_repeated_call_in_same_invocation_hits_cache(self):
+        tool = _tool("search_knowledge_base")
+        assert dedup_before_tool(tool, {"query": "q", "top_k": 5}, _ctx()) is None
+        assert dedup_after_tool(tool, {"query": "q", "top_k": 5}, _ctx(), _OK) is None
+
+        # 参数顺序不影响命中
+        assert dedup_before_tool(tool, {"top_k": 5, "query": "q"}, _ctx()) == _OK
+        assert dedup_before_tool(tool, {"query": "other", "top_k": 5}, _ctx()) is None
+
+    def test_cache_is_scoped_to_invocation(self):
+        tool = _tool("search_web")
+        dedup_after_tool(tool, {"query": "q"}, _ctx("inv-1"), _OK)
+
+        assert dedup_before_tool(tool, {"query": "q"}, _ctx("inv-2")) is None
+
+    def test_failed_response_is_not_cached(self):
+        tool = _tool("search_papers")
+        dedup_after_tool(tool, {"query": "q"}, _ctx(), {"status": "failed", "error": "timeout"})
+
+        assert dedup_before_tool(tool, {"query": "q"}, _ctx()) is None
+
+    @pytest.mark.parametrize("status", ["success", "failed"])
+    def test_side_effect_tool_invalidates_reads(self, status):
+        read = _tool("read_file")
+        dedup_after_tool(read, {"path": "a.py"}, _ctx(), _OK)
+
+        dedup_after_tool(_tool("write_file"), {"path": "a.py", "content": "x"}, _ctx(), {"status": status})
+
+        assert dedup_before_tool(read, {"path": "a.py"}, _ctx()) is None
+
+    def test_cached_response_is_isolated_from_callers(self):
+        tool = _tool("search_web")
+        response = dict(_OK)
+        dedup_after_tool(tool, {"query": "q"}, _ctx(), response)
+        response["status"] = "mutated"
+
+        hit = dedup_before_tool(tool, {"query": "q"}, _ctx())
+        assert hit == _OK
+        hit["status"] = "mutated"
+        assert dedup_before_tool(tool, {"query": "q"}, _ctx()) == _OK
+
+    @pytest.mark.parametrize("writer", ["save_to_memory", "update_knowledge_graph", "ingest_to_corpus", "ingest_paper"])
+    def test_knowledge_writes_invalidate_searches(self, writer):
+        search = _tool("search_knowledge_base")
+        dedup_after_tool(search, {"query": "q"}, _ctx(), _OK)
+
+        dedup_after_tool(_tool(writer), {}, _ctx(), {"status": "success"})
+
+        assert dedup_before_tool(search, {"query": "q"}, _ctx()) is None
+
+    def test_non_dedup_tool_is_never_cached(self):
+        tool = _tool("execute_code")
+        dedup_after_tool(tool, {"code": "print(1)"}, _ctx(), _OK)
+
+        assert dedup_before_tool(tool, {"code": "print(1)"}, _ctx()) is None
+
+    def test_invocation_count_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(_tool_dedup, "_MAX_INVOCATIONS", 2)
+        tool = _tool("search_web")
+        for i in range(3):
+            dedup_after_tool(tool, {"query": "q"}, _ctx(f"inv-{i}"), _OK)
+
+        assert list(_tool_dedup._invocation_caches) == ["inv-1", "inv-2"]
@@ -0,0 +1,62 @@
+"""行动系部文件工具单测 — 工作区根缓存、越界拒绝与读写。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from negentropy.agents.tools import action
+
+
+@pytest.fixture(autouse=True)
+def _clear_root_cache():
+    action._resolve_workspace_root.cache_clear()
+    yield
+    action._resolve_workspace_root.cache_clear()
+
+
+def test_workspace_root_is_resolved_once(monkeypatch):
+    calls = 0
+    real_exists = Path.exists
+
+    def _counting_exists(self, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return real_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", _counting_exists)
+    root = action._resolve_workspace_root()
+    first_calls = calls
+
+    assert action._resolve_workspace_root() is root
+    assert action._resolve_safe_path("README.md") == root / "README.md"
+    assert calls == first_calls
+
+
+def test_path_outside_workspace_is_rejected():
+    with pytest.raises(ValueError, match="Unsafe path"):
+        action._resolve_safe_path("../../../../../../../../etc/passwd")
+
+
+def test_read_file_reads_at_most_cap_plus_one_byte(tmp_path, monkeypatch):
+    monkeypatch.setattr(action, "_resolve_workspace_root", lambda: tmp_path)
+    monkeypatch.setattr(action, "_MAX_READ_BYTES", 8)
+    (tmp_path / "small.txt").write_bytes(b"12345678")
+    (tmp_path / "large.txt").write_bytes(b"x" * 1024)
+
+    small = action.read_file("small.txt", tool_context=None)
+    large = action.read_file("large.txt", tool_context=None)
+
+    assert (small["content"], small["truncated"], small["bytes"]) == ("12345678", False, 8)
+    assert (large["content"], large["truncated"], large["bytes"]) == ("x" * 8, True, 8)
+
+
+def test_write_file_reports_utf8_byte_length(tmp_path, monkeypatch):
+    monkeypatch.setattr(action, "_resolve_workspace_root", lambda: tmp_path)
+
+    result = action.write_file("out/notes.md", "熵减\n", tool_context=None)
+
+    assert result["status"] == "success"
+    assert result["bytes"] == len("熵减\n".encode())
+    assert (tmp_path / "out" / "notes.md").read_text(encoding="utf-8") == "熵减\n"
@@ -0,0 +1,109 @@
+"""Contemplation 工具启发式规则单元测试
+
+覆盖：
+  - 步骤 -> 系部映射（关键词命中顺序 + 位置回退）
+  - 目标 -> 流水线推荐
+  - 目标复杂度评估
+  - 结构评分与模糊表述计数
+  - 熵减机会识别
+"""
+
+from __future__ import annotations
+
+from negentropy.agents.tools.contemplation import (
+    ACTION_FACULTY,
+    CONTEMPLATION_FACULTY,
+    INTERNALIZATION_FACULTY,
+    PERCEPTION_FACULTY,
+    _assess_goal_complexity,
+    _assess_structure,
+    _count_ambiguities,
+    _identify_reduction_opportunities,
+    _map_steps_to_faculties,
+    _suggest_pipeline,
+)
+
+
+def test_map_steps_uses_first_matching_faculty():
+    # "分析" 与 "实现" 同时出现时按规则顺序归入沉思
+    mapping = _map_steps_to_faculties(["收集资料", "分析并实现", "执行部署"])
+    assert mapping == {
+        "收集资料": PERCEPTION_FACULTY,
+        "分析并实现": CONTEMPLATION_FACULTY,
+        "执行部署": ACTION_FACULTY,
+    }
+
+
+def test_map_steps_falls_back_to_position():
+    mapping = _map_steps_to_faculties(["第一步", "第二步", "第三步"])
+    assert mapping == {
+        "第一步": PERCEPTION_FACULTY,
+        "第二步": CONTEMPLATION_FACULTY,
+        "第三步": INTERNALIZATION_FACULTY,
+    }
+
+
+def test_suggest_pipeline():
+    assert _suggest_pipeline("学习 RAG 原理", []) == "KnowledgeAcquisitionPipeline"
+    assert _suggest_pipeline("修复登录问题", []) == "ProblemSolvingPipeline"
+    assert _suggest_pipeline("撰写周报", []) == "ValueDeliveryPipeline"
+    assert _suggest_pipeline("随便聊聊", []) is None
+
+
+def test_assess_goal_complexity():
+    assert _assess_goal_complexity("设计", []) == "moderate"
+    assert _assess_goal_complexity("设计", ["a", "b", "c"]) == "complex"
+    assert _assess_goal_complexity("查询", []) == "simple"
+    assert _assess_goal_complexity("随便聊聊", []) == "moderate"
+
+
+def test_goal_helpers_use_precomputed_lowercase_goal():
+    # 传入 goal_lower 时以其为准，不再对原始目标重复小写化
+    assert _assess_goal_complexity("Query Weather", [], goal_lower="查询") == "simple"
+    assert _suggest_pipeline("Fix Login", [], goal_lower="修复登录问题") == "ProblemSolvingPipeline"
+
+
+def test_structure_score_and_ambiguity_count():
+    assert _assess_structure("# 标题\n- 列表\n正文\n1. 条目") == 0.75
+    assert _assess_structure("") == 0.0
+    assert _count_ambiguities("Maybe it works, possibly not; maybe later") == 3
+
+
+def test_create_plan_steps_follow_complexity_table():
+    from negentropy.agents.tools.contemplation import create_plan
+
+    simple = create_plan("查询 天气", None, tool_context=None)
+    assert simple["complexity"] == "simple"
+    assert simple["steps"] == ["执行核心动作", "验证结果"]
+
+    # 返回副本：修改结果不影响后续调用
+    simple["steps"].append("额外步骤")
+    assert create_plan("查询 天气", None, tool_context=None)["steps"] == ["执行核心动作", "验证结果"]
+
+    complex_plan = create_plan("设计 系统", ["a", "b", "c"], tool_context=None)
+    assert len(complex_plan["steps"]) == 6
+    assert complex_plan["faculty_mapping"]["深度上下文分析"] == CONTEMPLATION_FACULTY
+
+
+def test_create_plan_faculty_mapping_matches_step_heuristics():
+    from negentropy.agents.tools.contemplation import create_plan
+
+    for goal, constraints in (("查询 天气", None), ("整理 笔记", None), ("设计 系统", ["a", "b", "c"])):
+        plan = create_plan(goal, constraints, tool_context=None)
+        assert plan["faculty_mapping"] == _map_steps_to_faculties(plan["steps"])
+
+    # 返回副本：修改结果不影响后续调用
+    plan["faculty_mapping"].clear()
+    assert create_plan("设计 系统", ["a", "b", "c"], tool_context=None)["faculty_mapping"]
+
+
+def test_reduction_opportunities_list_first_five_repeated_concepts():
+    text = "alpha beta gamma. " * 2 + "delta epsilon zeta. " * 2 + "CamelCase PascalCase HashMap"
+    opportunities = _identify_reduction_opportunities(text)
+    assert opportunities == [
+        "合并重复概念：alpha, beta, gamma, delta, epsilon",
+        "添加标题层次结构",
+        "使用列表项组织内容",
+        "为技术术语添加明确定义",
+    ]
+    assert _identify_reduction_opportunities("# 标题\n- 列表项") == []
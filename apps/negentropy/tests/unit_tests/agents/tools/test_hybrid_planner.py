@@ -11,6 +11,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -89,6 +91,10 @@ class TestIntentClassification:
         p = HybridPlanner(classifier=_stub_classifier("fact"))
         assert p._classify_intent("整体趋势如何") == "global_summary"
 
+    def test_global_summary_keyword_is_case_insensitive(self) -> None:
+        p = HybridPlanner(classifier=_stub_classifier("fact"))
+        assert p._classify_intent("What are the Key Themes here?") == "global_summary"
+
 
 # =============================================================================
 # RRF 融合数学
@@ -159,6 +165,41 @@ class TestPermissionFilter:
         assert isinstance(result, PlannerResult)
 
 
+# =============================================================================
+# Stage 2: Seed 扇出并发上限
+# =============================================================================
+
+
+class TestSeedRetrievalConcurrency:
+    @pytest.mark.asyncio
+    async def test_fan_out_bounded_by_max_inflight(self) -> None:
+        inflight = 0
+        peak = 0
+
+        class _FakeKB:
+            async def search(self, *, corpus_id, app_name, query, config):
+                nonlocal inflight, peak
+                inflight += 1
+                peak = max(peak, inflight)
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                inflight -= 1
+                return [SimpleNamespace(id=f"{corpus_id}-1", content="body")]
+
+        corpus_ids = [str(uuid4()) for _ in range(5)]
+        p = HybridPlanner(classifier=_stub_classifier("fact"), knowledge_service=_FakeKB())
+        seeds = await p._seed_retrieval(
+            query="q",
+            effective_corpus_ids=corpus_ids,
+            config=PlannerConfig(seed_max_inflight=2),
+            app_name="testapp",
+        )
+
+        assert peak == 2
+        assert list(seeds) == corpus_ids
+        assert all(len(cands) == 1 for cands in seeds.values())
+
+
 # =============================================================================
 # Stage 4: Fusion + Rerank pool cap 截断
 # =============================================================================
@@ -284,3 +325,25 @@ class TestQueryIntentValues:
         valid: set[QueryIntent] = {"fact", "explore", "relation", "multi_hop", "global_summary"}
         assert "fact" in valid
         assert "global_summary" in valid
+
+
+class TestResultDataclassLayout:
+    def test_candidate_uses_slots(self) -> None:
+        cand = Candidate(chunk_id="c1", corpus_id="k1", corpus_name="K", content="x")
+        assert not hasattr(cand, "__dict__")
+        cand.fusion_score = 0.5
+        assert cand.fusion_score == 0.5
+
+    def test_evidence_chain_is_immutable(self) -> None:
+        import dataclasses
+
+        chain = EvidenceChain(
+            source_chunk_id="c1",
+            source_corpus_id="k1",
+            target_chunk_id="c2",
+            target_corpus_id="k2",
+            via_canonical_id="e1",
+            via_canonical_name="Entity",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            chain.hop_count = 2  # type: ignore[misc]
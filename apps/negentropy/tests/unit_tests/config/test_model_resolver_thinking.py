@@ -57,3 +57,13 @@ def test_build_llm_kwargs_supports_gpt5_config_thinking_mode():
         {"thinking_mode": True, "reasoning_effort": "medium"},
     )
     assert kwargs["reasoning_effort"] == "medium"
+
+
+def test_build_llm_kwargs_marks_system_prompt_cacheable_for_claude():
+    from negentropy.config.model_resolver import _build_llm_kwargs
+
+    kwargs = _build_llm_kwargs("anthropic", "claude-sonnet-4-5", {})
+    assert kwargs["cache_control_injection_points"] == [{"location": "message", "role": "system"}]
+
+    kwargs = _build_llm_kwargs("openai", "gpt-5-mini", {})
+    assert "cache_control_injection_points" not in kwargs
@@ -6,6 +6,7 @@ from negentropy.config.task_registry import (
     is_valid_task_key,
     list_corpus_tasks,
     list_global_tasks,
+    list_task_dicts,
     to_dict,
 )
 
@@ -57,3 +58,8 @@ def test_to_dict_shape():
     d = to_dict(slot)
     assert set(d.keys()) >= {"task_key", "model_type", "scope", "label", "category", "description"}
     assert d["task_key"] == "session.title"
+
+
+def test_list_task_dicts_matches_to_dict():
+    assert list_task_dicts() == tuple(to_dict(slot) for slot in ALL_TASKS)
+    assert list_task_dicts() is list_task_dicts()
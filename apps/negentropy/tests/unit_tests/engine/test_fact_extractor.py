@@ -175,3 +175,19 @@ class TestGeneralBehavior:
         facts = extractor.extract(turns)
         for f in facts:
             assert 0.0 < f.confidence <= 1.0
+
+    def test_logged_type_counts_match_facts(self, extractor, monkeypatch):
+        from negentropy.engine.consolidation import fact_extractor
+
+        logged: dict = {}
+        monkeypatch.setattr(fact_extractor.logger, "debug", lambda event, **kw: logged.update(kw))
+        turns = [
+            {"author": "user", "text": "我喜欢 Python"},
+            {"author": "user", "text": "请记住要写测试"},
+        ]
+        facts = extractor.extract(turns)
+
+        assert logged["facts_count"] == len(facts)
+        assert set(logged["types"]) == {"preference", "profile", "rule", "custom"}
+        for fact_type, count in logged["types"].items():
+            assert count == sum(1 for f in facts if f.fact_type == fact_type)
@@ -256,3 +256,14 @@ class TestBackwardsCompat:
         assert flags.get("email", 0) >= 1
         assert flags.get("phone", 0) >= 1
         assert _luhn_check("4242424242424242") is True
+
+
+class TestPresidioEntityMapping:
+    """Presidio 实体类型映射（纯查表，无需 Presidio 库）。"""
+
+    def test_known_and_unknown_entity_types(self):
+        from negentropy.engine.governance.pii.presidio_detector import PresidioPIIDetector
+
+        assert PresidioPIIDetector._map_entity("EMAIL_ADDRESS") == "email"
+        assert PresidioPIIDetector._map_entity("CN_MOBILE") == "phone"
+        assert PresidioPIIDetector._map_entity("US_SSN") == "us_ssn"
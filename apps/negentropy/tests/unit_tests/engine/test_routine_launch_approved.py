@@ -0,0 +1,81 @@
+"""Routine 审批后启动（``_launch_approved``）单测 — 复用已落库 prompt，按需检索记忆。
+
+mock DB 会话与编排器协作方法边界，不连数据库。
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from negentropy.engine.routine.orchestrator import RoutineOrchestrator
+
+
+def _db_with(iteration, routine) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [iteration]
+    db.execute = AsyncMock(return_value=result)
+    db.get = AsyncMock(return_value=routine)
+    db.commit = AsyncMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=db)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return session_cm
+
+
+def _orchestrator() -> RoutineOrchestrator:
+    orch = RoutineOrchestrator.__new__(RoutineOrchestrator)  # 跳过 __init__
+    orch._ensure_workspace = AsyncMock(return_value=True)
+    orch._build_config = AsyncMock(return_value=SimpleNamespace(name="cfg"))
+    orch._resolve_mcp_meta = AsyncMock(return_value=[{"name": "fs"}])
+    orch._retrieve_memory_context = AsyncMock(return_value="- memory")
+    return orch
+
+
+def _runner() -> MagicMock:
+    runner = MagicMock()
+    runner.available_slots.return_value = 1
+    runner.is_running.return_value = False
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_stored_prompt_is_reused_without_memory_lookup():
+    routine = SimpleNamespace(id=uuid4(), cwd="/repo")
+    iteration = SimpleNamespace(id=uuid4(), routine_id=routine.id, prompt="stored prompt", metrics=None)
+    orch, runner = _orchestrator(), _runner()
+
+    with patch(
+        "negentropy.engine.routine.orchestrator.db_session.AsyncSessionLocal", return_value=_db_with(iteration, routine)
+    ):
+        assert await orch._launch_approved(runner) == 1
+
+    orch._retrieve_memory_context.assert_not_awaited()
+    assert iteration.metrics == {"mcp_servers": [{"name": "fs"}]}
+    kwargs = runner.launch.call_args.kwargs
+    assert kwargs["prompt"] == "stored prompt"
+    assert kwargs["config"].name == "cfg"
+
+
+@pytest.mark.asyncio
+async def test_missing_prompt_is_rebuilt_with_memory_context():
+    routine = SimpleNamespace(id=uuid4(), cwd=None)
+    iteration = SimpleNamespace(id=uuid4(), routine_id=routine.id, prompt=None, metrics=None)
+    orch, runner = _orchestrator(), _runner()
+
+    with (
+        patch(
+            "negentropy.engine.routine.orchestrator.db_session.AsyncSessionLocal",
+            return_value=_db_with(iteration, routine),
+        ),
+        patch("negentropy.engine.routine.orchestrator.build_prompt", return_value="rebuilt") as build,
+    ):
+        assert await orch._launch_approved(runner) == 1
+
+    orch._retrieve_memory_context.assert_awaited_once_with(routine)
+    assert build.call_args.kwargs["memory_context"] == "- memory"
+    assert runner.launch.call_args.kwargs["prompt"] == "rebuilt"
@@ -527,3 +527,48 @@ class TestConsolidationHandler:
         assert result.status == "ok"
         assert isinstance(captured_params["lookback"], timedelta)
         assert captured_params["lookback"] == timedelta(hours=1)
+
+
+class TestCacheWarmHandler:
+    @pytest.fixture
+    def resolver_spy(self, monkeypatch):
+        calls: list[str] = []
+
+        async def _llm():
+            calls.append("llm")
+            return "openai/gpt-5-mini", {}
+
+        async def _embedding():
+            calls.append("embedding")
+            return "openai/text-embedding-3-small", {}
+
+        async def _subagent(agent_name):
+            calls.append(agent_name)
+            return None
+
+        monkeypatch.setattr("negentropy.config.model_resolver.resolve_llm_config", _llm)
+        monkeypatch.setattr("negentropy.config.model_resolver.resolve_embedding_config", _embedding)
+        monkeypatch.setattr("negentropy.config.model_resolver.resolve_subagent_model_name", _subagent)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_warms_model_configs_and_agent_rows(self, resolver_spy):
+        from negentropy.engine.schedulers.handlers.cache_warm import _WARM_AGENT_NAMES
+
+        result = await get_handler("cache_warm")(_make_task("cache_warm"))
+
+        assert result.status == "ok"
+        assert sorted(resolver_spy) == sorted(["llm", "embedding", *_WARM_AGENT_NAMES])
+        assert "NegentropyEngine" in _WARM_AGENT_NAMES
+
+    @pytest.mark.asyncio
+    async def test_failure_is_fail_soft(self, resolver_spy, monkeypatch):
+        async def _boom(agent_name):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr("negentropy.config.model_resolver.resolve_subagent_model_name", _boom)
+
+        result = await get_handler("cache_warm")(_make_task("cache_warm"))
+
+        assert result.status == "failed"
+        assert "db down" in result.error
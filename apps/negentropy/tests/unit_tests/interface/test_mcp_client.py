@@ -6,7 +6,13 @@ from contextlib import asynccontextmanager
 import anyio
 import pytest
 
-from negentropy.interface.mcp_client import McpClientService, logged_stdio_client
+from negentropy.interface.mcp_client import (
+    McpClientService,
+    McpResourceContent,
+    McpToolCallResult,
+    McpToolInfo,
+    logged_stdio_client,
+)
 from negentropy.logging.io import ExternalProcessLogStream
 
 
@@ -334,3 +340,13 @@ async def test_logged_stdio_client_pipes_stderr_and_forwards_logs(monkeypatch: p
             {"source": "mcp.zai-mcp-server", "timestamp": "2026-03-07T06:29:09.030Z"},
         )
     ]
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [McpToolInfo(name="demo"), McpToolCallResult(success=True), McpResourceContent(uri="perceives://x")],
+)
+def test_per_call_result_types_are_slotted(instance) -> None:
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unexpected = 1
@@ -0,0 +1,49 @@
+"""/routines/stream SSE 帧格式单测 — 进程内 RoutineBus，无 DB。"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from negentropy.engine.routine.bus import RoutineBus
+
+
+async def _collect_frames(events: list[dict], **params) -> list[bytes]:
+    from negentropy.interface.routine_api import routine_stream
+
+    bus = RoutineBus()
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    with patch("negentropy.engine.routine.bus.get_bus", return_value=bus):
+        response = await routine_stream(request, **params)
+        frames: list[bytes] = []
+        async for frame in response.body_iterator:
+            frames.append(frame)
+            if frame == b": connected\n\n":
+                for event in [*events, {"__shutdown__": True}]:
+                    await bus.publish(event)
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_stream_frames_events_as_utf8_json():
+    event = {"type": "iteration", "id": "it-1", "routine_id": "r-1", "summary": "修复登录", "metrics": {1: 0.5}}
+
+    frames = await _collect_frames([event], routine_id=None)
+
+    assert frames[0] == b": connected\n\n"
+    assert frames[-1] == b": shutdown\n\n"
+    head, data = frames[1].removesuffix(b"\n\n").split(b"\n")
+    assert head == b"event: iteration"
+    assert data.startswith(b"data: ")
+    assert "修复登录".encode() in data
+    assert json.loads(data.removeprefix(b"data: ")) == {**event, "metrics": {"1": 0.5}}
+
+
+@pytest.mark.asyncio
+async def test_stream_defaults_event_type_to_routine():
+    frames = await _collect_frames([{"id": "r-1", "status": "running"}], routine_id=None)
+
+    assert frames[1].startswith(b"event: routine\ndata: ")
@@ -17,6 +17,7 @@ import pytest
 from negentropy.knowledge.graph.extractors import (
     LLMEntityExtractor,
     LLMRelationExtractor,
+    is_noise_entity,
 )
 from negentropy.knowledge.types import GraphNode
 
@@ -119,6 +120,23 @@ class TestParseEntityResponse:
         assert "main.py" not in names
 
 
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Published Jan 5, 2024", True),
+        ("september 12 2023", True),
+        ("LevelEditor.tsx:892", True),
+        ("config.YAML", True),
+        ("Node.js", False),
+        ("Transformer", False),
+        ("GPT-4 Turbo", False),
+        ("Python 3.12", False),
+    ],
+)
+def test_is_noise_entity_patterns(name, expected):
+    assert is_noise_entity(name) is expected
+
+
 # ============================================================================
 # LLMRelationExtractor._parse_relation_response
 # ============================================================================
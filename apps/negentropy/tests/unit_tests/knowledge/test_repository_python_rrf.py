@@ -0,0 +1,35 @@
+"""Python 端 RRF 回退（``_python_fallback_rrf_search``）单元测试。
+
+mock 语义 / 关键词两路检索，不连数据库。
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from negentropy.knowledge.retrieval.repository import KnowledgeRepository
+from negentropy.knowledge.types import KnowledgeMatch
+
+
+def _match(match_id, content: str) -> KnowledgeMatch:
+    return KnowledgeMatch(id=match_id, content=content, source_uri=None, metadata={})
+
+
+@pytest.mark.asyncio
+async def test_fuses_ranks_and_prefers_semantic_details():
+    shared, sem_only, kw_only = uuid4(), uuid4(), uuid4()
+    repo = KnowledgeRepository(session_factory=object())
+    repo.semantic_search = AsyncMock(return_value=[_match(shared, "semantic"), _match(sem_only, "sem-only")])
+    repo.keyword_search = AsyncMock(return_value=[_match(kw_only, "kw-only"), _match(shared, "keyword")])
+
+    results = await repo._python_fallback_rrf_search(
+        corpus_id=uuid4(), app_name="app", query="q", query_embedding=[0.0], limit=2, k=60
+    )
+
+    assert [r.id for r in results] == [shared, kw_only]
+    assert results[0].content == "semantic"
+    assert results[0].combined_score == pytest.approx(1 / 61 + 1 / 62)
+    assert results[1].combined_score == pytest.approx(1 / 61)
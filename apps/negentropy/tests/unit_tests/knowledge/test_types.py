@@ -19,6 +19,8 @@ from negentropy.knowledge.types import (
     CorpusRecord,
     CorpusSpec,
     GraphBuildConfig,
+    GraphEdge,
+    GraphNode,
     GraphQueryConfig,
     KnowledgeChunk,
     KnowledgeMatch,
@@ -260,6 +262,12 @@ class TestImmutability:
         # frozen Pydantic model 应可哈希
         assert hash(config1) == hash(config2)
 
+    @pytest.mark.parametrize("cls", [KnowledgeChunk, KnowledgeMatch, GraphNode, GraphEdge])
+    def test_per_item_dataclasses_use_slots(self, cls) -> None:
+        """逐条大量构造的数据类不携带实例 __dict__"""
+        assert "__slots__" in cls.__dict__
+        assert not hasattr(cls.__new__(cls), "__dict__")
+
 
 class TestGraphBuildConfig:
     """GraphBuildConfig 配置测试"""
@@ -1,5 +1,6 @@
 import io
 import logging
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -173,3 +174,19 @@ def test_external_process_log_stream_buffers_and_falls_back_for_plain_lines() ->
 def test_derive_external_process_source_prefers_first_non_flag_arg() -> None:
     assert derive_external_process_source("npx", ["-y", "@zilliz/zai-mcp-server"]) == "mcp.zai-mcp-server"
     assert derive_external_process_source("uvx", ["mcp-server-fetch"]) == "mcp.mcp-server-fetch"
+
+
+def test_add_timestamp_only_computed_when_missing(monkeypatch) -> None:
+    calls: list[object] = []
+
+    class _DateTime:
+        @staticmethod
+        def now(tz):
+            calls.append(tz)
+            return datetime(2026, 3, 7, 8, 0, 0, 123456, tzinfo=tz)
+
+    monkeypatch.setattr(core, "datetime", _DateTime)
+
+    assert core.add_timestamp(None, "info", {})["timestamp"] == "2026-03-07T08:00:00.123456+00:00"
+    assert core.add_timestamp(None, "info", {"timestamp": "keep"})["timestamp"] == "keep"
+    assert len(calls) == 1